@@ -10,6 +10,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from models.meeting import Base
+import models.summary_cache  # noqa: F401 (autogenerate 대상 테이블 등록)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,84 @@
+"""Add meeting full-text search indexes
+
+Revision ID: 8c3d7f1a2b6e
+Revises: 5e8a1c2f9b34
+Create Date: 2026-10-18 14:05:47.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '8c3d7f1a2b6e'
+down_revision: Union[str, None] = '5e8a1c2f9b34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 검색용 tsvector 식 (제목 > 정리본 > 원문 순 가중치, 'simple' 설정으로 한국어 단어를 그대로 색인)
+# 원문이 아주 길어도 tsvector 크기 한도를 넘지 않도록 앞부분만 색인
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(summarized_content, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, left(coalesce(original_content, ''), 100000)), 'C')"
+)
+# meeting_search.search_text()와 같은 식이어야 ILIKE 검색에 인덱스가 쓰임
+TRGM_EXPRESSION = "(coalesce(title, '') || ' ' || coalesce(summarized_content, ''))"
+# 기존 행의 search_vector를 한 번에 채울 행 수 (배치마다 커밋해 잠금을 짧게 유지)
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # STORED 생성 컬럼은 테이블 전체를 다시 쓰며 잠그므로, NULL 허용 컬럼을 추가하고
+    # 트리거로 새로 쓰는 행을 채운 뒤 기존 행은 배치로 나눠 채움
+    op.add_column('meetings', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        "CREATE OR REPLACE FUNCTION meetings_search_vector_update() RETURNS trigger AS $$\n"
+        "BEGIN\n"
+        f"    SELECT {SEARCH_VECTOR_SQL} INTO NEW.search_vector\n"
+        "    FROM (SELECT NEW.title AS title, NEW.summarized_content AS summarized_content,\n"
+        "                 NEW.original_content AS original_content) AS changed;\n"
+        "    RETURN NEW;\n"
+        "END\n"
+        "$$ LANGUAGE plpgsql"
+    )
+    op.execute(
+        "CREATE TRIGGER meetings_search_vector_update "
+        "BEFORE INSERT OR UPDATE OF title, summarized_content, original_content ON meetings "
+        "FOR EACH ROW EXECUTE FUNCTION meetings_search_vector_update()"
+    )
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            updated = connection.execute(sa.text(
+                f"UPDATE meetings SET search_vector = {SEARCH_VECTOR_SQL} "
+                "WHERE id IN (SELECT id FROM meetings WHERE search_vector IS NULL "
+                f"ORDER BY id LIMIT {BACKFILL_BATCH_SIZE})"
+            )).rowcount
+            if not updated:
+                break
+
+        # 큰 테이블에서도 쓰기를 막지 않도록 CONCURRENTLY로 생성
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meetings_search_vector "
+            "ON meetings USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meetings_search_trgm "
+            f"ON meetings USING gin ({TRGM_EXPRESSION} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_meetings_search_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_meetings_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS meetings_search_vector_update ON meetings")
+    op.execute("DROP FUNCTION IF EXISTS meetings_search_vector_update()")
+    op.drop_column('meetings', 'search_vector')
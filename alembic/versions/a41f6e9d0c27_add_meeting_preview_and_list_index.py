@@ -0,0 +1,41 @@
+"""Add meeting preview column and list index
+
+Revision ID: a41f6e9d0c27
+Revises: 8c3d7f1a2b6e
+Create Date: 2026-10-18 16:22:09.581734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a41f6e9d0c27'
+down_revision: Union[str, None] = '8c3d7f1a2b6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# models.meeting.PREVIEW_CHARS (마이그레이션은 모델 코드가 바뀌어도 그대로여야 하므로 값을 고정)
+PREVIEW_CHARS = 200
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meetings', sa.Column('preview', sa.String(length=PREVIEW_CHARS), nullable=True))
+    # models.meeting.make_preview와 같은 규칙 (공백 정리 후 앞부분)
+    op.execute(
+        "UPDATE meetings SET preview = "
+        f"left(btrim(regexp_replace(coalesce(summarized_content, ''), '\\s+', ' ', 'g')), {PREVIEW_CHARS})"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meetings_created_at_id "
+            "ON meetings (created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_meetings_created_at_id")
+    op.drop_column('meetings', 'preview')
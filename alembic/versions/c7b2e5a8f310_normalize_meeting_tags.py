@@ -0,0 +1,81 @@
+"""Normalize meeting tags
+
+Revision ID: c7b2e5a8f310
+Revises: a41f6e9d0c27
+Create Date: 2026-10-18 18:47:33.916402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c7b2e5a8f310'
+down_revision: Union[str, None] = 'a41f6e9d0c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# models.meeting.TAG_MAX_CHARS (마이그레이션은 모델 코드가 바뀌어도 그대로여야 하므로 값을 고정)
+TAG_MAX_CHARS = 50
+
+# meeting_tags.normalize_tag와 같은 규칙 (공백/'#' 제거, 소문자)
+NORMALIZED_TAG_SQL = f"left(lower(btrim(ltrim(btrim(raw.tag), '#'))), {TAG_MAX_CHARS})"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=TAG_MAX_CHARS), nullable=False),
+    sa.Column('usage_count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('meeting_tags',
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('meeting_id', 'tag_id')
+    )
+    op.create_index('ix_meeting_tags_tag_id_meeting_id', 'meeting_tags', ['tag_id', 'meeting_id'], unique=False)
+    op.create_index('ix_tags_usage_count_name', 'tags', [sa.text('usage_count DESC'), 'name'], unique=False)
+
+    # 쉼표로 구분된 기존 태그 문자열을 옮김
+    op.execute(
+        "INSERT INTO tags (name) "
+        f"SELECT DISTINCT {NORMALIZED_TAG_SQL} FROM meetings "
+        "CROSS JOIN LATERAL unnest(string_to_array(meetings.tags, ',')) AS raw(tag) "
+        f"WHERE {NORMALIZED_TAG_SQL} <> '' "
+        "ON CONFLICT (name) DO NOTHING"
+    )
+    op.execute(
+        "INSERT INTO meeting_tags (meeting_id, tag_id) "
+        "SELECT DISTINCT meetings.id, tags.id FROM meetings "
+        "CROSS JOIN LATERAL unnest(string_to_array(meetings.tags, ',')) AS raw(tag) "
+        f"JOIN tags ON tags.name = {NORMALIZED_TAG_SQL} "
+        "ON CONFLICT DO NOTHING"
+    )
+    op.execute(
+        "UPDATE tags SET usage_count = counts.count FROM ("
+        "SELECT tag_id, count(*) AS count FROM meeting_tags GROUP BY tag_id"
+        ") AS counts WHERE tags.id = counts.tag_id"
+    )
+    op.drop_column('meetings', 'tags')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('meetings', sa.Column('tags', sa.VARCHAR(), autoincrement=False, nullable=True))
+    op.execute(
+        "UPDATE meetings SET tags = grouped.names FROM ("
+        "SELECT meeting_tags.meeting_id, string_agg(tags.name, ',' ORDER BY tags.name) AS names "
+        "FROM meeting_tags JOIN tags ON tags.id = meeting_tags.tag_id "
+        "GROUP BY meeting_tags.meeting_id"
+        ") AS grouped WHERE meetings.id = grouped.meeting_id"
+    )
+    op.drop_index('ix_tags_usage_count_name', table_name='tags')
+    op.drop_index('ix_meeting_tags_tag_id_meeting_id', table_name='meeting_tags')
+    op.drop_table('meeting_tags')
+    op.drop_table('tags')
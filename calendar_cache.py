@@ -0,0 +1,124 @@
+# calendar_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+# 같은 키의 동시 로드를 합치는 데 쓰는 잠금 수 (키마다 잠금을 만들지 않고 해시로 나눔)
+KEY_LOCK_STRIPES = 64
+
+
+class TTLCache:
+    """크기 제한이 있는 TTL 캐시 (stale-while-revalidate 지원).
+
+    - ttl 이내의 항목은 그대로 반환합니다 (hit).
+    - ttl은 지났지만 ttl + stale_ttl 이내인 항목은 즉시 반환하고,
+      백그라운드 스레드에서 한 번만 다시 로드합니다 (stale hit).
+    - 그보다 오래되었거나 없는 항목은 동기적으로 로드합니다 (miss).
+      같은 키에 대한 동시 로드는 하나로 합쳐집니다.
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, ttl=15, stale_ttl=120, max_entries=128):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # key -> (value, loaded_at)
+        self._lock = threading.Lock()
+        # 키가 계속 바뀌어도 늘어나지 않도록 고정된 수의 잠금을 나눠 씀
+        # (로더 안에서 같은 줄의 다른 키를 조회해도 막히지 않도록 RLock)
+        self._key_locks = [threading.RLock() for _ in range(KEY_LOCK_STRIPES)]
+        self._revalidating = set()
+        # invalidate()마다 증가. 로드 도중 무효화되었다면 그 결과는 저장하지 않음
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key, loader):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                value, age = entry
+                if age < self.ttl:
+                    self.hits += 1
+                    return value
+                if age < self.ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    self._revalidate_async(key, loader)
+                    return value
+            self.misses += 1
+            key_lock = self._key_locks[hash(key) % len(self._key_locks)]
+
+        with key_lock:
+            # 기다리는 동안 다른 스레드가 로드했다면 그 결과를 사용
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None and entry[1] < self.ttl:
+                    return entry[0]
+                generation = self._generation
+            value = loader()
+            self.set(key, value, generation=generation)
+            return value
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate=None):
+        """predicate(key)가 참인 항목(없으면 전체)을 즉시 제거합니다."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate is None or predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            self._generation += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+            }
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        value, loaded_at = entry
+        return value, time.monotonic() - loaded_at
+
+    def _revalidate_async(self, key, loader):
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        generation = self._generation
+
+        def run():
+            try:
+                self.set(key, loader(), generation=generation)
+            except Exception as e:
+                print(f"캐시 갱신 실패 ({key}): {str(e)}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,202 @@
+# calendar_conflicts.py
+
+import bisect
+import math
+from datetime import timedelta
+
+from calendar_sync import parse_event_time
+
+
+class IntervalIndex:
+    """정적 구간 트리 (시작 시간 정렬 배열 + 구간별 최대 종료 시간).
+
+    정렬된 배열을 암묵적인 균형 이진 트리로 보고 각 노드(중간 원소)에
+    하위 구간의 최대 종료 시간을 저장하여, 겹치는 구간 조회를 O(log n + k)에
+    처리합니다.
+    """
+
+    def __init__(self, intervals):
+        self._intervals = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        self._max_end = [None] * len(self._intervals)
+        self._build(0, len(self._intervals))
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def overlapping(self, start, end):
+        """[start, end)와 겹치는 (start, end, payload) 목록을 시작 시간 순으로 반환합니다."""
+        found = []
+        self._query(0, len(self._intervals), start, end, found)
+        return found
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._intervals[mid][1]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self._max_end[mid] = max_end
+        return max_end
+
+    def _query(self, lo, hi, start, end, found):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] <= start:
+            return
+        self._query(lo, mid, start, end, found)
+        interval = self._intervals[mid]
+        if interval[0] < end:
+            if interval[1] > start:
+                found.append(interval)
+            self._query(mid + 1, hi, start, end, found)
+
+
+class _MaxSegmentTree:
+    """값 배열에서 '조건 이상인 첫/마지막 원소'를 O(log n)에 찾는 최대값 세그먼트 트리."""
+
+    def __init__(self, values):
+        self._n = len(values)
+        self._size = 1
+        while self._size < max(1, self._n):
+            self._size *= 2
+        self._tree = [-math.inf] * (2 * self._size)
+        self._tree[self._size:self._size + self._n] = values
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def first_at_least(self, lo, threshold):
+        """인덱스 lo 이상에서 값이 threshold 이상인 첫 인덱스 (없으면 None)."""
+        return self._first(1, 0, self._size, lo, threshold)
+
+    def last_at_least(self, hi, threshold):
+        """인덱스 hi 이하에서 값이 threshold 이상인 마지막 인덱스 (없으면 None)."""
+        return self._last(1, 0, self._size, hi, threshold)
+
+    def _first(self, node, node_lo, node_hi, lo, threshold):
+        if node_hi <= lo or self._tree[node] < threshold:
+            return None
+        if node_hi - node_lo == 1:
+            return node_lo if node_lo < self._n else None
+        mid = (node_lo + node_hi) // 2
+        found = self._first(2 * node, node_lo, mid, lo, threshold)
+        if found is None:
+            found = self._first(2 * node + 1, mid, node_hi, lo, threshold)
+        return found
+
+    def _last(self, node, node_lo, node_hi, hi, threshold):
+        if node_lo > hi or self._tree[node] < threshold:
+            return None
+        if node_hi - node_lo == 1:
+            return node_lo
+        mid = (node_lo + node_hi) // 2
+        found = self._last(2 * node + 1, mid, node_hi, hi, threshold)
+        if found is None:
+            found = self._last(2 * node, node_lo, mid, hi, threshold)
+        return found
+
+
+class ConflictIndex:
+    """사용자 일정의 겹침 조회와 가장 가까운 빈 시간 추천을 위한 인덱스.
+
+    - overlapping(): IntervalIndex로 겹치는 일정 조회
+    - free_slots(): 병합한 바쁜 구간 사이의 빈 시간 길이를 세그먼트 트리에 넣어
+      요청 시각 전후로 충분히 긴 첫 빈 시간을 O(log n)에 찾음
+    """
+
+    def __init__(self, intervals):
+        self.intervals = IntervalIndex(intervals)
+
+        # 겹치는 구간을 병합한 바쁜 시간대
+        blocks = []
+        for start, end, _ in sorted(intervals, key=lambda interval: interval[0]):
+            if blocks and start <= blocks[-1][1]:
+                blocks[-1][1] = max(blocks[-1][1], end)
+            else:
+                blocks.append([start, end])
+        self._block_starts = [block[0] for block in blocks]
+        self._block_ends = [block[1] for block in blocks]
+
+        # gap i: 바쁜 구간 i-1의 종료 ~ 바쁜 구간 i의 시작 (양 끝은 무한)
+        gap_lengths = [math.inf]
+        for index in range(1, len(blocks)):
+            gap_lengths.append((self._block_starts[index] - self._block_ends[index - 1]).total_seconds())
+        if blocks:
+            gap_lengths.append(math.inf)
+        self._gaps = _MaxSegmentTree(gap_lengths)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def overlapping(self, start, end, exclude_id=None):
+        return [
+            payload for _, _, payload in self.intervals.overlapping(start, end)
+            if payload['id'] != exclude_id
+        ]
+
+    def free_slots(self, start, end, not_before=None):
+        """[start, end)와 같은 길이의 빈 시간 중 요청 시각 직전/직후 것을 반환합니다.
+
+        Returns:
+            list: [(slot_start, slot_end), ...] (이전 슬롯, 이후 슬롯 순, 없는 쪽은 생략)
+        """
+        duration = end - start
+        seconds = duration.total_seconds()
+        if not self._block_starts:
+            return [(start, end)]
+
+        # start가 속한(또는 start 이후 첫) 빈 시간의 인덱스
+        gap = bisect.bisect_right(self._block_starts, start)
+        inside_block = gap > 0 and start < self._block_ends[gap - 1]
+
+        slots = []
+
+        # 이전 슬롯: gap(또는 그 이전) 중 충분히 긴 마지막 빈 시간의 끝부분
+        before = self._gaps.last_at_least(gap if not inside_block else gap - 1, seconds)
+        if before is not None:
+            if before < len(self._block_starts):
+                slot_end = self._block_starts[before]
+                slot_start = slot_end - duration
+                if not_before is None or slot_start >= not_before:
+                    slots.append((slot_start, slot_end))
+
+        # 이후 슬롯: start 이후 충분히 긴 첫 빈 시간의 시작부분
+        cursor = self._block_ends[gap - 1] if inside_block else start
+        available = (
+            (self._block_starts[gap] - cursor).total_seconds()
+            if gap < len(self._block_starts) else math.inf
+        )
+        if available >= seconds:
+            slots.append((cursor, cursor + duration))
+        else:
+            after = self._gaps.first_at_least(gap + 1, seconds)
+            if after is not None:
+                slot_start = self._block_ends[after - 1]
+                slots.append((slot_start, slot_start + duration))
+
+        return slots
+
+
+def event_intervals(calendar_id, events):
+    """한 캘린더의 Google 이벤트 목록을 ConflictIndex 구간 목록으로 바꿉니다.
+
+    종일 일정과 '한가함(transparent)'으로 표시된 일정은 충돌 대상에서 제외합니다.
+    """
+    intervals = []
+    for event in events:
+        if 'dateTime' not in event.get('start', {}) or event.get('transparency') == 'transparent':
+            continue
+        start = parse_event_time(event['start'])
+        end = parse_event_time(event.get('end')) or start + timedelta(minutes=30)
+        if end <= start:
+            continue
+        intervals.append((start, end, {
+            'id': event['id'],
+            'calendar_id': calendar_id,
+            'title': event.get('summary', '제목 없음'),
+            'start': start,
+            'end': end
+        }))
+    return intervals
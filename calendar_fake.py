@@ -0,0 +1,261 @@
+# calendar_fake.py
+"""
+오프라인 개발/검증용 가짜 Google Calendar 백엔드.
+
+googleapiclient의 Calendar 서비스 객체와 같은 호출 형태
+(service.events().list(...).execute())를 제공하며, syncToken 기반 증분 동기화와
+토큰 무효화(410 Gone)를 흉내 냅니다. CALENDAR_BACKEND=fake 로 실행하면
+calendar_utils가 실제 API 대신 이 백엔드를 사용합니다.
+"""
+
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from calendar_sync import parse_event_time
+
+
+def _http_error(status, message):
+    resp = httplib2.Response({'status': status})
+    content = json.dumps({'error': {'code': status, 'message': message}}).encode('utf-8')
+    return HttpError(resp, content)
+
+
+class FakeRequest:
+    """googleapiclient HttpRequest처럼 execute()로 실행되는 요청."""
+
+    def __init__(self, func):
+        self._func = func
+        self.headers = {}
+
+    def execute(self, num_retries=0):
+        return self._func(self.headers)
+
+
+class FakeBatchRequest:
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._requests.append((request_id or str(len(self._requests)), request, callback))
+
+    def execute(self):
+        for request_id, request, callback in self._requests:
+            callback = callback or self._callback
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            if callback:
+                callback(request_id, response, exception)
+
+
+class FakeCalendarBackend:
+    """메모리 상의 캘린더/이벤트 저장소와 변경 로그를 가진 가짜 서비스."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._calendars = {}     # calendar_id -> calendarList 항목
+        self._events = {}        # calendar_id -> {event_id: event}
+        self._changes = []       # (seq, calendar_id, event_id)
+        self._seq = 0
+        self._token_floor = 0    # 이 값보다 작은 syncToken은 410으로 거부
+
+    # --- 테스트/시드 데이터용 헬퍼 ---
+
+    def add_calendar(self, calendar_id, summary, access_role='owner',
+                     background_color='#039BE5', primary=False):
+        with self._lock:
+            self._calendars[calendar_id] = {
+                'id': calendar_id,
+                'summary': summary,
+                'accessRole': access_role,
+                'backgroundColor': background_color,
+                'primary': primary,
+            }
+            self._events.setdefault(calendar_id, {})
+
+    def invalidate_sync_tokens(self):
+        """지금까지 발급된 모든 syncToken을 무효화합니다 (다음 증분 요청은 410)."""
+        with self._lock:
+            self._token_floor = self._seq + 1
+
+    # --- googleapiclient 호환 리소스 ---
+
+    def calendarList(self):
+        return _CalendarListResource(self)
+
+    def events(self):
+        return _EventsResource(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatchRequest(callback)
+
+    # --- 내부 구현 ---
+
+    def _resolve(self, calendar_id):
+        if calendar_id == 'primary':
+            for calendar in self._calendars.values():
+                if calendar.get('primary'):
+                    return calendar['id']
+        if calendar_id not in self._calendars:
+            raise _http_error(404, 'Not Found')
+        return calendar_id
+
+    def _record(self, calendar_id, event):
+        self._seq += 1
+        now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        event['etag'] = f'"{self._seq}"'
+        event['updated'] = now
+        event.setdefault('created', now)
+        self._changes.append((self._seq, calendar_id, event['id']))
+        return event
+
+    def _list(self, headers, calendarId, syncToken=None, pageToken=None, maxResults=250,
+              timeMin=None, timeMax=None, orderBy=None, showDeleted=False, **kwargs):
+        with self._lock:
+            calendar_id = self._resolve(calendarId)
+            events = self._events[calendar_id]
+
+            if syncToken:
+                if int(syncToken) < self._token_floor:
+                    raise _http_error(410, 'Sync token is no longer valid, a full sync is required.')
+                changed = []
+                for seq, changed_calendar, event_id in self._changes:
+                    if seq > int(syncToken) and changed_calendar == calendar_id and event_id not in changed:
+                        changed.append(event_id)
+                items = [dict(events[event_id]) for event_id in changed]
+            else:
+                items = [
+                    dict(event) for event in events.values()
+                    if showDeleted or event.get('status') != 'cancelled'
+                ]
+                if timeMin:
+                    time_min = datetime.fromisoformat(timeMin.replace('Z', '+00:00'))
+                    items = [e for e in items if parse_event_time(e['end']) > time_min]
+                if timeMax:
+                    time_max = datetime.fromisoformat(timeMax.replace('Z', '+00:00'))
+                    items = [e for e in items if parse_event_time(e['start']) < time_max]
+                if orderBy == 'startTime':
+                    items.sort(key=lambda e: parse_event_time(e['start']))
+
+            offset = int(pageToken or 0)
+            page = items[offset:offset + maxResults]
+            result = {'kind': 'calendar#events', 'items': page}
+            if offset + maxResults < len(items):
+                result['nextPageToken'] = str(offset + maxResults)
+            elif not (timeMax or orderBy):
+                # timeMin만 지정한 전체 동기화도 Google처럼 syncToken을 발급
+                result['nextSyncToken'] = str(self._seq)
+            return result
+
+    def _get(self, headers, calendarId, eventId, **kwargs):
+        with self._lock:
+            calendar_id = self._resolve(calendarId)
+            event = self._events[calendar_id].get(eventId)
+            if event is None or event.get('status') == 'cancelled':
+                raise _http_error(404, 'Not Found')
+            if headers.get('If-None-Match') == event['etag']:
+                raise _http_error(304, 'Not Modified')
+            return dict(event)
+
+    def _check_if_match(self, headers, event):
+        if_match = headers.get('If-Match')
+        if if_match and if_match != event['etag']:
+            raise _http_error(412, 'Precondition Failed')
+
+    def _insert(self, headers, calendarId, body, **kwargs):
+        with self._lock:
+            calendar_id = self._resolve(calendarId)
+            event = dict(body)
+            event['id'] = uuid.uuid4().hex
+            event['status'] = 'confirmed'
+            event['htmlLink'] = f'https://calendar.example/event?eid={event["id"]}'
+            self._events[calendar_id][event['id']] = self._record(calendar_id, event)
+            return dict(event)
+
+    def _update(self, headers, calendarId, eventId, body, **kwargs):
+        with self._lock:
+            current = self._get({}, calendarId, eventId)
+            self._check_if_match(headers, current)
+            calendar_id = self._resolve(calendarId)
+            event = dict(body)
+            event['id'] = eventId
+            event['status'] = 'confirmed'
+            event['htmlLink'] = current.get('htmlLink')
+            event['created'] = current.get('created')
+            self._events[calendar_id][eventId] = self._record(calendar_id, event)
+            return dict(event)
+
+    def _patch(self, headers, calendarId, eventId, body, **kwargs):
+        with self._lock:
+            current = self._get({}, calendarId, eventId)
+            self._check_if_match(headers, current)
+            calendar_id = self._resolve(calendarId)
+            event = dict(current)
+            event.update(body)
+            self._events[calendar_id][eventId] = self._record(calendar_id, event)
+            return dict(event)
+
+    def _delete(self, headers, calendarId, eventId, **kwargs):
+        with self._lock:
+            current = self._get({}, calendarId, eventId)
+            self._check_if_match(headers, current)
+            calendar_id = self._resolve(calendarId)
+            # 증분 동기화에 전달되도록 삭제된 이벤트는 취소 상태로 남김
+            tombstone = {'id': eventId, 'status': 'cancelled'}
+            self._events[calendar_id][eventId] = self._record(calendar_id, tombstone)
+            return ''
+
+
+class _CalendarListResource:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def list(self, **kwargs):
+        def run(headers):
+            with self._backend._lock:
+                return {'items': [dict(c) for c in self._backend._calendars.values()]}
+        return FakeRequest(run)
+
+
+class _EventsResource:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def list(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._list(headers, **kwargs))
+
+    def get(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._get(headers, **kwargs))
+
+    def insert(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._insert(headers, **kwargs))
+
+    def update(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._update(headers, **kwargs))
+
+    def patch(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._patch(headers, **kwargs))
+
+    def delete(self, **kwargs):
+        return FakeRequest(lambda headers: self._backend._delete(headers, **kwargs))
+
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+
+def get_fake_backend():
+    """프로세스 전역 가짜 백엔드를 반환합니다. 기본 캘린더 하나로 시작합니다."""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = FakeCalendarBackend()
+            _default_backend.add_calendar('me@example.com', '기본 캘린더', primary=True)
+        return _default_backend
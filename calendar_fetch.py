@@ -0,0 +1,103 @@
+# calendar_fetch.py
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+# Google 배치 HTTP 요청 하나에 담을 수 있는 최대 요청 수 (Calendar API 제한)
+BATCH_LIMIT = 50
+
+# execute_parallel이 함께 쓰는 프로세스 전역 스레드 풀 (처음 호출할 때 max_workers 크기로 생성)
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='calendar-fetch')
+        return _executor
+
+
+def _reset_executor_after_fork():
+    # fork된 워커에는 부모의 작업 스레드가 없으므로 새로 만들도록 비움
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor_after_fork)
+
+
+def execute_batched(service, builders: Dict[str, Callable]) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """여러 API 요청을 Google 배치 HTTP 요청으로 묶어 실행합니다.
+
+    Args:
+        service: Calendar 서비스 객체
+        builders (dict): 키 -> builder(service) 함수. builder는 실행 전 HttpRequest를 반환
+
+    Returns:
+        tuple: (키별 응답 dict, 키별 예외 dict). 한 요청의 실패가 다른 요청에 영향을 주지 않습니다.
+    """
+    results = {}
+    errors = {}
+    keys = list(builders)
+
+    def callback(request_id, response, exception):
+        key = keys[int(request_id)]
+        if exception is not None:
+            errors[key] = exception
+        else:
+            results[key] = response
+
+    for offset in range(0, len(keys), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=callback)
+        for index in range(offset, min(offset + BATCH_LIMIT, len(keys))):
+            batch.add(builders[keys[index]](service), request_id=str(index))
+        try:
+            batch.execute()
+        except Exception as e:
+            # 배치 전체가 실패한 경우 아직 결과가 없는 요청만 실패로 기록
+            for key in keys[offset:offset + BATCH_LIMIT]:
+                if key not in results and key not in errors:
+                    errors[key] = e
+
+    return results, errors
+
+
+def execute_parallel(service_factory: Callable, builders: Dict[str, Callable],
+                     max_workers: int = 8) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """여러 API 요청을 프로세스 전역 스레드 풀에서 동시에 실행합니다.
+
+    호출마다 스레드를 새로 띄우지 않도록 풀은 한 번만 만들고 (크기는 첫 호출의
+    max_workers), 서비스 객체는 각 작업에서 service_factory()로 가져옵니다.
+    """
+    results = {}
+    errors = {}
+
+    def run(key):
+        return builders[key](service_factory()).execute()
+
+    if not builders:
+        return results, errors
+
+    executor = _get_executor(max_workers)
+    futures = {key: executor.submit(run, key) for key in builders}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            errors[key] = e
+
+    return results, errors
+
+
+def execute_all(service_factory: Callable, builders: Dict[str, Callable],
+                mode: str = 'batch', max_workers: int = 8) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """설정된 방식(batch 또는 threads)으로 요청들을 실행합니다."""
+    if mode == 'threads':
+        return execute_parallel(service_factory, builders, max_workers=max_workers)
+    return execute_batched(service_factory(), builders)
@@ -0,0 +1,174 @@
+# calendar_range.py
+
+import bisect
+import threading
+import time
+
+from calendar_fetch import execute_all
+
+# 기간 조회 한 페이지당 최대 이벤트 수
+RANGE_PAGE_SIZE = 2500
+
+
+class WindowSet:
+    """이미 조회한 시간 구간들을 겹치지 않게 병합해 보관합니다.
+
+    각 구간은 (start, end, fetched_at)이며, 병합된 구간의 fetched_at은
+    가장 오래된 조회 시각을 따릅니다.
+    """
+
+    def __init__(self):
+        self._windows = []
+
+    def __len__(self):
+        return len(self._windows)
+
+    def add(self, start, end, fetched_at):
+        windows = self._windows
+        starts = [window[0] for window in windows]
+        # start 이전에 시작하지만 start와 맞닿거나 겹치는 구간부터 병합
+        lo = bisect.bisect_left(starts, start)
+        if lo > 0 and windows[lo - 1][1] >= start:
+            lo -= 1
+        hi = lo
+        while hi < len(windows) and windows[hi][0] <= end:
+            start = min(start, windows[hi][0])
+            end = max(end, windows[hi][1])
+            fetched_at = min(fetched_at, windows[hi][2])
+            hi += 1
+        windows[lo:hi] = [(start, end, fetched_at)]
+
+    def expire(self, oldest):
+        """fetched_at이 oldest보다 오래된 구간을 버립니다."""
+        self._windows = [window for window in self._windows if window[2] >= oldest]
+
+    def gaps(self, start, end):
+        """[start, end) 중 아직 조회하지 않은 구간 목록을 반환합니다."""
+        gaps = []
+        cursor = start
+        starts = [window[0] for window in self._windows]
+        index = max(0, bisect.bisect_right(starts, start) - 1)
+        for window_start, window_end, _ in self._windows[index:]:
+            if window_start >= end:
+                break
+            if window_end <= cursor:
+                continue
+            if window_start > cursor:
+                gaps.append((cursor, window_start))
+            cursor = max(cursor, window_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def clear(self):
+        self._windows = []
+
+
+class RangeQueryEngine:
+    """임의 기간의 일정을 로컬 저장소에서 응답하는 조회 엔진입니다.
+
+    syncToken으로 전체 동기화된 캘린더는 저장소가 동기화 기간(window_start
+    이후)을 덮고 있으므로 바로 응답합니다. 동기화되지 않은 캘린더(동기화 실패,
+    권한 제한 등)와 동기화 기간 이전 구간은 캘린더별로 이미 조회한 구간을
+    기억해 두고, 겹치지 않는 빈 구간만 Google에서 가져옵니다. 조회한 구간은
+    window_ttl초 후 만료됩니다.
+    """
+
+    def __init__(self, syncer, window_ttl=30, fetch_mode='batch', max_workers=8):
+        self.syncer = syncer
+        self.store = syncer.store
+        self.window_ttl = window_ttl
+        self.fetch_mode = fetch_mode
+        self.max_workers = max_workers
+        self._windows = {}   # calendar_id -> WindowSet
+        self._lock = threading.Lock()
+        self.upstream_requests = 0
+
+    def query(self, start, end):
+        """[start, end) 구간의 일정을 캘린더별 원본 이벤트 목록으로 반환합니다.
+
+        Returns:
+            tuple: (calendarList 항목 목록, {calendar_id: [event, ...]})
+        """
+        self.syncer.refresh()
+        calendars = self.syncer.get_calendars()
+
+        ranges = []
+        for calendar in calendars:
+            calendar_id = calendar['id']
+            if not self.store.is_synced(calendar_id):
+                ranges.append((calendar_id, start, end))
+                continue
+            window_start = self.store.window_start(calendar_id)
+            if window_start is not None and start < window_start:
+                ranges.append((calendar_id, start, min(end, window_start)))
+        if ranges:
+            self._fill_gaps(ranges)
+
+        events = {
+            calendar['id']: self.store.events_between(calendar['id'], start, end)
+            for calendar in calendars
+        }
+        return calendars, events
+
+    def _fill_gaps(self, ranges):
+        """[(calendar_id, start, end), ...] 중 아직 조회하지 않은 구간을 가져옵니다."""
+        now = time.monotonic()
+        builders = {}
+        with self._lock:
+            for calendar_id, start, end in ranges:
+                windows = self._windows.setdefault(calendar_id, WindowSet())
+                windows.expire(now - self.window_ttl)
+                for gap_start, gap_end in windows.gaps(start, end):
+                    builders[(calendar_id, gap_start, gap_end)] = self._list_builder(
+                        calendar_id, gap_start, gap_end
+                    )
+        if not builders:
+            return
+
+        self.upstream_requests += len(builders)
+        results, errors = execute_all(
+            self.syncer.service_factory, builders,
+            mode=self.fetch_mode, max_workers=self.max_workers
+        )
+        for (calendar_id, gap_start, gap_end), error in errors.items():
+            print(f"기간 일정 조회 실패 ({calendar_id}): {str(error)}")
+
+        for (calendar_id, gap_start, gap_end), page in results.items():
+            try:
+                items = list(page.get('items', []))
+                while page.get('nextPageToken'):
+                    page = self._list_builder(calendar_id, gap_start, gap_end, page['nextPageToken'])(
+                        self.syncer.service_factory()
+                    ).execute()
+                    items.extend(page.get('items', []))
+            except Exception as e:
+                print(f"기간 일정 조회 실패 ({calendar_id}): {str(e)}")
+                continue
+            self.store.replace_window(calendar_id, gap_start, gap_end, items)
+            with self._lock:
+                self._windows[calendar_id].add(gap_start, gap_end, now)
+
+    def invalidate(self, calendar_id=None):
+        """조회 구간 기록을 지워 다음 조회 때 다시 가져오게 합니다."""
+        with self._lock:
+            if calendar_id is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(calendar_id, None)
+
+    def _list_builder(self, calendar_id, start, end, page_token=None):
+        def builder(service):
+            params = {
+                'calendarId': calendar_id,
+                'timeMin': start.isoformat(),
+                'timeMax': end.isoformat(),
+                'singleEvents': True,
+                'maxResults': RANGE_PAGE_SIZE,
+            }
+            if page_token:
+                params['pageToken'] = page_token
+            return service.events().list(**params)
+        return builder
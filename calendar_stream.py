@@ -0,0 +1,160 @@
+# calendar_stream.py
+
+import itertools
+import json
+import os
+import queue
+import threading
+
+from calendar_utils import get_today_events
+
+# 구독자가 있을 때 Google 변경 사항을 확인하는 간격(초)
+CALENDAR_STREAM_INTERVAL = int(os.getenv('CALENDAR_STREAM_INTERVAL', '30'))
+# 연결 유지를 위한 SSE 주석 전송 간격(초)
+CALENDAR_STREAM_KEEPALIVE = 15
+# 느린 구독자 한 명당 쌓아 둘 수 있는 최대 메시지 수
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def load_today_event_list():
+    events = get_today_events()
+    return events if isinstance(events, list) else []
+
+
+def format_sse(event_type, data, event_id=None):
+    """SSE 프로토콜 형식의 메시지 문자열을 만듭니다."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventBroadcaster:
+    """오늘 일정의 추가/변경/삭제를 모든 SSE 구독자에게 전달합니다.
+
+    구독자 수와 관계없이 백그라운드 스레드 하나가 주기적으로 일정을 확인하고,
+    이전 스냅샷과의 차이만 모든 구독자 큐에 넣습니다.
+    """
+
+    def __init__(self, loader=load_today_event_list, interval=CALENDAR_STREAM_INTERVAL):
+        self.loader = loader
+        self.interval = interval
+        self._subscribers = set()
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._ids = itertools.count(1)
+        self._listeners = []
+
+    def subscribe(self):
+        """구독 큐를 등록하고, 현재 일정 전체를 담은 snapshot 메시지를 먼저 넣어 둡니다."""
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            self._ensure_thread()
+            snapshot = self._snapshot
+        if snapshot is None:
+            self.check_now()
+            with self._lock:
+                snapshot = self._snapshot
+        subscriber.put(('snapshot', list((snapshot or {}).values())))
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def add_listener(self, listener):
+        """일정을 확인할 때마다 최신 일정 목록으로 listener(events)를 호출합니다."""
+        self._listeners.append(listener)
+
+    def notify_changed(self):
+        """일정을 변경한 직후 호출하면 다음 주기를 기다리지 않고 바로 확인합니다."""
+        self._wakeup.set()
+
+    def publish(self, event_type, data):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event_type, data))
+            except queue.Full:
+                # 따라오지 못하는 구독자는 끊고 재연결 시 snapshot으로 다시 맞춤
+                self.unsubscribe(subscriber)
+                with subscriber.mutex:
+                    subscriber.queue.clear()
+                subscriber.put_nowait(('reset', None))
+
+    def check_now(self):
+        """일정을 한 번 조회하고 이전 스냅샷과 비교해 변경 사항을 발행합니다."""
+        with self._check_lock:
+            try:
+                events = self.loader()
+            except Exception as e:
+                print(f"일정 스트림 확인 실패: {str(e)}")
+                return
+            current = {(e['calendar_id'], e['id']): e for e in events}
+            with self._lock:
+                previous = self._snapshot
+                self._snapshot = current
+            for listener in self._listeners:
+                try:
+                    listener(events)
+                except Exception as e:
+                    print(f"일정 스트림 리스너 오류: {str(e)}")
+            if previous is None:
+                return
+
+            for key, event in current.items():
+                if key not in previous:
+                    self.publish('added', event)
+                elif previous[key] != event:
+                    self.publish('changed', event)
+            for key, event in previous.items():
+                if key not in current:
+                    self.publish('removed', {'id': event['id'], 'calendar_id': event['calendar_id']})
+
+    def stream(self):
+        """Flask Response에 넘길 SSE 문자열 제너레이터."""
+        subscriber = self.subscribe()
+        try:
+            yield f"retry: {CALENDAR_STREAM_KEEPALIVE * 1000}\n\n"
+            while True:
+                try:
+                    event_type, data = subscriber.get(timeout=CALENDAR_STREAM_KEEPALIVE)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if event_type == 'reset':
+                    return
+                yield format_sse(event_type, data, event_id=next(self._ids))
+        finally:
+            self.unsubscribe(subscriber)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            with self._lock:
+                if not self._subscribers:
+                    # 구독자가 없으면 스레드를 종료하고 다음 구독 때 다시 시작
+                    self._thread = None
+                    self._snapshot = None
+                    return
+            self.check_now()
+
+
+calendar_broadcaster = EventBroadcaster()
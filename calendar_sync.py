@@ -0,0 +1,347 @@
+# calendar_sync.py
+
+import bisect
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+from calendar_fetch import execute_all
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 증분 동기화 한 페이지당 최대 이벤트 수
+SYNC_PAGE_SIZE = 2500
+# 전체 동기화로 가져오는 과거 기간(일). 이보다 이전 구간은 조회할 때 Google에서 직접 가져옴
+SYNC_WINDOW_DAYS = 90
+
+
+def http_status(error):
+    """googleapiclient HttpError(또는 호환 객체)의 HTTP 상태 코드를 반환합니다."""
+    resp = getattr(error, 'resp', None)
+    status = getattr(resp, 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_event_time(value):
+    """이벤트의 start/end 필드를 timezone-aware datetime으로 변환합니다.
+
+    종일 일정('date')은 KST 자정 기준으로 해석합니다.
+    """
+    if not value:
+        return None
+    if value.get('dateTime'):
+        dt = datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00'))
+        if not dt.tzinfo:
+            dt = KST.localize(dt)
+        return dt
+    if value.get('date'):
+        return KST.localize(datetime.strptime(value['date'], '%Y-%m-%d'))
+    return None
+
+
+class EventStore:
+    """캘린더별 이벤트 원본을 보관하는 로컬 저장소입니다.
+
+    시작 시간 기준 정렬 인덱스를 유지해 기간 조회를 이분 탐색으로 처리합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._events = {}        # calendar_id -> {event_id: event}
+        self._sync_tokens = {}   # calendar_id -> nextSyncToken
+        self._synced_at = {}     # calendar_id -> time.monotonic()
+        self._window_start = {}  # calendar_id -> 전체 동기화 범위의 시작 (None이면 전체 기간)
+        self._index = {}         # calendar_id -> (starts, entries, max_duration)
+        self._versions = {}      # calendar_id -> 변경될 때마다 증가
+        self.version = 0
+
+    def calendar_ids(self):
+        with self._lock:
+            return list(self._events)
+
+    def sync_token(self, calendar_id):
+        with self._lock:
+            return self._sync_tokens.get(calendar_id)
+
+    def synced_at(self, calendar_id):
+        with self._lock:
+            return self._synced_at.get(calendar_id)
+
+    def is_synced(self, calendar_id):
+        with self._lock:
+            return calendar_id in self._synced_at
+
+    def window_start(self, calendar_id):
+        """동기화된 캘린더가 보관하는 기간의 시작 (이전 구간은 저장소에 없을 수 있음)."""
+        with self._lock:
+            return self._window_start.get(calendar_id)
+
+    def calendar_version(self, calendar_id):
+        with self._lock:
+            return self._versions.get(calendar_id, 0)
+
+    def get(self, calendar_id, event_id):
+        with self._lock:
+            return self._events.get(calendar_id, {}).get(event_id)
+
+    def events(self, calendar_id):
+        with self._lock:
+            return list(self._events.get(calendar_id, {}).values())
+
+    def apply(self, calendar_id, items, sync_token, full=False, window_start=None):
+        """동기화 결과(전체 또는 증분)를 반영합니다. 취소된 이벤트는 삭제합니다.
+
+        full이면 window_start 이후 구간을 items로 교체합니다.
+
+        Returns:
+            bool: 실제로 추가/변경/삭제된 이벤트가 있었는지 여부
+        """
+        with self._lock:
+            previous = self._events.get(calendar_id, {})
+            events = {} if full else previous
+            changed = False
+            for event in items:
+                if event.get('status') == 'cancelled':
+                    changed = events.pop(event['id'], None) is not None or changed
+                elif events.get(event['id']) != event:
+                    events[event['id']] = event
+                    changed = True
+            if full:
+                changed = changed or events != previous
+                self._window_start[calendar_id] = window_start
+            self._events[calendar_id] = events
+            if sync_token:
+                self._sync_tokens[calendar_id] = sync_token
+            self._synced_at[calendar_id] = time.monotonic()
+            if changed:
+                self._touch(calendar_id)
+            return changed
+
+    def upsert(self, calendar_id, event):
+        with self._lock:
+            self._events.setdefault(calendar_id, {})[event['id']] = event
+            self._touch(calendar_id)
+
+    def remove(self, calendar_id, event_id):
+        with self._lock:
+            if self._events.get(calendar_id, {}).pop(event_id, None) is not None:
+                self._touch(calendar_id)
+
+    def replace_window(self, calendar_id, start, end, items):
+        """[start, end) 구간을 조회한 결과로 해당 구간의 로컬 이벤트를 교체합니다.
+
+        동기화되지 않은 캘린더의 기간 조회 결과를 반영할 때 사용합니다.
+        """
+        with self._lock:
+            events = self._events.setdefault(calendar_id, {})
+            fetched_ids = {event['id'] for event in items}
+            changed = False
+            for event in self.events_between(calendar_id, start, end):
+                if event['id'] not in fetched_ids:
+                    events.pop(event['id'], None)
+                    changed = True
+            for event in items:
+                if event.get('status') == 'cancelled':
+                    changed = events.pop(event['id'], None) is not None or changed
+                elif events.get(event['id']) != event:
+                    events[event['id']] = event
+                    changed = True
+            if changed:
+                self._touch(calendar_id)
+
+    def reset(self, calendar_id):
+        """동기화 토큰이 무효화된 캘린더의 로컬 데이터를 버립니다."""
+        with self._lock:
+            self._events.pop(calendar_id, None)
+            self._sync_tokens.pop(calendar_id, None)
+            self._synced_at.pop(calendar_id, None)
+            self._window_start.pop(calendar_id, None)
+            self._touch(calendar_id)
+
+    def drop_except(self, calendar_ids):
+        """목록에 없는 캘린더(구독 해제 등)의 데이터를 제거합니다."""
+        with self._lock:
+            for calendar_id in list(self._events):
+                if calendar_id not in calendar_ids:
+                    self.reset(calendar_id)
+
+    def events_between(self, calendar_id, start, end):
+        """[start, end) 구간과 겹치는 이벤트를 시작 시간 순으로 반환합니다."""
+        with self._lock:
+            starts, entries, max_duration = self._get_index(calendar_id)
+            if not entries:
+                return []
+            # 시작 시간이 (start - 최장 일정 길이) 이후이고 end 이전인 후보만 검사
+            lo = bisect.bisect_left(starts, start - max_duration)
+            hi = bisect.bisect_left(starts, end)
+            return [
+                event for event_start, event_end, event in entries[lo:hi]
+                if event_end > start
+            ]
+
+    def _touch(self, calendar_id):
+        self._index.pop(calendar_id, None)
+        self._versions[calendar_id] = self._versions.get(calendar_id, 0) + 1
+        self.version += 1
+
+    def _get_index(self, calendar_id):
+        index = self._index.get(calendar_id)
+        if index is None:
+            entries = []
+            max_duration = timedelta(0)
+            for event in self._events.get(calendar_id, {}).values():
+                event_start = parse_event_time(event.get('start'))
+                event_end = parse_event_time(event.get('end')) or event_start
+                if event_start is None:
+                    continue
+                entries.append((event_start, event_end, event))
+                max_duration = max(max_duration, event_end - event_start)
+            entries.sort(key=lambda entry: entry[0])
+            index = ([entry[0] for entry in entries], entries, max_duration)
+            self._index[calendar_id] = index
+        return index
+
+
+class CalendarSyncer:
+    """Events API의 syncToken을 이용해 EventStore를 증분 동기화합니다.
+
+    각 캘린더의 첫 페이지 요청은 calendar_fetch를 통해 한 번에 보내고,
+    토큰이 무효화(410 Gone)된 캘린더는 전체 재동기화합니다.
+    전체 동기화는 최근 window_days일 이후에 끝나는 일정만 가져옵니다
+    (window_days가 None이면 전체 기간).
+    """
+
+    def __init__(self, service_factory, store=None, sync_interval=30,
+                 fetch_mode='batch', max_workers=8, window_days=SYNC_WINDOW_DAYS):
+        self.service_factory = service_factory
+        self.store = store or EventStore()
+        self.sync_interval = sync_interval
+        self.window_days = window_days
+        self.fetch_mode = fetch_mode
+        self.max_workers = max_workers
+        self._calendars = None
+        self._calendars_at = None
+        self._lock = threading.Lock()
+
+    def get_calendars(self, force=False):
+        """calendarList 항목을 반환합니다. sync_interval 동안은 재조회하지 않습니다."""
+        now = time.monotonic()
+        if (force or self._calendars is None
+                or now - self._calendars_at >= self.sync_interval):
+            calendar_list = self.service_factory().calendarList().list().execute()
+            self._calendars = calendar_list.get('items', [])
+            self._calendars_at = now
+        return self._calendars
+
+    def cached_calendars(self):
+        """마지막으로 조회한 calendarList 항목 (Google을 호출하지 않음)."""
+        return self._calendars or []
+
+    def resolve_calendar_id(self, calendar_id):
+        """'primary' 별칭을 실제 캘린더 ID로 바꿉니다."""
+        if calendar_id != 'primary':
+            return calendar_id
+        for calendar in self._calendars or []:
+            if calendar.get('primary'):
+                return calendar['id']
+        return calendar_id
+
+    def refresh(self, force=False):
+        """오래된 캘린더만 동기화합니다.
+
+        다른 스레드가 이미 동기화 중이고 로컬 데이터가 있으면 기다리지 않고
+        기존 데이터를 사용합니다.
+        """
+        has_data = self._calendars is not None
+        if not self._lock.acquire(blocking=not has_data):
+            return
+        try:
+            calendars = self.get_calendars(force=force)
+            calendar_ids = [calendar['id'] for calendar in calendars]
+            self.store.drop_except(calendar_ids)
+
+            now = time.monotonic()
+            stale = [
+                calendar_id for calendar_id in calendar_ids
+                if force or self.store.synced_at(calendar_id) is None
+                or now - self.store.synced_at(calendar_id) >= self.sync_interval
+            ]
+            if stale:
+                self.sync(stale)
+        finally:
+            self._lock.release()
+
+    def sync(self, calendar_ids):
+        """지정한 캘린더들을 동기화합니다. 캘린더별 오류는 서로 격리됩니다."""
+        tokens = {calendar_id: self.store.sync_token(calendar_id) for calendar_id in calendar_ids}
+        window_start = self._window_start()
+        builders = {
+            calendar_id: self._list_builder(calendar_id, tokens[calendar_id], window_start=window_start)
+            for calendar_id in calendar_ids
+        }
+        results, errors = execute_all(
+            self.service_factory, builders,
+            mode=self.fetch_mode, max_workers=self.max_workers
+        )
+
+        for calendar_id in calendar_ids:
+            try:
+                if calendar_id in errors:
+                    raise errors[calendar_id]
+                self._finish_sync(calendar_id, tokens[calendar_id], results[calendar_id], window_start)
+            except Exception as e:
+                if http_status(e) == 410 and tokens[calendar_id]:
+                    print(f"동기화 토큰 만료, 전체 재동기화: {calendar_id}")
+                    self.store.reset(calendar_id)
+                    try:
+                        self.full_sync(calendar_id)
+                    except Exception as full_error:
+                        print(f"전체 동기화 실패 ({calendar_id}): {str(full_error)}")
+                else:
+                    print(f"캘린더 동기화 실패 ({calendar_id}): {str(e)}")
+
+    def full_sync(self, calendar_id):
+        window_start = self._window_start()
+        first_page = self._list_builder(calendar_id, None, window_start=window_start)(
+            self.service_factory()
+        ).execute()
+        self._finish_sync(calendar_id, None, first_page, window_start)
+
+    def _window_start(self):
+        if self.window_days is None:
+            return None
+        return datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0) \
+            - timedelta(days=self.window_days)
+
+    def _finish_sync(self, calendar_id, sync_token, page, window_start=None):
+        items = list(page.get('items', []))
+        while page.get('nextPageToken'):
+            page = self._list_builder(calendar_id, sync_token, page['nextPageToken'], window_start)(
+                self.service_factory()
+            ).execute()
+            items.extend(page.get('items', []))
+        full = sync_token is None
+        self.store.apply(calendar_id, items, page.get('nextSyncToken'), full=full,
+                         window_start=window_start if full else None)
+
+    def _list_builder(self, calendar_id, sync_token, page_token=None, window_start=None):
+        def builder(service):
+            params = {
+                'calendarId': calendar_id,
+                'singleEvents': True,
+                'maxResults': SYNC_PAGE_SIZE,
+            }
+            if sync_token:
+                params['syncToken'] = sync_token
+            elif window_start is not None:
+                # 전체 동기화는 최근 구간만 (증분 요청에는 timeMin을 함께 쓸 수 없음)
+                params['timeMin'] = window_start.isoformat()
+            if page_token:
+                params['pageToken'] = page_token
+            return service.events().list(**params)
+        return builder
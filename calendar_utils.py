@@ -1,13 +1,25 @@
 from __future__ import print_function
+import copy
 from datetime import datetime, timezone, timedelta
+import os
 import os.path
 import pickle
+import tempfile
+import threading
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 import pytz
 
+from calendar_cache import TTLCache
+from calendar_conflicts import ConflictIndex, event_intervals
+from calendar_fetch import execute_batched
+from calendar_range import RangeQueryEngine
+from calendar_sync import SYNC_WINDOW_DAYS, CalendarSyncer, http_status
+
 # Google Calendar 읽기/쓰기 권한
 SCOPES = [
     'https://www.googleapis.com/auth/calendar.readonly',
@@ -17,100 +29,450 @@ SCOPES = [
 # 한국 시간대 설정
 KST = pytz.timezone('Asia/Seoul')
 
+TOKEN_PATH = 'token.pickle'
+CREDENTIALS_PATH = 'credentials.json'
+
+# 토큰 만료 몇 초 전에 백그라운드에서 갱신할지
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+# 백그라운드 갱신 실패 시 재시도 간격
+TOKEN_REFRESH_RETRY_SECONDS = 30
+
+# 캘린더별 일정 조회 방식: 'batch'(Google 배치 HTTP 요청) 또는 'threads'(스레드 풀)
+CALENDAR_FETCH_MODE = os.getenv('CALENDAR_FETCH_MODE', 'batch')
+CALENDAR_FETCH_WORKERS = int(os.getenv('CALENDAR_FETCH_WORKERS', '8'))
+# 요청 스레드들이 나눠 쓰는 Google API HTTP 연결 수 (유휴 연결 보관 한도)
+CALENDAR_HTTP_POOL_SIZE = int(os.getenv('CALENDAR_HTTP_POOL_SIZE', '16'))
+
+# 로컬 이벤트 저장소를 Google과 증분 동기화하는 최소 간격(초)
+CALENDAR_SYNC_INTERVAL = int(os.getenv('CALENDAR_SYNC_INTERVAL', '30'))
+# 로컬 저장소에 보관하는 과거 기간(일). 이전 구간은 조회 시 Google에서 가져옴
+CALENDAR_SYNC_WINDOW_DAYS = int(os.getenv('CALENDAR_SYNC_WINDOW_DAYS', str(SYNC_WINDOW_DAYS)))
+
+# 일정/캘린더 목록 조회 결과 캐시 설정 (초, 항목 수)
+CALENDAR_CACHE_TTL = int(os.getenv('CALENDAR_CACHE_TTL', '15'))
+CALENDAR_CACHE_STALE_TTL = int(os.getenv('CALENDAR_CACHE_STALE_TTL', '120'))
+CALENDAR_CACHE_MAX_ENTRIES = int(os.getenv('CALENDAR_CACHE_MAX_ENTRIES', '128'))
+
+# 'google'(기본) 또는 'fake'(오프라인용 가짜 백엔드, calendar_fake 참고)
+CALENDAR_BACKEND = os.getenv('CALENDAR_BACKEND', 'google')
+
+
+class _AuthorizedHttpPool:
+    """스레드들이 나눠 쓰는 httplib2 연결 풀.
+
+    httplib2.Http는 스레드 안전하지 않으므로 요청마다 유휴 연결 하나를 빌려
+    그 시점의 인증 정보로 호출하고 돌려놓습니다. 서비스 객체에는 이 풀 자체를
+    http로 넘기므로 서비스 객체는 프로세스에 하나만 있으면 됩니다.
+    """
+
+    def __init__(self, get_credentials, size=CALENDAR_HTTP_POOL_SIZE):
+        self._get_credentials = get_credentials
+        self._size = size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    @property
+    def credentials(self):
+        # googleapiclient의 배치 요청이 인증 헤더를 붙일 때 사용
+        return self._get_credentials()
+
+    def request(self, *args, **kwargs):
+        http = self._checkout()
+        try:
+            return AuthorizedHttp(self._get_credentials(), http=http).request(*args, **kwargs)
+        finally:
+            self._checkin(http)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for http in idle:
+            http.close()
+
+    def _checkout(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return build_http()
+
+    def _checkin(self, http):
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(http)
+                return
+        http.close()
+
+
+class CalendarServiceManager:
+    """프로세스 전역 인증 정보와 Calendar 서비스 객체를 관리합니다.
+
+    인증 정보는 프로세스(워커)당 한 번만 로드하고, 만료 전에 백그라운드
+    타이머로 갱신하여 요청 경로에서 토큰 갱신이 일어나지 않도록 합니다.
+    갱신은 인증 정보 사본으로 잠금 밖에서 하고 끝나면 잠금 안에서 바꿔 끼우므로
+    갱신 중에도 다른 요청은 기존 토큰으로 계속 진행합니다.
+    서비스 객체(discovery 문서 파싱 포함)도 프로세스당 한 번만 만들고,
+    스레드 안전하지 않은 HTTP 연결만 _AuthorizedHttpPool에서 요청마다 빌려 씁니다.
+    """
+
+    def __init__(self, token_path=TOKEN_PATH, credentials_path=CREDENTIALS_PATH):
+        self.token_path = token_path
+        self.credentials_path = credentials_path
+        self._lock = threading.RLock()
+        # 토큰 갱신은 한 번에 하나만 (self._lock은 갱신 중에 잡지 않음)
+        self._refresh_lock = threading.Lock()
+        self._creds = None
+        self._service = None
+        self._http_pool = None
+        self._refresh_timer = None
+        self._pid = os.getpid()
+
+    def get_credentials(self):
+        """유효한 인증 정보를 반환합니다. 필요한 경우에만 로드/재인증합니다."""
+        with self._lock:
+            self._reset_after_fork()
+            if self._creds is None:
+                self._creds = self._load_token()
+            creds = self._creds
+
+        if creds and not creds.valid and creds.expired and creds.refresh_token:
+            self._refresh()
+
+        with self._lock:
+            if not self._creds or not self._creds.valid:
+                flow = InstalledAppFlow.from_client_secrets_file(self.credentials_path, SCOPES)
+                self._creds = flow.run_local_server(port=0, access_type='offline', include_granted_scopes='true')
+                self._save_token(self._creds)
+
+            self._schedule_refresh()
+            return self._creds
+
+    def get_service(self):
+        """프로세스 전역 Calendar 서비스 객체를 반환합니다 (여러 스레드에서 함께 사용)."""
+        self.get_credentials()
+        with self._lock:
+            if self._service is None:
+                self._http_pool = _AuthorizedHttpPool(self._current_credentials)
+                self._service = build('calendar', 'v3', http=self._http_pool, cache_discovery=False)
+            return self._service
+
+    def reset(self):
+        """캐시된 인증 정보와 서비스 객체를 모두 버립니다."""
+        with self._lock:
+            self._cancel_refresh()
+            self._creds = None
+            self._drop_service()
+
+    def _current_credentials(self):
+        with self._lock:
+            return self._creds
+
+    def _drop_service(self):
+        if self._http_pool is not None:
+            self._http_pool.close()
+        self._http_pool = None
+        self._service = None
+
+    def _reset_after_fork(self):
+        # fork된 워커에는 부모의 타이머 스레드가 없고 부모의 연결을 함께 쓰면 안 되므로 새로 시작
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._refresh_timer = None
+            self._refresh_lock = threading.Lock()
+            self._http_pool = None
+            self._service = None
+
+    def _refresh(self, expected=None):
+        """인증 정보 사본을 잠금 밖에서 갱신한 뒤 바꿔 끼우고 새 인증 정보를 반환합니다.
+
+        expected: 이 인증 정보가 아직 쓰이고 있으면 유효하더라도 갱신 (백그라운드 갱신용)
+        """
+        with self._refresh_lock:
+            with self._lock:
+                current = self._creds
+            if not current or not current.refresh_token:
+                return current
+            # 기다리는 동안 다른 스레드가 이미 갱신함
+            if expected is None and current.valid:
+                return current
+            if expected is not None and current is not expected:
+                return current
+            refreshed = copy.deepcopy(current)
+            refreshed.refresh(Request())
+            self._save_token(refreshed)
+            with self._lock:
+                if self._creds is current:
+                    self._creds = refreshed
+                return self._creds
+
+    def _load_token(self):
+        if os.path.exists(self.token_path):
+            with open(self.token_path, 'rb') as token:
+                return pickle.load(token)
+        return None
+
+    def _save_token(self, creds):
+        """토큰 파일을 원자적으로 저장합니다 (임시 파일 작성 후 교체)."""
+        directory = os.path.dirname(os.path.abspath(self.token_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.token-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as token:
+                pickle.dump(creds, token)
+                token.flush()
+                os.fsync(token.fileno())
+            os.replace(tmp_path, self.token_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _schedule_refresh(self, delay=None):
+        if self._refresh_timer is not None and self._refresh_timer.is_alive():
+            return
+        creds = self._creds
+        if not creds or not creds.refresh_token:
+            return
+
+        if delay is None:
+            if creds.expiry is None:
+                return
+            # google-auth의 expiry는 naive UTC datetime
+            expires_in = (creds.expiry - datetime.utcnow()).total_seconds()
+            delay = max(0, expires_in - TOKEN_REFRESH_MARGIN_SECONDS)
+
+        timer = threading.Timer(delay, self._background_refresh)
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _cancel_refresh(self):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _background_refresh(self):
+        with self._lock:
+            self._refresh_timer = None
+            creds = self._creds
+            if not creds or not creds.refresh_token:
+                return
+        try:
+            self._refresh(expected=creds)
+        except Exception as e:
+            print(f"토큰 백그라운드 갱신 실패: {str(e)}")
+            with self._lock:
+                self._schedule_refresh(delay=TOKEN_REFRESH_RETRY_SECONDS)
+            return
+        with self._lock:
+            self._schedule_refresh()
+
+
+_service_manager = CalendarServiceManager()
+
+
 def get_calendar_service():
-    creds = None
+    if CALENDAR_BACKEND == 'fake':
+        from calendar_fake import get_fake_backend
+        return get_fake_backend()
+    return _service_manager.get_service()
 
-    # 인증된 토큰 캐시 확인
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
 
-    # 인증 없거나 만료 시 재인증
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0, access_type='offline', include_granted_scopes='true')
+# 프로세스 전역 로컬 이벤트 저장소 및 동기화기
+_syncer = CalendarSyncer(
+    get_calendar_service,
+    sync_interval=CALENDAR_SYNC_INTERVAL,
+    fetch_mode=CALENDAR_FETCH_MODE,
+    max_workers=CALENDAR_FETCH_WORKERS,
+    window_days=CALENDAR_SYNC_WINDOW_DAYS
+)
+event_store = _syncer.store
 
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
+# 임의 기간 조회 엔진 (동기화되지 않은 캘린더는 조회 구간 단위로 캐시)
+_range_engine = RangeQueryEngine(
+    _syncer,
+    window_ttl=CALENDAR_SYNC_INTERVAL,
+    fetch_mode=CALENDAR_FETCH_MODE,
+    max_workers=CALENDAR_FETCH_WORKERS
+)
 
-    return build('calendar', 'v3', credentials=creds)
+# /calendar/range 한 번에 조회할 수 있는 최대 기간
+MAX_RANGE_DAYS = 366
 
-def get_today_events():
-    service = get_calendar_service()
+# get_today_events / get_calendar_list 결과 캐시
+_read_cache = TTLCache(
+    ttl=CALENDAR_CACHE_TTL,
+    stale_ttl=CALENDAR_CACHE_STALE_TTL,
+    max_entries=CALENDAR_CACHE_MAX_ENTRIES
+)
 
-    # 오늘 00:00~23:59 (KST 기준) 일정 조회 범위 설정
-    now = datetime.now(KST)
-    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-    # UTC로 변환
-    start = start.astimezone(pytz.UTC)
-    end = end.astimezone(pytz.UTC)
+def invalidate_event_caches():
+    """일정이 변경되었을 때 일정 조회 캐시를 비웁니다 (캘린더 목록 캐시는 유지)."""
+    _read_cache.invalidate(lambda key: key[0] != 'calendars')
+
+
+def get_cache_stats():
+    """조회 캐시의 적중/미스 통계를 반환합니다."""
+    return _read_cache.stats()
+
+def format_event_time(time_str):
+    if not time_str:
+        return None
+    # UTC 시간을 KST로 변환
+    dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+    dt_kst = dt.astimezone(KST)
+    return dt_kst.isoformat()
+
+def get_reminder_minutes(event):
+    """이벤트의 팝업 알림 시간(분)을 반환합니다."""
+    reminder_minutes = 10  # 기본값
+    if 'reminders' in event:
+        if not event['reminders'].get('useDefault', True):
+            overrides = event['reminders'].get('overrides', [])
+            if overrides:
+                # 팝업 알림 설정 찾기
+                for override in overrides:
+                    if override.get('method') == 'popup':
+                        reminder_minutes = override.get('minutes', 10)
+                        break
+        # 기본 알림 설정 사용
+        else:
+            reminder_minutes = 10
+    return reminder_minutes
+
+def format_event(event, calendar_id, calendar_info):
+    """Google 이벤트 리소스를 화면/API용 dict로 변환합니다."""
+    return {
+        "id": event['id'],
+        "title": event.get("summary", "제목 없음"),
+        "start_time": format_event_time(event['start'].get('dateTime', event['start'].get('date'))),
+        "end_time": format_event_time(event['end'].get('dateTime', event['end'].get('date'))),
+        "description": event.get("description", ""),
+        "calendar_id": calendar_id,
+        "calendar_name": calendar_info["summary"],
+        "color": calendar_info["backgroundColor"],
+        "reminder_minutes": get_reminder_minutes(event)
+    }
+
+def get_events_between(start, end):
+    """[start, end) 구간의 모든 캘린더 일정을 시작 시간 순으로 반환합니다.
+
+    로컬 저장소에서 응답하며, 필요한 경우에만 Google과 증분 동기화하거나
+    아직 조회하지 않은 구간을 가져옵니다.
+    """
+    calendars, events_by_calendar = _range_engine.query(start, end)
 
-    # 캘린더 목록 가져오기
-    calendar_colors = {}
-    calendar_list = service.calendarList().list().execute()
-    
     formatted_events = []
-    
-    # 각 캘린더별로 일정 조회
-    for calendar in calendar_list.get('items', []):
+    for calendar in calendars:
         calendar_id = calendar['id']
-        calendar_colors[calendar_id] = {
+        calendar_info = {
             'backgroundColor': calendar.get('backgroundColor', '#039BE5'),
             'summary': calendar.get('summary', '기본 캘린더')
         }
-        
-        # 일정 요청
-        events_result = service.events().list(
-            calendarId=calendar_id,
-            timeMin=start.isoformat(),
-            timeMax=end.isoformat(),
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+        for event in events_by_calendar.get(calendar_id, []):
+            formatted_events.append(format_event(event, calendar_id, calendar_info))
+
+    formatted_events.sort(key=lambda e: e['start_time'] or '')
+    return formatted_events
 
-        events = events_result.get('items', [])
-
-        def format_event_time(time_str):
-            if not time_str:
-                return None
-            # UTC 시간을 KST로 변환
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            dt_kst = dt.astimezone(KST)
-            return dt_kst.isoformat()
-
-        for event in events:
-            # 알림 설정 가져오기
-            reminder_minutes = 10  # 기본값
-            if 'reminders' in event:
-                if not event['reminders'].get('useDefault', True):
-                    overrides = event['reminders'].get('overrides', [])
-                    if overrides:
-                        # 팝업 알림 설정 찾기
-                        for override in overrides:
-                            if override.get('method') == 'popup':
-                                reminder_minutes = override.get('minutes', 10)
-                                break
-                # 기본 알림 설정 사용
-                else:
-                    reminder_minutes = 10
-
-            formatted_event = {
-                "id": event['id'],
-                "title": event.get("summary", "제목 없음"),
-                "start_time": format_event_time(event['start'].get('dateTime', event['start'].get('date'))),
-                "end_time": format_event_time(event['end'].get('dateTime', event['end'].get('date'))),
-                "description": event.get("description", ""),
-                "calendar_id": calendar_id,
-                "calendar_name": calendar_colors[calendar_id]["summary"],
-                "color": calendar_colors[calendar_id]["backgroundColor"],
-                "reminder_minutes": reminder_minutes
+def _parse_range_bound(value):
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if not dt.tzinfo:
+        dt = KST.localize(dt)
+    return dt
+
+def get_events_in_range(start_time, end_time):
+    """ISO 형식 문자열로 받은 기간의 일정을 반환합니다 (주/월 보기용).
+
+    Raises:
+        ValueError: 날짜 형식이 잘못되었거나 기간이 유효하지 않은 경우
+    """
+    start = _parse_range_bound(start_time)
+    end = _parse_range_bound(end_time)
+    if end <= start:
+        raise ValueError("종료 시간은 시작 시간보다 이후여야 합니다.")
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise ValueError(f"조회 기간은 최대 {MAX_RANGE_DAYS}일입니다.")
+    return get_events_between(start, end)
+
+# 충돌 검사용 구간 인덱스 (쓰기 가능한 캘린더 중 하나의 버전이 바뀔 때만 다시 만듦)
+_conflict_index = None
+_conflict_index_key = None
+_conflict_intervals = {}   # calendar_id -> (캘린더 버전, 구간 목록)
+_conflict_index_lock = threading.Lock()
+
+def _writable_calendar_ids():
+    # 마지막으로 받은 캘린더 목록을 사용하고, 아직 없을 때만 Google에서 조회
+    calendars = _syncer.cached_calendars() or get_calendar_list()
+    return tuple(
+        calendar['id'] for calendar in calendars
+        if calendar.get('accessRole') in ('owner', 'writer')
+    )
+
+def get_conflict_index():
+    """쓰기 가능한 모든 캘린더의 로컬 일정으로 만든 충돌 검사 인덱스를 반환합니다.
+
+    캘린더별 버전으로 바뀐 캘린더의 구간만 다시 계산합니다.
+    """
+    global _conflict_index, _conflict_index_key
+    calendar_ids = _writable_calendar_ids()
+    with _conflict_index_lock:
+        key = tuple((calendar_id, event_store.calendar_version(calendar_id)) for calendar_id in calendar_ids)
+        if key != _conflict_index_key:
+            intervals = []
+            for calendar_id, version in key:
+                cached = _conflict_intervals.get(calendar_id)
+                if cached is None or cached[0] != version:
+                    cached = (version, event_intervals(calendar_id, event_store.events(calendar_id)))
+                    _conflict_intervals[calendar_id] = cached
+                intervals.extend(cached[1])
+            for calendar_id in set(_conflict_intervals) - set(calendar_ids):
+                del _conflict_intervals[calendar_id]
+            _conflict_index = ConflictIndex(intervals)
+            _conflict_index_key = key
+        return _conflict_index
+
+def check_conflicts(start_time, end_time, exclude_event_id=None):
+    """요청한 시간과 겹치는 일정과, 겹칠 경우 가장 가까운 빈 시간을 반환합니다.
+
+    Google freeBusy를 호출하지 않고 로컬 저장소의 일정만 사용합니다.
+    """
+    start = _parse_range_bound(start_time)
+    end = _parse_range_bound(end_time)
+    if end <= start:
+        end = start + timedelta(minutes=30)
+
+    index = get_conflict_index()
+    conflicts = index.overlapping(start, end, exclude_id=exclude_event_id)
+    slots = index.free_slots(start, end, not_before=datetime.now(KST)) if conflicts else []
+
+    return {
+        'conflicts': [
+            {
+                'id': conflict['id'],
+                'calendar_id': conflict['calendar_id'],
+                'title': conflict['title'],
+                'start': conflict['start'].astimezone(KST).isoformat(),
+                'end': conflict['end'].astimezone(KST).isoformat()
             }
-            formatted_events.append(formatted_event)
+            for conflict in conflicts
+        ],
+        'suggested_slots': [
+            {'start': slot_start.astimezone(KST).isoformat(), 'end': slot_end.astimezone(KST).isoformat()}
+            for slot_start, slot_end in slots
+        ]
+    }
+
+def get_today_events():
+    today = datetime.now(KST).date().isoformat()
+    return _read_cache.get_or_load(('today', today), _load_today_events)
+
+def _load_today_events():
+    # 오늘 00:00~23:59 (KST 기준) 일정 조회 범위 설정
+    now = datetime.now(KST)
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    formatted_events = get_events_between(start, end)
 
     if not formatted_events:
         return "오늘 일정은 없습니다."
@@ -119,76 +481,168 @@ def get_today_events():
 
 def get_calendar_list():
     """사용 가능한 모든 캘린더 목록을 가져옵니다."""
-    service = get_calendar_service()
-    
     try:
-        calendar_list = service.calendarList().list().execute()
-        calendars = calendar_list.get('items', [])
-        
-        return [
-            {
-                'id': calendar['id'],
-                'summary': calendar['summary'],
-                'description': calendar.get('description', ''),
-                'backgroundColor': calendar.get('backgroundColor', '#039BE5'),
-                'accessRole': calendar['accessRole']
-            }
-            for calendar in calendars
-            if calendar['accessRole'] in ['owner', 'writer']  # 쓰기 권한이 있는 캘린더만 반환
-        ]
+        return _read_cache.get_or_load(('calendars',), _load_calendar_list)
     except Exception as e:
         print(f"캘린더 목록 가져오기 실패: {str(e)}")
         return []
 
-def create_calendar_event(calendar_id='primary', title=None, start_time=None, end_time=None, 
-                        description=None, location=None, attendees=None, reminder_minutes=10):
-    """캘린더에 새 일정을 추가합니다."""
-    try:
-        service = get_calendar_service()
+def _load_calendar_list():
+    calendars = _syncer.get_calendars()
+
+    return [
+        {
+            'id': calendar['id'],
+            'summary': calendar['summary'],
+            'description': calendar.get('description', ''),
+            'backgroundColor': calendar.get('backgroundColor', '#039BE5'),
+            'accessRole': calendar['accessRole']
+        }
+        for calendar in calendars
+        if calendar['accessRole'] in ['owner', 'writer']  # 쓰기 권한이 있는 캘린더만 반환
+    ]
+
+def build_event_body(title=None, start_time=None, end_time=None, description=None,
+                     location=None, attendees=None, reminder_minutes=10):
+    """새 일정 생성 요청 본문(Google 이벤트 리소스)을 만듭니다."""
+    # 시간 문자열이 ISO 형식인지 확인하고 처리
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+    if isinstance(end_time, str):
+        end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+    if not start_time.tzinfo:
+        start_time = KST.localize(start_time)
+    if not end_time.tzinfo:
+        end_time = KST.localize(end_time)
         
-        # 시간 문자열이 ISO 형식인지 확인하고 처리
-        if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        if isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            
-        # 시간이 과거인 경우 현재 시간 + 1분으로 조정
-        now = datetime.now(timezone.utc)
-        if start_time < now:
-            start_time = now + timedelta(minutes=1)
-            end_time = start_time + timedelta(minutes=30)
-            
-        # 종료 시간이 시작 시간보다 이전인 경우 수정
-        if end_time <= start_time:
-            end_time = start_time + timedelta(minutes=30)
-
-        event = {
-            'summary': title,
-            'description': description,
-            'start': {
-                'dateTime': start_time.isoformat(),
-                'timeZone': 'Asia/Seoul'
-            },
-            'end': {
-                'dateTime': end_time.isoformat(),
-                'timeZone': 'Asia/Seoul'
-            }
+    # 시간이 과거인 경우 현재 시간 + 1분으로 조정
+    now = datetime.now(timezone.utc)
+    if start_time < now:
+        start_time = now + timedelta(minutes=1)
+        end_time = start_time + timedelta(minutes=30)
+        
+    # 종료 시간이 시작 시간보다 이전인 경우 수정
+    if end_time <= start_time:
+        end_time = start_time + timedelta(minutes=30)
+
+    event = {
+        'summary': title,
+        'description': description,
+        'start': {
+            'dateTime': start_time.isoformat(),
+            'timeZone': 'Asia/Seoul'
+        },
+        'end': {
+            'dateTime': end_time.isoformat(),
+            'timeZone': 'Asia/Seoul'
         }
+    }
+
+    if location:
+        event['location'] = location
 
-        if location:
-            event['location'] = location
+    if attendees:
+        event['attendees'] = [{'email': attendee} for attendee in attendees]
 
-        if attendees:
-            event['attendees'] = [{'email': attendee} for attendee in attendees]
+    # 알림 설정 (팝업과 이메일 모두 설정)
+    event['reminders'] = {
+        'useDefault': False,
+        'overrides': [
+            {'method': 'popup', 'minutes': reminder_minutes},
+            {'method': 'email', 'minutes': reminder_minutes}
+        ]
+    }
+    return event
 
-        # 알림 설정 (팝업과 이메일 모두 설정)
+def apply_event_changes(event, title=None, start_time=None, end_time=None, description=None,
+                        attendees=None, location=None, reminder_minutes=None):
+    """기존 이벤트 리소스에 수정 사항을 반영합니다 (event를 직접 변경)."""
+    if start_time:
+        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        if not start_dt.tzinfo:
+            start_dt = KST.localize(start_dt)
+        event['start'] = {
+            'dateTime': start_dt.isoformat(),
+            'timeZone': 'Asia/Seoul'
+        }
+    
+    if end_time:
+        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+        if not end_dt.tzinfo:
+            end_dt = KST.localize(end_dt)
+        event['end'] = {
+            'dateTime': end_dt.isoformat(),
+            'timeZone': 'Asia/Seoul'
+        }
+    
+    if title:
+        event['summary'] = title
+    if description is not None:
+        event['description'] = description
+    if location is not None:
+        event['location'] = location
+    if attendees is not None:
+        event['attendees'] = [{'email': email} for email in attendees]
+    if reminder_minutes is not None:
         event['reminders'] = {
             'useDefault': False,
             'overrides': [
-                {'method': 'popup', 'minutes': reminder_minutes},
-                {'method': 'email', 'minutes': reminder_minutes}
+                {'method': 'popup', 'minutes': int(reminder_minutes)},
+                {'method': 'email', 'minutes': int(reminder_minutes)}
             ]
         }
+    return event
+
+def _created_result(event):
+    return {
+        'success': True,
+        'id': event['id'],
+        'htmlLink': event['htmlLink'],
+        # 과거 시간은 build_event_body에서 조정되므로 실제로 저장된 시간을 함께 반환
+        'start': event['start']['dateTime'],
+        'end': event['end']['dateTime']
+    }
+
+def _updated_result(updated_event, reminder_minutes=None):
+    return {
+        'success': True,
+        'id': updated_event['id'],
+        'title': updated_event['summary'],
+        'start': updated_event['start']['dateTime'],
+        'end': updated_event['end']['dateTime'],
+        'reminder_minutes': reminder_minutes if reminder_minutes is not None else None,
+        'etag': updated_event.get('etag')
+    }
+
+def _conflict_result():
+    return {
+        'success': False,
+        'conflict': True,
+        'error': '다른 곳에서 먼저 수정된 일정입니다. 최신 내용을 불러온 뒤 다시 시도해주세요.'
+    }
+
+def build_event_patch(cached_event=None, etag=None, **changes):
+    """PATCH 요청 본문을 만듭니다.
+
+    If-Match로 보낼 etag가 로컬 사본의 etag와 같을 때만 사본과 값이 같은 필드를
+    제외합니다. 그 외에는 사본이 최대 동기화 간격만큼 오래되었을 수 있으므로
+    (다른 곳에서 바뀐 값을 되돌리는 수정이 빠지지 않도록) 모든 필드를 보냅니다.
+    """
+    patch = apply_event_changes({}, **changes)
+    if cached_event and etag and cached_event.get('etag') == etag:
+        patch = {key: value for key, value in patch.items() if cached_event.get(key) != value}
+    return patch
+
+def create_calendar_event(calendar_id='primary', title=None, start_time=None, end_time=None, 
+                        description=None, location=None, attendees=None, reminder_minutes=10):
+    """캘린더에 새 일정을 추가합니다."""
+    try:
+        service = get_calendar_service()
+
+        event = build_event_body(
+            title=title, start_time=start_time, end_time=end_time, description=description,
+            location=location, attendees=attendees, reminder_minutes=reminder_minutes
+        )
 
         print('일정 생성 요청:', event)  # 디버깅용 로그
 
@@ -198,11 +652,11 @@ def create_calendar_event(calendar_id='primary', title=None, start_time=None, en
             sendUpdates='all'  # 이메일 알림 보내기
         ).execute()
 
-        return {
-            'success': True,
-            'id': event['id'],
-            'htmlLink': event['htmlLink']
-        }
+        # 다음 동기화를 기다리지 않고 로컬 저장소에 바로 반영
+        event_store.upsert(_syncer.resolve_calendar_id(calendar_id), event)
+        invalidate_event_caches()
+
+        return _created_result(event)
 
     except Exception as e:
         print('일정 생성 중 오류:', str(e))  # 디버깅용 로그
@@ -211,65 +665,44 @@ def create_calendar_event(calendar_id='primary', title=None, start_time=None, en
             'error': str(e)
         }
 
-def update_calendar_event(calendar_id, event_id, title=None, start_time=None, end_time=None, description=None, attendees=None, location=None, reminder_minutes=None):
+def update_calendar_event(calendar_id, event_id, title=None, start_time=None, end_time=None, description=None, attendees=None, location=None, reminder_minutes=None, etag=None):
+    """일정을 수정합니다.
+
+    주어진 필드만 events().patch()로 전송하며, etag가 주어지면 If-Match 헤더로
+    보내 그 사이 다른 곳에서 수정된 경우(412) 덮어쓰지 않고 충돌로 응답합니다.
+    """
     service = get_calendar_service()
     
     try:
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-        
-        if start_time:
-            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            if not start_dt.tzinfo:
-                start_dt = KST.localize(start_dt)
-            event['start'] = {
-                'dateTime': start_dt.isoformat(),
-                'timeZone': 'Asia/Seoul'
-            }
-        
-        if end_time:
-            end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            if not end_dt.tzinfo:
-                end_dt = KST.localize(end_dt)
-            event['end'] = {
-                'dateTime': end_dt.isoformat(),
-                'timeZone': 'Asia/Seoul'
-            }
-        
-        if title:
-            event['summary'] = title
-        if description is not None:
-            event['description'] = description
-        if location is not None:
-            event['location'] = location
-        if attendees is not None:
-            event['attendees'] = [{'email': email} for email in attendees]
-        if reminder_minutes is not None:
-            event['reminders'] = {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': int(reminder_minutes)},
-                    {'method': 'email', 'minutes': int(reminder_minutes)}
-                ]
-            }
+        store_calendar_id = _syncer.resolve_calendar_id(calendar_id)
+        cached_event = event_store.get(store_calendar_id, event_id)
+
+        patch = build_event_patch(
+            cached_event, etag, title=title, start_time=start_time, end_time=end_time, description=description,
+            attendees=attendees, location=location, reminder_minutes=reminder_minutes
+        )
+        if not patch and cached_event and (not etag or cached_event.get('etag') == etag):
+            # 바뀐 내용이 없으면 Google 호출 없이 응답
+            return _updated_result(cached_event, reminder_minutes)
         
-        updated_event = service.events().update(
+        request = service.events().patch(
             calendarId=calendar_id,
             eventId=event_id,
-            body=event,
+            body=patch,
             sendUpdates='all'
-        ).execute()
+        )
+        if etag:
+            request.headers['If-Match'] = etag
+        updated_event = request.execute()
+        event_store.upsert(store_calendar_id, updated_event)
+        invalidate_event_caches()
         
         print(f"수정된 이벤트 시간: 시작={updated_event['start']['dateTime']}, 종료={updated_event['end']['dateTime']}")
         
-        return {
-            'success': True,
-            'id': updated_event['id'],
-            'title': updated_event['summary'],
-            'start': updated_event['start']['dateTime'],
-            'end': updated_event['end']['dateTime'],
-            'reminder_minutes': reminder_minutes if reminder_minutes is not None else None
-        }
+        return _updated_result(updated_event, reminder_minutes)
     except Exception as e:
+        if http_status(e) == 412:
+            return _conflict_result()
         print(f"일정 수정 중 오류: {str(e)}")
         return {
             'success': False,
@@ -290,6 +723,8 @@ def delete_calendar_event(calendar_id, event_id):
     
     try:
         service.events().delete(calendarId=calendar_id, eventId=event_id, sendUpdates='all').execute()
+        event_store.remove(_syncer.resolve_calendar_id(calendar_id), event_id)
+        invalidate_event_caches()
         return {
             'success': True,
             'message': '일정이 성공적으로 삭제되었습니다.'
@@ -301,11 +736,29 @@ def delete_calendar_event(calendar_id, event_id):
         }
 
 def get_event_details(calendar_id, event_id):
-    """특정 일정의 상세 정보를 가져옵니다."""
-    service = get_calendar_service()
-    
+    """특정 일정의 상세 정보를 가져옵니다.
+
+    로컬 사본이 있으면 If-None-Match로 조건부 조회하여, 바뀌지 않은 일정은
+    304 응답만 받고 로컬 사본으로 응답합니다.
+    """
     try:
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+        store_calendar_id = _syncer.resolve_calendar_id(calendar_id)
+        cached_event = event_store.get(store_calendar_id, event_id)
+
+        service = get_calendar_service()
+        request = service.events().get(calendarId=calendar_id, eventId=event_id)
+        if cached_event and cached_event.get('etag'):
+            request.headers['If-None-Match'] = cached_event['etag']
+        try:
+            event = request.execute()
+        except Exception as e:
+            if http_status(e) != 304:
+                raise
+            event = cached_event
+        else:
+            if cached_event is not None and cached_event != event:
+                event_store.upsert(store_calendar_id, event)
+                invalidate_event_caches()
         
         # 시간 정보를 KST로 변환
         start_time = event['start'].get('dateTime', event['start'].get('date'))
@@ -327,7 +780,8 @@ def get_event_details(calendar_id, event_id):
             'description': event.get('description', ''),
             'location': event.get('location', ''),
             'attendees': [attendee['email'] for attendee in event.get('attendees', [])],
-            'reminder_minutes': event.get('reminders', {}).get('overrides', [{}])[0].get('minutes', 10)
+            'reminder_minutes': event.get('reminders', {}).get('overrides', [{}])[0].get('minutes', 10),
+            'etag': event.get('etag')
         }
     except Exception as e:
         print(f"일정 상세 정보 조회 중 오류: {str(e)}")
@@ -336,3 +790,118 @@ def get_event_details(calendar_id, event_id):
             'error': str(e)
         }
 
+# /calendar/bulk 한 번에 처리할 수 있는 최대 작업 수
+BULK_MAX_OPERATIONS = 500
+BULK_OPERATIONS = ('create', 'update', 'delete')
+EVENT_FIELDS = ('title', 'start_time', 'end_time', 'description', 'location', 'attendees', 'reminder_minutes')
+
+def _bulk_error_message(error):
+    """일괄 작업 오류를 사용자에게 보여줄 메시지로 바꿉니다 (HttpError repr 대신)."""
+    status = http_status(error)
+    if status in (404, 410):
+        return '일정을 찾을 수 없습니다. 이미 삭제되었을 수 있습니다.'
+    if status == 403:
+        return '이 캘린더의 일정을 변경할 권한이 없습니다.'
+    return str(error)
+
+def bulk_calendar_operations(operations):
+    """여러 일정의 생성/수정/삭제를 Google 배치 HTTP 요청으로 한 번에 처리합니다.
+
+    요청은 API 제한(50개) 단위로 나뉘어 전송되며, 수정 작업은 주어진 필드만
+    PATCH로 보냅니다. 작업에 'etag'가 있으면 If-Match 조건으로 전송합니다.
+
+    Args:
+        operations (list): 작업 목록. 각 항목은
+            {'op': 'create' | 'update' | 'delete', 'calendar_id': ..., 'event_id': ...}
+            와 create/update 시 단건 API와 같은 일정 필드(title, start_time 등)를 가집니다.
+
+    Returns:
+        list: 작업 순서와 같은 순서의 결과 dict 목록
+    """
+    service = get_calendar_service()
+    results = [None] * len(operations)
+
+    def fail(index, error):
+        operation = operations[index]
+        results[index] = {
+            'success': False,
+            'op': operation.get('op') if isinstance(operation, dict) else None,
+            'error': error if isinstance(error, str) else _bulk_error_message(error)
+        }
+
+    # 입력 검증
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            fail(index, '작업은 객체여야 합니다.')
+            continue
+        op = operation.get('op')
+        if op not in BULK_OPERATIONS:
+            fail(index, f"지원하지 않는 작업입니다: {op}")
+        elif op in ('update', 'delete') and not operation.get('event_id'):
+            fail(index, 'event_id는 필수입니다.')
+        elif op == 'create' and not all(operation.get(key) for key in ('title', 'start_time', 'end_time')):
+            fail(index, '제목, 시작 시간, 종료 시간은 필수입니다.')
+
+    def conditional(request, etag):
+        if etag:
+            request.headers['If-Match'] = etag
+        return request
+
+    # 생성/수정/삭제 요청을 배치로 실행
+    mutations = {}
+    for index, operation in enumerate(operations):
+        if results[index] is not None:
+            continue
+        op = operation['op']
+        calendar_id = operation.get('calendar_id', 'primary')
+        fields = {key: operation[key] for key in EVENT_FIELDS if key in operation}
+        try:
+            if op == 'create':
+                body = build_event_body(**fields)
+                mutations[index] = lambda svc, c=calendar_id, b=body: svc.events().insert(
+                    calendarId=c, body=b, sendUpdates='all'
+                )
+            elif op == 'update':
+                body = build_event_patch(
+                    event_store.get(_syncer.resolve_calendar_id(calendar_id), operation['event_id']),
+                    operation.get('etag'), **fields
+                )
+                mutations[index] = lambda svc, c=calendar_id, e=operation['event_id'], b=body, t=operation.get('etag'): conditional(
+                    svc.events().patch(calendarId=c, eventId=e, body=b, sendUpdates='all'), t
+                )
+            else:
+                mutations[index] = lambda svc, c=calendar_id, e=operation['event_id'], t=operation.get('etag'): conditional(
+                    svc.events().delete(calendarId=c, eventId=e, sendUpdates='all'), t
+                )
+        except Exception as e:
+            fail(index, e)
+
+    responses, errors = execute_batched(service, mutations)
+
+    for index in mutations:
+        if index in errors:
+            if http_status(errors[index]) == 412:
+                results[index] = dict(_conflict_result(), op=operations[index]['op'])
+            else:
+                fail(index, errors[index])
+            continue
+        operation = operations[index]
+        op = operation['op']
+        calendar_id = _syncer.resolve_calendar_id(operation.get('calendar_id', 'primary'))
+        if op == 'create':
+            event_store.upsert(calendar_id, responses[index])
+            result = _created_result(responses[index])
+        elif op == 'update':
+            event_store.upsert(calendar_id, responses[index])
+            result = _updated_result(responses[index], operation.get('reminder_minutes'))
+        else:
+            event_store.remove(calendar_id, operation['event_id'])
+            result = {'success': True, 'id': operation['event_id']}
+        result['op'] = op
+        results[index] = result
+
+    if responses:
+        invalidate_event_caches()
+
+    print(f"일괄 처리 완료: {sum(1 for r in results if r['success'])}/{len(results)} 성공")
+    return results
@@ -1,7 +1,13 @@
 # cli.py
+import argparse
+
 from summarizer import summarize_text
 
 def main():
+    parser = argparse.ArgumentParser(description="복붙한 문서 요약")
+    parser.add_argument("--backend", help="요약 백엔드 (openai, extractive, auto). extractive는 API 키 없이 동작")
+    args = parser.parse_args()
+
     print("📎 복붙한 문서를 입력하고 'end'를 입력하면 요약합니다.\n")
 
     buffer = []
@@ -13,7 +19,7 @@ def main():
 
     input_text = "\n".join(buffer)
     print("\n🤖 요약 중...\n")
-    summary = summarize_text(input_text)
+    summary = summarize_text(input_text, backend=args.backend)
     print("✅ 요약 결과:\n")
     print(summary)
 
@@ -0,0 +1,171 @@
+# extractive.py
+"""
+API 호출 없이 본문에서 핵심 문장을 골라내는 추출 요약기.
+
+문장별 TF-IDF 벡터(단어 + 한글 음절 바이그램)의 코사인 유사도 그래프에
+TextRank(PageRank)를 적용해 점수를 매기고, 점수가 높은 문장을 원래 순서대로
+반환합니다. 형태소 분석기 없이도 한국어 조사/어미 변화에 덜 민감하도록
+음절 바이그램을 함께 사용합니다.
+
+TF-IDF 벡터는 문장별 {특징: 가중치} 희소 벡터로 보관하고, 유사도 그래프는
+RANK_BLOCK_SENTENCES 문장 구간마다 그 구간의 특징만으로 만들므로 긴 회의록에서도
+메모리가 (문장 수 x 전체 어휘 수)로 늘지 않습니다.
+"""
+
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+# 문장 끝 (마침표/물음표/느낌표 뒤 공백) 또는 줄바꿈에서 문장 분리
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。…])\s+|\n+')
+WORD = re.compile(r'[0-9A-Za-z가-힣]+')
+HANGUL = re.compile(r'[가-힣]')
+# 단어 끝에서 떼어낼 조사/어미 (긴 것부터)
+KOREAN_SUFFIXES = sorted([
+    '으로', '에서', '에게', '까지', '부터', '하고', '이다', '입니다', '했다', '한다', '하는',
+    '했습니다', '합니다', '은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '도', '로', '만'
+], key=len, reverse=True)
+MIN_SENTENCE_CHARS = 10
+# 유사도 그래프를 한 번에 만드는 최대 문장 수 (구간별 행렬 크기 상한)
+RANK_BLOCK_SENTENCES = 300
+
+
+def split_sentences(text):
+    sentences = []
+    for sentence in SENTENCE_BOUNDARY.split(text or ''):
+        sentence = sentence.strip().lstrip('-*•').strip()
+        if len(sentence) >= MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+    return sentences
+
+
+def strip_suffix(word):
+    for suffix in KOREAN_SUFFIXES:
+        if len(word) > len(suffix) + 1 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(sentence):
+    """문장의 특징 목록: 소문자 단어(조사 제거) + 한글 단어의 음절 바이그램."""
+    features = []
+    for word in WORD.findall(sentence.lower()):
+        if HANGUL.search(word):
+            word = strip_suffix(word)
+            features.extend(word[i:i + 2] for i in range(len(word) - 1))
+        if len(word) > 1:
+            features.append(word)
+    return features
+
+
+def tfidf_vectors(sentences):
+    """문장별 L2 정규화 TF-IDF 희소 벡터 ({특징: 가중치}) 목록."""
+    counts = [Counter(tokenize(sentence)) for sentence in sentences]
+    document_frequency = Counter()
+    for counter in counts:
+        document_frequency.update(counter.keys())
+
+    vectors = []
+    for counter in counts:
+        # 부드러운 IDF: log((1 + n) / (1 + df)) + 1
+        vector = {
+            feature: math.log1p(count) * (math.log((1 + len(sentences)) / (1 + document_frequency[feature])) + 1)
+            for feature, count in counter.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors.append({feature: weight / norm for feature, weight in vector.items()} if norm else vector)
+    return vectors
+
+
+def cosine(a, b):
+    """정규화된 희소 벡터 두 개의 코사인 유사도."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(feature, 0.0) for feature, weight in a.items())
+
+
+def dense_matrix(vectors):
+    """희소 벡터 묶음을 그 묶음에 나오는 특징만 열로 둔 (문장 수 x 특징 수) 행렬로."""
+    vocabulary = {}
+    rows, cols, values = [], [], []
+    for row, vector in enumerate(vectors):
+        for feature, weight in vector.items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+            values.append(weight)
+
+    matrix = np.zeros((len(vectors), max(1, len(vocabulary))))
+    if values:
+        matrix[rows, cols] = values
+    return matrix
+
+
+def textrank_scores(matrix, damping=0.85, iterations=50, tolerance=1e-6):
+    """코사인 유사도 그래프의 PageRank 점수 (문장 수 길이의 배열)."""
+    count = matrix.shape[0]
+    if count == 0:
+        return np.zeros(0)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 겹치지 않는 문장은 모든 문장으로 균등하게 연결
+    transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1, out_weight), 1.0 / count)
+
+    scores = np.full(count, 1.0 / count)
+    for _ in range(iterations):
+        updated = (1 - damping) / count + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def _rank(text, lead_weight, block=RANK_BLOCK_SENTENCES):
+    sentences = split_sentences(text)
+    if not sentences:
+        return [], np.zeros(0), []
+    vectors = tfidf_vectors(sentences)
+    scores = np.zeros(len(sentences))
+    for start in range(0, len(sentences), block):
+        part = vectors[start:start + block]
+        # 구간별 점수의 합은 1이므로 구간 길이 비율을 곱해 구간끼리도 비교할 수 있게 함
+        scores[start:start + len(part)] = textrank_scores(dense_matrix(part)) * len(part) / len(sentences)
+    if lead_weight:
+        positions = np.arange(len(sentences))
+        scores = scores * (1 + lead_weight / (1 + positions))
+    return sentences, scores, vectors
+
+
+def summarize(text, max_sentences=3, lead_weight=0.0, redundancy=0.7):
+    """점수가 높은 문장 max_sentences개를 원래 순서대로 줄바꿈으로 이어 반환합니다.
+
+    lead_weight > 0이면 앞쪽 문장에 가산점을 줍니다 (기사처럼 핵심이 앞에 오는 글).
+    이미 고른 문장과 유사도가 redundancy 이상인 문장은 건너뜁니다.
+    """
+    sentences, scores, vectors = _rank(text, lead_weight)
+    if not sentences:
+        return (text or '').strip()
+
+    chosen = []
+    for index in np.argsort(-scores, kind='stable'):
+        if len(chosen) >= max_sentences:
+            break
+        if chosen and max(cosine(vectors[i], vectors[index]) for i in chosen) >= redundancy:
+            continue
+        chosen.append(int(index))
+    return "\n".join(sentences[i] for i in sorted(chosen))
+
+
+if __name__ == "__main__":
+    import timeit
+
+    sample = " ".join(
+        f"정부는 {i}일 인공지능 반도체 지원 방안을 발표했다. 업계는 이번 지원으로 투자가 늘 것으로 기대했다. "
+        f"날씨는 맑았다. 반도체 업계 관계자는 인공지능 수요가 계속 증가할 것이라고 말했다."
+        for i in range(50)
+    )
+    print(summarize(sample, lead_weight=0.5))
+    seconds = timeit.timeit(lambda: summarize(sample), number=10) / 10
+    print(f"{len(split_sentences(sample))}문장: {seconds * 1000:.1f}ms")
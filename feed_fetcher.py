@@ -0,0 +1,99 @@
+# feed_fetcher.py
+
+import hashlib
+import threading
+import time
+
+import feedparser
+
+# 피드별로 기억할 최대 GUID 수 (오래된 것부터 잊음)
+FEED_MAX_SEEN_GUIDS = 1000
+
+
+def entry_guid(entry):
+    """기사 식별자: RSS guid/Atom id, 없으면 링크, 그것도 없으면 제목 해시."""
+    guid = entry.get('id') or entry.get('guid') or entry.get('link')
+    if guid:
+        return guid
+    return hashlib.sha256(entry.get('title', '').encode('utf-8')).hexdigest()
+
+
+class _FeedState:
+    def __init__(self):
+        self.etag = None
+        self.modified = None
+        self.entries = []
+        self.seen = {}           # guid -> 처음 본 시각 (삽입 순서 유지)
+        self.fetched_at = None
+        self.lock = threading.Lock()
+
+
+class FeedFetcher:
+    """ETag/Last-Modified 조건부 요청으로 RSS를 가져오고 파싱 결과를 재사용합니다.
+
+    304(변경 없음)이면 이전에 파싱한 기사 목록을 그대로 돌려주고,
+    기사 GUID를 기억해 이번에 처음 보는 기사만 new_entries로 구분합니다.
+    """
+
+    def __init__(self, parse=feedparser.parse, max_seen=FEED_MAX_SEEN_GUIDS):
+        self._parse = parse
+        self._max_seen = max_seen
+        self._feeds = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+
+    def fetch(self, url):
+        """피드를 가져옵니다.
+
+        Returns:
+            dict: {'entries': 전체 기사, 'new_entries': 처음 보는 기사,
+                   'not_modified': 304 여부}
+        """
+        with self._lock:
+            state = self._feeds.setdefault(url, _FeedState())
+
+        with state.lock:
+            feed = self._parse(url, etag=state.etag, modified=state.modified)
+            self.requests += 1
+            status = getattr(feed, 'status', None)
+
+            if status == 304:
+                self.not_modified += 1
+                not_modified = True
+            elif feed.entries or not state.entries:
+                # 네트워크 오류 등으로 빈 결과가 오면 이전 기사 목록을 유지
+                not_modified = False
+                state.entries = list(feed.entries)
+                state.etag = feed.get('etag')
+                state.modified = feed.get('modified')
+            else:
+                print(f"❗ 피드 가져오기 실패, 이전 결과 사용: {feed.get('bozo_exception', status)}")
+                not_modified = True
+            state.fetched_at = time.time()
+
+            new_entries = []
+            for entry in state.entries:
+                guid = entry_guid(entry)
+                if guid not in state.seen:
+                    state.seen[guid] = state.fetched_at
+                    new_entries.append(entry)
+            while len(state.seen) > self._max_seen:
+                del state.seen[next(iter(state.seen))]
+
+            return {
+                'entries': list(state.entries),
+                'new_entries': new_entries,
+                'not_modified': not_modified
+            }
+
+    def forget(self, url=None):
+        """저장된 ETag/기사 목록을 지웁니다 (url이 없으면 전체)."""
+        with self._lock:
+            if url is None:
+                self._feeds.clear()
+            else:
+                self._feeds.pop(url, None)
+
+
+feed_fetcher = FeedFetcher()
@@ -0,0 +1,142 @@
+# html_text.py
+"""
+RSS 본문(content:encoded 등) HTML에서 문단 텍스트를 뽑는 추출기.
+
+BeautifulSoup 트리를 만들지 않고 html.parser 이벤트만으로 <p> 안의 텍스트를
+모읍니다. 결과는 기존 방식(soup.find_all("p") + get_text(strip=True))과 같으며,
+`python html_text.py`로 일치 여부 확인과 속도 비교를 실행할 수 있습니다.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+
+# 요약에 넘길 본문의 최대 길이(문자)
+ARTICLE_MAX_CHARS = int(os.getenv('ARTICLE_MAX_CHARS', '6000'))
+
+# 닫는 태그가 없는 요소 (스택에 넣지 않음)
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame',
+    'hr', 'image', 'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta',
+    'nextid', 'param', 'source', 'spacer', 'track', 'wbr'
+])
+# 텍스트를 수집하지 않는 요소
+SKIP_ELEMENTS = frozenset(['script', 'style'])
+
+# 기사 본문과 관계없는 문단 (저작권 고지, 기자 서명, 구독/공유 안내 등)
+BOILERPLATE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'무단\s*(전재|복제)',
+    r'재배포\s*금지',
+    r'all rights reserved',
+    r'^(copyright|ⓒ|©)',
+    r'^[\w\s]{2,10}\s*기자\s*[\w.+-]+@[\w.-]+$',
+    r'^[\w.+-]+@[\w.-]+\.\w+$',
+    r'(구독|공유)하기$',
+    r'^\[?관련\s*기사\]?',
+)]
+
+
+class _ParagraphParser(HTMLParser):
+    """<p> 요소별로 하위 텍스트 조각을 모으는 이벤트 기반 파서."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs = []     # 시작 태그 순서대로 [문자열 조각, ...]
+        self._stack = []         # (태그, 문단 인덱스 또는 None)
+        self._open = []          # 열려 있는 문단 인덱스
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        index = None
+        if tag == 'p':
+            index = len(self.paragraphs)
+            self.paragraphs.append([])
+            self._open.append(index)
+        elif tag in SKIP_ELEMENTS:
+            self._skip += 1
+        self._stack.append((tag, index))
+
+    def handle_startendtag(self, tag, attrs):
+        # <p/> 같은 자기 닫힘 문단은 빈 문단
+        if tag == 'p':
+            self.paragraphs.append([])
+
+    def handle_endtag(self, tag):
+        # 열린 적 없는 태그의 닫는 태그는 무시하고, 있으면 그 태그까지 모두 닫음
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, index = self._stack.pop()
+            if index is not None:
+                self._open.remove(index)
+            elif open_tag in SKIP_ELEMENTS:
+                self._skip -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self._open or self._skip:
+            return
+        data = data.strip()
+        if data:
+            for index in self._open:
+                self.paragraphs[index].append(data)
+
+
+def extract_paragraphs(html):
+    """HTML의 <p> 요소별 텍스트 목록 (문서 순서)."""
+    if not html:
+        return []
+    parser = _ParagraphParser()
+    parser.feed(html)
+    parser.close()
+    return ["".join(parts) for parts in parser.paragraphs]
+
+
+def extract_paragraphs_reference(html):
+    """BeautifulSoup 기반 기존 구현 (일치 확인용)."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    return [p.get_text(strip=True) for p in soup.find_all("p")]
+
+
+def is_boilerplate(paragraph):
+    return any(pattern.search(paragraph) for pattern in BOILERPLATE_PATTERNS)
+
+
+def clean_article_text(paragraphs, max_chars=ARTICLE_MAX_CHARS):
+    """빈 문단과 상투 문구를 빼고, 문단 경계에서 max_chars 이내로 자릅니다."""
+    kept = []
+    length = 0
+    for paragraph in paragraphs:
+        if not paragraph or is_boilerplate(paragraph):
+            continue
+        if length + len(paragraph) > max_chars:
+            if not kept:
+                kept.append(paragraph[:max_chars])
+            break
+        kept.append(paragraph)
+        length += len(paragraph) + 1
+    return "\n".join(kept)
+
+
+def _benchmark(html, repeat=200):
+    import timeit
+
+    fast = timeit.timeit(lambda: extract_paragraphs(html), number=repeat)
+    reference = timeit.timeit(lambda: extract_paragraphs_reference(html), number=repeat)
+    return fast / repeat, reference / repeat
+
+
+if __name__ == "__main__":
+    # 성능 비교 (결과 일치 여부는 tests/test_html_text.py에서 확인)
+    large = "<div>" + "".join(
+        f"<p>문단 {i} <a href='#'>링크</a> 와 <b>강조</b> 텍스트 &amp; 엔티티</p><img src='{i}.jpg'>"
+        for i in range(500)
+    ) + "</div>"
+    fast, reference = _benchmark(large, repeat=20)
+    print(f"큰 본문({len(large)}자): fast {fast * 1000:.2f}ms, bs4 {reference * 1000:.2f}ms, "
+          f"{reference / fast:.1f}배")
@@ -0,0 +1,242 @@
+# llm_gateway.py
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import openai
+from openai import DefaultHttpxClient, OpenAI
+
+import metrics
+
+# 분당 요청 수 / 분당 토큰 수 한도 (계정 등급에 맞게 설정)
+LLM_REQUESTS_PER_MINUTE = int(os.getenv('LLM_REQUESTS_PER_MINUTE', '500'))
+LLM_TOKENS_PER_MINUTE = int(os.getenv('LLM_TOKENS_PER_MINUTE', '200000'))
+# 429/5xx/연결 오류 시 재시도 횟수와 첫 대기 시간(초)
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '4'))
+LLM_BACKOFF_BASE = float(os.getenv('LLM_BACKOFF_BASE', '1.0'))
+LLM_BACKOFF_MAX = float(os.getenv('LLM_BACKOFF_MAX', '30'))
+# 호출 하나의 기본 제한 시간(초, 대기/재시도 포함)
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '60'))
+# HTTP 연결 풀 크기
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '20'))
+
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """호출 제한 시간 안에 응답을 받지 못한 경우."""
+
+
+class LLMStreamClosed(Exception):
+    """스트림을 끝까지 읽기 전에 호출자가 닫은 경우 (계측용)."""
+
+
+def estimate_tokens(text):
+    """토큰 수 추정치 (영문 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+class TokenBucket:
+    """분당 capacity만큼 채워지는 토큰 버킷."""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount, deadline=None):
+        """amount만큼 꺼냅니다. 부족하면 채워질 때까지 기다리며, 기다린 시간(초)을 반환합니다.
+
+        deadline(time.monotonic 기준)까지 채워지지 않으면 LLMDeadlineExceeded.
+        """
+        # 한도보다 큰 요청은 가득 찬 버킷 전체를 쓰는 것으로 취급
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = (amount - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise LLMDeadlineExceeded("요청 한도 대기 중 제한 시간을 초과했습니다.")
+            time.sleep(wait)
+            waited += wait
+
+
+class LLMGateway:
+    """모든 OpenAI 호출이 거치는 공용 클라이언트 계층.
+
+    - 연결 풀을 공유하는 httpx 클라이언트 하나로 요청
+    - 분당 요청/토큰 수 토큰 버킷으로 호출 속도 제한 (재시도와 관계없이 호출당 한 번 차감)
+    - 429/5xx/연결 오류는 지수 백오프(+지터)로 재시도, Retry-After 헤더 우선
+    - 호출마다 제한 시간(timeout)을 두고 대기/재시도 모두 그 안에서 처리
+    - 같은 요청이 동시에 들어오면 한 번만 보내고 결과를 공유 (singleflight)
+    - 호출마다 operation 이름별 지연 시간/토큰/비용/오류를 metrics에 기록
+    """
+
+    def __init__(self, api_key=None, base_url=None, requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute=LLM_TOKENS_PER_MINUTE, max_retries=LLM_MAX_RETRIES,
+                 timeout=LLM_TIMEOUT, max_connections=LLM_MAX_CONNECTIONS, client=None):
+        if client is None:
+            # openai가 사용하는 httpx의 Limits 타입으로 연결 풀 크기 지정
+            limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=0,
+                http_client=DefaultHttpxClient(limits=limits)
+            )
+        self.client = client
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def chat(self, messages, model, max_tokens, timeout=None, operation='chat', **kwargs):
+        """chat.completions.create와 같은 응답 객체를 반환합니다.
+
+        동일한 (모델, 메시지, 옵션)의 요청이 진행 중이면 그 결과를 함께 받되,
+        기다리는 시간도 이 호출의 timeout을 넘지 않습니다.
+        operation은 메트릭/로그에서 호출 용도를 구분하는 이름입니다.
+        """
+        key = self._request_key(messages, model, max_tokens, kwargs)
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            metrics.llm_deduplicated.inc(operation=operation, model=model)
+            try:
+                return future.result(timeout=timeout or self.timeout)
+            except FutureTimeoutError:
+                raise LLMDeadlineExceeded("진행 중인 같은 요청을 기다리다 제한 시간을 초과했습니다.") from None
+
+        try:
+            result = self._call(messages, model, max_tokens, timeout, kwargs, operation)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stream_chat(self, messages, model, max_tokens, timeout=None, operation='chat_stream', **kwargs):
+        """stream=True 응답(청크 이터레이터)을 반환합니다. 재시도는 연결 수립까지만 합니다."""
+        kwargs = dict(kwargs, stream=True, stream_options={'include_usage': True})
+        started = time.monotonic()
+        stream = self._call(messages, model, max_tokens, timeout, kwargs, operation, started)
+        return self._instrument_stream(stream, operation, model, started)
+
+    def _instrument_stream(self, stream, operation, model, started):
+        """스트림을 그대로 전달하면서 첫 토큰 시간과 마지막 청크의 usage를 기록합니다."""
+        first_token_at = None
+        usage = None
+        error = None
+        try:
+            for chunk in stream:
+                if first_token_at is None and chunk.choices:
+                    first_token_at = time.monotonic()
+                if getattr(chunk, 'usage', None) is not None:
+                    usage = chunk.usage
+                yield chunk
+        except GeneratorExit:
+            error = LLMStreamClosed("스트림이 끝나기 전에 닫혔습니다.")
+            raise
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            metrics.record_llm_call(operation, model, started, usage=usage, error=error,
+                                    first_token_at=first_token_at, stream=True)
+
+    def _request_key(self, messages, model, max_tokens, kwargs):
+        payload = json.dumps([model, messages, max_tokens, kwargs], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _call(self, messages, model, max_tokens, timeout, kwargs, operation, started=None):
+        """재시도/속도 제한을 적용해 요청합니다.
+
+        started가 없으면(일반 호출) 결과를 여기서 기록하고, 스트리밍 호출은
+        연결 실패만 여기서 기록하고 나머지는 _instrument_stream이 기록합니다.
+        """
+        stream = started is not None
+        started = started or time.monotonic()
+        labels = {'operation': operation, 'model': model}
+        deadline = time.monotonic() + (timeout or self.timeout)
+        prompt_tokens = sum(estimate_tokens(message.get('content') or '') for message in messages)
+
+        # 한도는 논리적인 호출 하나당 한 번만 차감 (재시도 간격은 백오프가 맡음)
+        try:
+            waited = self.request_bucket.acquire(1, deadline)
+            waited += self.token_bucket.acquire(prompt_tokens + max_tokens, deadline)
+        except LLMDeadlineExceeded as e:
+            metrics.record_llm_call(operation, model, started, error=e, attempts=0, stream=stream)
+            raise
+        if waited:
+            metrics.llm_throttled.inc(waited, **labels)
+
+        attempt = 0
+        while True:
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise LLMDeadlineExceeded("LLM 호출 제한 시간을 초과했습니다.")
+
+                resp = self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    timeout=remaining,
+                    **kwargs
+                )
+            except RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(e, attempt)
+                if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+                    metrics.record_llm_call(operation, model, started, error=e, attempts=attempt + 1, stream=stream)
+                    raise
+                print(f"LLM 호출 재시도 ({attempt + 1}/{self.max_retries}, {delay:.1f}초 후): {str(e)}")
+                metrics.llm_retries.inc(**labels)
+                time.sleep(delay)
+                attempt += 1
+            except Exception as e:
+                metrics.record_llm_call(operation, model, started, error=e, attempts=attempt + 1, stream=stream)
+                raise
+            else:
+                if not stream:
+                    metrics.record_llm_call(operation, model, started, usage=getattr(resp, 'usage', None),
+                                            attempts=attempt + 1)
+                return resp
+
+    def _retry_delay(self, error, attempt):
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), LLM_BACKOFF_MAX)
+            except ValueError:
+                pass
+        # 지수 백오프 + 전체 지터
+        return random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * (2 ** attempt)))
@@ -1,53 +1,60 @@
 # meeting_handler.py
 
-from summarizer import format_meeting_notes
-from typing import Dict, Union
+from summarizer import meeting_cancellation, served_backend, stream_format_meeting_notes
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
-def process_meeting_notes(raw_text: str) -> Dict[str, str]:
+def _error_result(e: Exception) -> Dict[str, str]:
+    error_message = str(e)
+    if "api_key" in error_message.lower():
+        error_detail = "API 키 설정을 확인해주세요."
+    elif "timeout" in error_message.lower():
+        error_detail = "서버 응답 시간이 초과되었습니다."
+    else:
+        error_detail = "알 수 없는 오류가 발생했습니다."
+
+    return {
+        'status': 'error',
+        'message': f"❗ 회의록 정리 실패: {error_detail}\n상세 에러: {str(e)}",
+        'processing_status': '처리 실패'
+    }
+
+def stream_meeting_notes(raw_text: str, backend: Optional[str] = None,
+                         cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[str, Dict[str, str]]]:
     """
-    회의 메모 원문을 받아서 정리된 회의록을 반환합니다.
-    
-    Returns:
-        Dict[str, str]: {
-            'status': 'success' 또는 'error',
-            'message': 성공 시 정리된 회의록, 실패 시 에러 메시지,
-            'processing_status': 처리 상태 메시지
-        }
+    회의 메모 원문을 정리하면서 결과를 조각 단위로 전달합니다.
+
+    Args:
+        backend: 요약 백엔드 이름 (None이면 기본값, 'extractive'면 API 호출 없이 정리)
+        cancelled: 참을 반환하면 긴 회의록의 구간 정리 사이에서 중단 (작업 취소용)
+
+    Yields:
+        (이벤트 종류, 데이터):
+            ('token', {'text': 조각}) - 정리된 회의록 조각 (도착하는 대로)
+            ('done', {'status': 'success', 'message': 전체 회의록, 'processing_status',
+                      'backend': 정리에 실제로 쓰인 백엔드 이름})
+            ('error', {'status': 'error', 'message': 에러 메시지, 'processing_status'})
     """
-    try:
-        result = {
-            'status': 'processing',
-            'message': '',
-            'processing_status': '회의록 정리 중...'
-        }
-        
-        if not raw_text.strip():
-            return {
-                'status': 'error',
-                'message': '❗ 회의록 내용이 비어있습니다.',
-                'processing_status': '처리 실패'
-            }
-
-        cleaned_summary = format_meeting_notes(raw_text)
-        
-        return {
-            'status': 'success',
-            'message': cleaned_summary,
-            'processing_status': '처리 완료'
-        }
-        
-    except Exception as e:
-        error_message = str(e)
-        if "api_key" in error_message.lower():
-            error_detail = "API 키 설정을 확인해주세요."
-        elif "timeout" in error_message.lower():
-            error_detail = "서버 응답 시간이 초과되었습니다."
-        else:
-            error_detail = "알 수 없는 오류가 발생했습니다."
-            
-        return {
+    if not raw_text.strip():
+        yield 'error', {
             'status': 'error',
-            'message': f"❗ 회의록 정리 실패: {error_detail}\n상세 에러: {str(e)}",
+            'message': '❗ 회의록 내용이 비어있습니다.',
             'processing_status': '처리 실패'
         }
+        return
+
+    parts = []
+    try:
+        with meeting_cancellation(cancelled):
+            for token in stream_format_meeting_notes(raw_text, backend=backend):
+                parts.append(token)
+                yield 'token', {'text': token}
+    except Exception as e:
+        yield 'error', _error_result(e)
+        return
 
+    yield 'done', {
+        'status': 'success',
+        'message': "".join(parts).strip(),
+        'processing_status': '처리 완료',
+        'backend': served_backend()
+    }
@@ -0,0 +1,240 @@
+# meeting_jobs.py
+
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from meeting_handler import stream_meeting_notes
+
+# 회의록 정리를 동시에 실행할 작업자 수와 대기열 최대 길이
+MEETING_JOB_WORKERS = int(os.getenv('MEETING_JOB_WORKERS', '2'))
+MEETING_JOB_QUEUE_LIMIT = int(os.getenv('MEETING_JOB_QUEUE_LIMIT', '20'))
+# 끝난 작업 결과를 보관하는 시간(초)
+MEETING_JOB_RETENTION = int(os.getenv('MEETING_JOB_RETENTION', '3600'))
+# 구독 스트림의 keepalive 간격(초)
+MEETING_JOB_KEEPALIVE = 15
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+STATE_MESSAGES = {
+    QUEUED: '대기 중...',
+    RUNNING: '회의록 정리 중...',
+    DONE: '처리 완료',
+    FAILED: '처리 실패',
+    CANCELLED: '취소됨',
+}
+
+
+class JobQueueFull(Exception):
+    """대기열이 가득 차서 새 작업을 받을 수 없는 경우."""
+
+
+class MeetingJob:
+    def __init__(self, text, backend=None):
+        self.id = uuid.uuid4().hex
+        self.text = text
+        self.backend = backend
+        self.served_backend = None   # 실제로 정리한 백엔드 (auto면 openai/extractive)
+        self.state = QUEUED
+        self.message = ''
+        self.parts = []
+        self.events = []         # 구독자에게 보낼 (종류, 데이터) 기록
+        self.cancel_requested = False
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at = None
+        self.finished_at = None
+        self.finished_monotonic = None
+
+    def to_dict(self, queue_position=None):
+        """/process_meeting_notes 응답 형식(status/message/processing_status)에 작업 정보를 더한 dict."""
+        status = {DONE: 'success', FAILED: 'error', CANCELLED: 'error'}.get(self.state, 'processing')
+        result = {
+            'job_id': self.id,
+            'status': status,
+            'state': self.state,
+            'message': self.message if self.state in FINISHED_STATES else "".join(self.parts),
+            'processing_status': STATE_MESSAGES[self.state],
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'backend': self.served_backend
+        }
+        if queue_position is not None:
+            result['queue_position'] = queue_position
+        return result
+
+
+class MeetingJobQueue:
+    """회의록 정리 작업 대기열과 고정 크기 작업자 풀.
+
+    submit()은 작업 id를 바로 반환하고, 작업자 스레드가 순서대로 정리합니다.
+    상태는 queued → running → done/failed (또는 cancelled)로 바뀌며,
+    get()으로 조회하거나 subscribe()로 토큰/상태 이벤트를 받을 수 있습니다.
+    대기 중인 작업이 max_queue개면 JobQueueFull로 새 작업을 거절합니다.
+    """
+
+    def __init__(self, workers=MEETING_JOB_WORKERS, max_queue=MEETING_JOB_QUEUE_LIMIT,
+                 retention=MEETING_JOB_RETENTION, runner=stream_meeting_notes):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retention = retention
+        self.runner = runner
+        self._jobs = OrderedDict()
+        self._pending = queue.Queue()
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def submit(self, text, backend=None):
+        with self._cond:
+            self._purge()
+            if self.queue_depth() >= self.max_queue:
+                raise JobQueueFull(f"대기 중인 회의록 정리 작업이 너무 많습니다 (최대 {self.max_queue}개).")
+            job = MeetingJob(text, backend)
+            self._jobs[job.id] = job
+            self._record(job, 'status', job.to_dict(queue_position=self.queue_depth()))
+            self._ensure_workers()
+        self._pending.put(job.id)
+        return job
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return job.to_dict(queue_position=self._queue_position(job))
+
+    def cancel(self, job_id):
+        """작업을 취소합니다. 대기 중이면 바로, 실행 중이면 다음 토큰(또는 긴 회의록의
+        다음 구간 정리)에서 중단합니다.
+
+        Returns:
+            dict | None: 작업 상태 (없는 작업이면 None)
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.state == QUEUED:
+                self._finish(job, CANCELLED, '❗ 회의록 정리가 취소되었습니다.')
+            elif job.state == RUNNING:
+                job.cancel_requested = True
+            return job.to_dict()
+
+    def queue_depth(self):
+        with self._cond:
+            return sum(1 for job in self._jobs.values() if job.state == QUEUED)
+
+    def stats(self):
+        with self._cond:
+            counts = {state: 0 for state in STATE_MESSAGES}
+            for job in self._jobs.values():
+                counts[job.state] += 1
+            return dict(counts, workers=self.workers, max_queue=self.max_queue)
+
+    def subscribe(self, job_id):
+        """작업 이벤트 (종류, 데이터)를 끝날 때까지 yield합니다 (keepalive 시점에는 None).
+
+        이미 지난 이벤트부터 다시 보내므로 언제 구독해도 전체 결과를 받습니다.
+        """
+        index = 0
+        while True:
+            with self._cond:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                if index >= len(job.events) and job.state not in FINISHED_STATES:
+                    self._cond.wait(MEETING_JOB_KEEPALIVE)
+                events = job.events[index:]
+                index += len(events)
+                finished = job.state in FINISHED_STATES and index >= len(job.events)
+            if not events and not finished:
+                yield None
+            for event in events:
+                yield event
+            if finished:
+                return
+
+    def _queue_position(self, job):
+        if job.state != QUEUED:
+            return None
+        return sum(1 for other in self._jobs.values() if other.state == QUEUED and other.created_at <= job.created_at)
+
+    def _record(self, job, event_type, data):
+        job.events.append((event_type, dict(data, job_id=job.id)))
+        self._cond.notify_all()
+
+    def _finish(self, job, state, message):
+        job.state = state
+        job.message = message
+        job.finished_at = datetime.now(timezone.utc)
+        job.finished_monotonic = time.monotonic()
+        # 원문은 더 이상 필요 없음
+        job.text = None
+        event_type = {DONE: 'done', FAILED: 'error', CANCELLED: 'cancelled'}[state]
+        self._record(job, event_type, job.to_dict())
+
+    def _purge(self):
+        cutoff = time.monotonic() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished_monotonic is not None and job.finished_monotonic < cutoff]:
+            del self._jobs[job_id]
+
+    def _ensure_workers(self):
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            job_id = self._pending.get()
+            with self._cond:
+                job = self._jobs.get(job_id)
+                if job is None or job.state != QUEUED:
+                    continue
+                job.state = RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                self._record(job, 'status', job.to_dict())
+                text, backend = job.text, job.backend
+
+            try:
+                self._run(job, text, backend)
+            except Exception as e:
+                with self._cond:
+                    self._finish(job, FAILED, f"❗ 회의록 정리 실패: {str(e)}")
+
+    def _run(self, job, text, backend):
+        events = self.runner(text, backend=backend, cancelled=lambda: job.cancel_requested)
+        try:
+            for event_type, data in events:
+                with self._cond:
+                    if job.cancel_requested:
+                        self._finish(job, CANCELLED, '❗ 회의록 정리가 취소되었습니다.')
+                        return
+                    if event_type == 'token':
+                        job.parts.append(data['text'])
+                        self._record(job, 'token', data)
+                    elif event_type == 'done':
+                        job.served_backend = data.get('backend')
+                        self._finish(job, DONE, data['message'])
+                    elif event_type == 'error':
+                        self._finish(job, FAILED, data['message'])
+            with self._cond:
+                if job.state == RUNNING:
+                    self._finish(job, DONE, "".join(job.parts).strip())
+        finally:
+            # 취소 시 진행 중인 LLM 스트림 연결을 닫음
+            events.close()
+
+
+meeting_jobs = MeetingJobQueue()
@@ -0,0 +1,110 @@
+# meeting_list.py
+"""
+회의록 목록 조회 (키셋 페이지네이션).
+
+OFFSET 대신 마지막으로 본 (created_at, id)를 커서로 넘겨
+ix_meetings_created_at_id 인덱스에서 바로 다음 행을 읽으므로 몇 번째 페이지든
+비용이 같습니다. 목록에 필요한 컬럼(제목/분류/태그/날짜/미리보기)만 읽고,
+전체 개수는 통계 기반 추정치를 캐시해서 사용합니다.
+"""
+
+import base64
+import os
+from datetime import datetime
+
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import load_only
+
+from calendar_cache import TTLCache
+from config.database import SessionLocal
+from models.meeting import Meeting
+
+MEETINGS_PER_PAGE = 9
+# 이 수보다 적으면 추정치 대신 정확히 셈
+MEETING_EXACT_COUNT_LIMIT = 10000
+MEETING_COUNT_TTL = int(os.getenv('MEETING_COUNT_TTL', '60'))
+
+# 태그는 Meeting.tags 관계(selectin)로 페이지 단위 한 번에 불러옴
+LIST_COLUMNS = (Meeting.id, Meeting.title, Meeting.category, Meeting.created_at, Meeting.preview)
+
+_count_cache = TTLCache(ttl=MEETING_COUNT_TTL, stale_ttl=MEETING_COUNT_TTL * 10, max_entries=4)
+
+
+def encode_cursor(meeting):
+    raw = f"{meeting.created_at.isoformat()}|{meeting.id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서를 (created_at, id)로 되돌립니다. 잘못된 커서면 None."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        created_at, meeting_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(meeting_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def list_meetings(db, after=None, before=None, per_page=MEETINGS_PER_PAGE, filters=()):
+    """최신순 회의록 한 페이지를 반환합니다.
+
+    after: 이 커서보다 오래된 회의록 (다음 페이지)
+    before: 이 커서보다 최근 회의록 (이전 페이지)
+
+    Returns:
+        dict: {'meetings', 'next_cursor', 'prev_cursor'} (해당 방향에 더 없으면 커서는 None)
+    """
+    key = tuple_(Meeting.created_at, Meeting.id)
+    query = db.query(Meeting).options(load_only(*LIST_COLUMNS)).filter(*filters)
+
+    before_key = decode_cursor(before)
+    after_key = decode_cursor(after)
+    if before_key:
+        # 이전 페이지는 오름차순으로 읽은 뒤 뒤집음
+        rows = query.filter(key > tuple_(*before_key)) \
+            .order_by(Meeting.created_at.asc(), Meeting.id.asc()) \
+            .limit(per_page + 1) \
+            .all()
+        has_newer = len(rows) > per_page
+        meetings = list(reversed(rows[:per_page]))
+        has_older = True
+    else:
+        if after_key:
+            query = query.filter(key < tuple_(*after_key))
+        rows = query.order_by(Meeting.created_at.desc(), Meeting.id.desc()) \
+            .limit(per_page + 1) \
+            .all()
+        has_older = len(rows) > per_page
+        meetings = rows[:per_page]
+        has_newer = after_key is not None
+
+    return {
+        'meetings': meetings,
+        'next_cursor': encode_cursor(meetings[-1]) if meetings and has_older else None,
+        'prev_cursor': encode_cursor(meetings[0]) if meetings and has_newer else None
+    }
+
+
+def _load_meeting_count():
+    db = SessionLocal()
+    try:
+        # ANALYZE/autovacuum이 갱신하는 행 수 추정치 (테이블을 읽지 않음)
+        estimate = db.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = 'meetings'::regclass"
+        )).scalar()
+        if estimate is None or estimate < MEETING_EXACT_COUNT_LIMIT:
+            return db.query(Meeting.id).count()
+        return int(estimate)
+    finally:
+        db.close()
+
+
+def meeting_count():
+    """전체 회의록 수 (작으면 정확한 값, 크면 추정치, MEETING_COUNT_TTL초 캐시)."""
+    return _count_cache.get_or_load(('meetings',), _load_meeting_count)
+
+
+def invalidate_meeting_count():
+    _count_cache.invalidate()
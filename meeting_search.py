@@ -0,0 +1,139 @@
+# meeting_search.py
+"""
+저장된 회의록 전문 검색.
+
+검색어의 각 단어를 조사/어미를 뗀 접두어로 바꿔 저장된 search_vector 컬럼의 GIN 인덱스에서
+찾고 ('예산을' → '예산:*'는 '예산은', '예산안'과도 일치), 세 글자 이상 검색어는
+제목+정리본 trigram 인덱스로 단어 중간 일치('마케팅예산' 안의 '팅예산')도 찾습니다.
+결과는 저장된 tsvector로 계산한 ts_rank_cd 점수 순이며, 다음 페이지는 OFFSET 대신 마지막으로 본 (점수, id)
+커서로 이어서 읽습니다. 스니펫(ts_headline)은 반환할 행에만 계산합니다.
+"""
+
+import base64
+import re
+from html import escape
+
+from sqlalchemy import REAL, cast, func, or_, tuple_
+
+from extractive import WORD, strip_suffix
+from meeting_tags import tag_names_for
+from models.meeting import Meeting
+
+SEARCH_CONFIG = 'simple'
+SEARCH_MAX_RESULTS = 50
+# trigram 인덱스는 세 글자 이상에서만 쓸 수 있음
+TRGM_MIN_CHARS = 3
+# ts_headline 강조 표시 (HTML 이스케이프 후 <mark>로 바꾸기 위한 임시 문자)
+MARK_START = '\ue000'
+MARK_END = '\ue001'
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_END}, "
+    "MaxWords=25, MinWords=8, MaxFragments=2, FragmentDelimiter=\" … \""
+)
+LIKE_SPECIAL = re.compile(r'([\\%_])')
+
+
+def build_tsquery(query):
+    """검색어를 to_tsquery 식으로 바꿉니다 (모든 단어의 접두어 일치, 없으면 '')."""
+    terms = []
+    for word in WORD.findall(query.lower()):
+        word = strip_suffix(word)
+        if word and word not in terms:
+            terms.append(word)
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_text():
+    """trigram 인덱스와 같은 식 (마이그레이션 8c3d7f1a2b6e 참고)."""
+    return func.coalesce(Meeting.title, '') + ' ' + func.coalesce(Meeting.summarized_content, '')
+
+
+def encode_cursor(rank, meeting_id):
+    raw = f"{rank!r}|{meeting_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서를 (점수, id)로 되돌립니다. 잘못된 커서면 None."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        rank, meeting_id = raw.rsplit('|', 1)
+        return float(rank), int(meeting_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def highlight(snippet):
+    """ts_headline 결과를 HTML 이스케이프하고 일치 부분을 <mark>로 감쌉니다."""
+    return escape(snippet or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def search_meetings(db, query, limit=20, after=None):
+    """회의록을 검색합니다.
+
+    after: 이전 페이지의 next_cursor (이 결과보다 점수가 낮은 결과부터)
+
+    Returns:
+        dict: {'results': [...], 'has_more': bool, 'next_cursor': str | None}
+        (정확한 전체 개수는 세지 않고 limit + 1개를 읽어 다음 페이지 여부만 확인)
+    """
+    query = (query or '').strip()
+    limit = max(1, min(limit, SEARCH_MAX_RESULTS))
+    tsquery_text = build_tsquery(query)
+    use_trgm = len(query) >= TRGM_MIN_CHARS
+    if not tsquery_text and not use_trgm:
+        return {'results': [], 'has_more': False, 'next_cursor': None}
+
+    tsquery = func.to_tsquery(SEARCH_CONFIG, tsquery_text)
+    conditions = []
+    if tsquery_text:
+        conditions.append(Meeting.search_vector.op('@@')(tsquery))
+    if use_trgm:
+        pattern = LIKE_SPECIAL.sub(r'\\\1', query)
+        conditions.append(search_text().ilike(f"%{pattern}%"))
+
+    rank = func.ts_rank_cd(Meeting.search_vector, tsquery) if tsquery_text else func.similarity(search_text(), query)
+    # 1단계: 인덱스로 후보를 찾아 순위만 계산 (저장된 search_vector를 읽으므로 원문으로
+    # tsvector를 다시 만들지 않음, 스니펫은 아직 계산하지 않음)
+    candidates = db.query(Meeting.id.label('id'), rank.label('rank')).filter(or_(*conditions))
+    after_key = decode_cursor(after)
+    if after_key:
+        # 점수는 real이므로 커서 값도 real로 비교해야 같은 점수가 정확히 일치
+        candidates = candidates.filter(tuple_(rank, Meeting.id) < tuple_(cast(after_key[0], REAL), after_key[1]))
+    page = (
+        candidates
+        .order_by(rank.desc(), Meeting.id.desc())
+        .limit(limit + 1)
+        .subquery()
+    )
+
+    # 2단계: 반환할 행에만 스니펫 계산
+    snippet_source = func.coalesce(Meeting.summarized_content, Meeting.original_content, '')
+    snippet = (
+        func.ts_headline(SEARCH_CONFIG, snippet_source, tsquery, HEADLINE_OPTIONS) if tsquery_text
+        else func.left(snippet_source, 200)
+    )
+    rows = (
+        db.query(Meeting.id, Meeting.title, Meeting.category, Meeting.created_at,
+                 page.c.rank, snippet.label('snippet'))
+        .join(page, page.c.id == Meeting.id)
+        .order_by(page.c.rank.desc(), Meeting.id.desc())
+        .all()
+    )
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(float(rows[-1].rank or 0), rows[-1].id) if has_more else None
+    tags = tag_names_for(db, [row.id for row in rows])
+    results = [{
+        'id': row.id,
+        'title': row.title,
+        'category': row.category,
+        'tags': tags[row.id],
+        'created_at': row.created_at.isoformat() if row.created_at else None,
+        'rank': round(float(row.rank or 0), 4),
+        'snippet': highlight(row.snippet)
+    } for row in rows]
+    return {'results': results, 'has_more': has_more, 'next_cursor': next_cursor}
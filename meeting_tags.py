@@ -0,0 +1,134 @@
+# meeting_tags.py
+"""
+회의록 태그 (정규화된 tags / meeting_tags 테이블).
+
+태그 필터는 meeting_tags의 (tag_id, meeting_id) 인덱스에서 회의록 id를 찾고,
+태그별 개수(facet)는 회의록을 저장/삭제할 때 갱신하는 tags.usage_count를
+(usage_count DESC, name) 인덱스로 읽어 TTL 캐시에 보관합니다 (집계 쿼리 없음).
+"""
+
+import os
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from calendar_cache import TTLCache
+from config.database import SessionLocal
+from models.meeting import Meeting, Tag, TAG_MAX_CHARS, meeting_tag_links
+
+MEETING_TAG_FACET_TTL = int(os.getenv('MEETING_TAG_FACET_TTL', '60'))
+MEETING_TAG_FACET_LIMIT = 100
+# 한 번에 필터할 수 있는 최대 태그 수
+MEETING_TAG_FILTER_LIMIT = 10
+
+_facet_cache = TTLCache(ttl=MEETING_TAG_FACET_TTL, stale_ttl=MEETING_TAG_FACET_TTL * 10, max_entries=4)
+
+
+def normalize_tag(name):
+    """앞뒤 공백과 '#'을 떼고 소문자로 (마이그레이션의 백필 SQL과 같은 규칙)."""
+    return (name or '').strip().lstrip('#').strip().lower()[:TAG_MAX_CHARS]
+
+
+def parse_tags(value):
+    """'a, b' 문자열 또는 문자열 목록을 중복 없는 정규화된 태그 목록으로 (문자열이 아닌 항목은 무시)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, (list, tuple)):
+        return []
+    names = []
+    for item in value:
+        if not isinstance(item, str):
+            continue
+        for name in item.split(','):
+            name = normalize_tag(name)
+            if name and name not in names:
+                names.append(name)
+    return names
+
+
+def get_or_create_tags(db, names):
+    """새 회의록 하나에 붙일 Tag를 (없으면 만들어) 이름 순서대로 반환합니다.
+
+    각 태그의 usage_count를 1 올리므로 회의록과 같은 트랜잭션에서 커밋해야 합니다.
+    """
+    names = parse_tags(names)
+    if not names:
+        return []
+    # 동시에 같은 태그를 만들어도 충돌하지 않도록 한 문장으로 만들거나 개수를 올림
+    stmt = insert(Tag).values([{'name': name, 'usage_count': 1} for name in names])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=['name'],
+        set_={'usage_count': Tag.__table__.c.usage_count + 1}
+    ))
+    tags = {tag.name: tag for tag in db.query(Tag).filter(Tag.name.in_(names))}
+    return [tags[name] for name in names]
+
+
+def release_tags(db, tags):
+    """회의록을 삭제하기 전에 붙어 있던 태그의 usage_count를 1 내립니다."""
+    tag_ids = [tag.id for tag in tags]
+    if not tag_ids:
+        return
+    db.query(Tag).filter(Tag.id.in_(tag_ids)) \
+        .update({Tag.usage_count: Tag.usage_count - 1}, synchronize_session=False)
+
+
+def tag_filter(names):
+    """모든 태그가 붙은 회의록만 남기는 필터 식 (태그가 없으면 None).
+
+    Raises:
+        ValueError: 태그가 MEETING_TAG_FILTER_LIMIT개보다 많은 경우
+            (일부만 적용하면 요청보다 넓은 결과가 나오므로 거부)
+    """
+    names = parse_tags(names)
+    if len(names) > MEETING_TAG_FILTER_LIMIT:
+        raise ValueError(f"태그는 최대 {MEETING_TAG_FILTER_LIMIT}개까지 함께 필터할 수 있습니다.")
+    if not names:
+        return None
+    matching = (
+        select(meeting_tag_links.c.meeting_id)
+        .join(Tag, Tag.id == meeting_tag_links.c.tag_id)
+        .where(Tag.name.in_(names))
+        .group_by(meeting_tag_links.c.meeting_id)
+        .having(func.count() == len(names))
+    )
+    return Meeting.id.in_(matching)
+
+
+def tag_names_for(db, meeting_ids):
+    """{회의록 id: [태그 이름, ...]} (목록 전체를 한 번의 쿼리로)."""
+    result = {meeting_id: [] for meeting_id in meeting_ids}
+    if not meeting_ids:
+        return result
+    rows = db.query(meeting_tag_links.c.meeting_id, Tag.name) \
+        .join(Tag, Tag.id == meeting_tag_links.c.tag_id) \
+        .filter(meeting_tag_links.c.meeting_id.in_(meeting_ids)) \
+        .order_by(Tag.name) \
+        .all()
+    for meeting_id, name in rows:
+        result[meeting_id].append(name)
+    return result
+
+
+def _load_tag_facets():
+    db = SessionLocal()
+    try:
+        rows = db.query(Tag.name, Tag.usage_count) \
+            .filter(Tag.usage_count > 0) \
+            .order_by(Tag.usage_count.desc(), Tag.name) \
+            .limit(MEETING_TAG_FACET_LIMIT) \
+            .all()
+        return [{'name': name, 'count': count} for name, count in rows]
+    finally:
+        db.close()
+
+
+def tag_facets(limit=MEETING_TAG_FACET_LIMIT):
+    """태그별 회의록 수 (많은 순 최대 MEETING_TAG_FACET_LIMIT개, MEETING_TAG_FACET_TTL초 캐시)."""
+    return _facet_cache.get_or_load(('facets',), _load_tag_facets)[:limit]
+
+
+def invalidate_tag_facets():
+    _facet_cache.invalidate()
@@ -0,0 +1,206 @@
+# metrics.py
+"""
+LLM 호출/요약 캐시/요약 백엔드 대체 계측 (Prometheus 텍스트 형식 + 구조화 로그).
+
+외부 의존성 없이 카운터/히스토그램만 구현하며, /metrics 엔드포인트가
+render()의 결과를 그대로 반환합니다. LLM 호출마다 JSON 한 줄 로그를
+'llm' 로거로 남깁니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+# 모델별 1K 토큰당 가격 (USD, 입력/출력). LLM_MODEL_PRICES='{"모델": [입력, 출력]}'로 덮어쓰기
+MODEL_PRICES = {
+    'gpt-3.5-turbo': (0.0005, 0.0015),
+    'gpt-4o-mini': (0.00015, 0.0006),
+}
+MODEL_PRICES.update({
+    model: tuple(prices) for model, prices in json.loads(os.getenv('LLM_MODEL_PRICES', '{}')).items()
+})
+
+# 지연 시간 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 60)
+
+llm_logger = logging.getLogger('llm')
+if not llm_logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    llm_logger.addHandler(_handler)
+    llm_logger.setLevel(os.getenv('LLM_LOG_LEVEL', 'INFO'))
+    llm_logger.propagate = False
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self._values = {}        # key -> [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                for bound, count in zip(self.buckets, state):
+                    le = (('le', _format_value(bound if bound == float('inf') else float(bound))),)
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(state[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {state[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+llm_requests = registry.register(Counter(
+    'llm_requests_total', 'LLM 호출 수 (결과별)', ('operation', 'model', 'outcome')))
+llm_errors = registry.register(Counter(
+    'llm_errors_total', 'LLM 호출 실패 수 (예외 종류별)', ('operation', 'model', 'error')))
+llm_latency = registry.register(Histogram(
+    'llm_request_duration_seconds', 'LLM 호출 시간 (대기/재시도 포함)', ('operation', 'model')))
+llm_first_token = registry.register(Histogram(
+    'llm_time_to_first_token_seconds', '스트리밍 호출의 첫 토큰까지 시간', ('operation', 'model')))
+llm_prompt_tokens = registry.register(Counter(
+    'llm_prompt_tokens_total', '입력 토큰 수 (resp.usage)', ('operation', 'model')))
+llm_completion_tokens = registry.register(Counter(
+    'llm_completion_tokens_total', '출력 토큰 수 (resp.usage)', ('operation', 'model')))
+llm_cost = registry.register(Counter(
+    'llm_cost_usd_total', '추정 비용 (USD, MODEL_PRICES 기준)', ('operation', 'model')))
+llm_retries = registry.register(Counter(
+    'llm_retries_total', '429/5xx/연결 오류로 인한 재시도 수', ('operation', 'model')))
+llm_throttled = registry.register(Counter(
+    'llm_throttled_seconds_total', '속도 제한으로 대기한 시간', ('operation', 'model')))
+llm_deduplicated = registry.register(Counter(
+    'llm_deduplicated_total', '진행 중인 같은 요청과 합쳐진 호출 수', ('operation', 'model')))
+cache_lookups = registry.register(Counter(
+    'summary_cache_lookups_total', '요약 캐시 조회 수 (결과별)', ('kind', 'result')))
+summarizer_fallbacks = registry.register(Counter(
+    'summarizer_fallbacks_total', 'auto 백엔드가 대체 백엔드로 요약한 수 (사용 불가 또는 예외 종류별)',
+    ('method', 'primary', 'fallback', 'reason')))
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    prices = MODEL_PRICES.get(model)
+    if not prices:
+        return 0.0
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1000
+
+
+def record_llm_call(operation, model, started, usage=None, error=None, first_token_at=None,
+                    attempts=1, stream=False):
+    """LLM 호출 하나의 결과를 메트릭과 구조화 로그로 남깁니다.
+
+    started/first_token_at은 time.monotonic() 값, usage는 resp.usage (없으면 None).
+    """
+    duration = time.monotonic() - started
+    prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+    completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+
+    labels = {'operation': operation, 'model': model}
+    llm_requests.inc(outcome='error' if error else 'success', **labels)
+    llm_latency.observe(duration, **labels)
+    if first_token_at is not None:
+        llm_first_token.observe(first_token_at - started, **labels)
+    if error:
+        llm_errors.inc(error=type(error).__name__, **labels)
+    if usage is not None:
+        llm_prompt_tokens.inc(prompt_tokens, **labels)
+        llm_completion_tokens.inc(completion_tokens, **labels)
+        llm_cost.inc(cost, **labels)
+
+    record = {
+        'event': 'llm_call',
+        'operation': operation,
+        'model': model,
+        'stream': stream,
+        'outcome': 'error' if error else 'success',
+        'duration_ms': round(duration * 1000, 1),
+        'attempts': attempts,
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'cost_usd': round(cost, 6)
+    }
+    if first_token_at is not None:
+        record['first_token_ms'] = round((first_token_at - started) * 1000, 1)
+    if error:
+        record['error'] = type(error).__name__
+        record['error_message'] = str(error)[:200]
+    llm_logger.log(logging.WARNING if error else logging.INFO, json.dumps(record, ensure_ascii=False))
+
+
+def render():
+    return registry.render()
@@ -1,10 +1,44 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, ForeignKey, Table, FetchedValue
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship, validates
 from sqlalchemy.sql import func
 from config.database import Base
 import pytz
 
 seoul_tz = pytz.timezone('Asia/Seoul')
 
+# 목록 화면에 보여줄 정리본 미리보기 길이(문자)
+PREVIEW_CHARS = 200
+
+# 태그 이름 최대 길이(문자)
+TAG_MAX_CHARS = 50
+
+def make_preview(text):
+    """공백을 한 칸으로 줄인 앞부분 (마이그레이션의 백필 SQL과 같은 규칙)."""
+    return " ".join((text or '').split())[:PREVIEW_CHARS]
+
+# 회의록-태그 연결 (태그로 회의록을 찾을 때는 (tag_id, meeting_id) 인덱스 사용)
+meeting_tag_links = Table(
+    "meeting_tags",
+    Base.metadata,
+    Column('meeting_id', Integer, ForeignKey('meetings.id', ondelete='CASCADE'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_meeting_tags_tag_id_meeting_id', 'tag_id', 'meeting_id')
+)
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    # meeting_tags.normalize_tag로 정규화된 이름
+    name = Column(String(TAG_MAX_CHARS), unique=True, nullable=False)
+    # 이 태그가 붙은 회의록 수 (meeting_tags.get_or_create_tags/release_tags가 갱신, 태그 facet에 사용)
+    usage_count = Column(Integer, nullable=False, default=0, server_default='0')
+
+    __table_args__ = (
+        Index('ix_tags_usage_count_name', usage_count.desc(), name),
+    )
+
 class Meeting(Base):
     __tablename__ = "meetings"
 
@@ -12,7 +46,21 @@ class Meeting(Base):
     title = Column(String, index=True)
     original_content = Column(Text)
     summarized_content = Column(Text)
+    preview = Column(String(PREVIEW_CHARS))
     category = Column(String, default='auto')
-    tags = Column(String, nullable=True)
+    tags = relationship(Tag, secondary=meeting_tag_links, lazy='selectin', order_by=Tag.name, passive_deletes=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 전문 검색용 tsvector (제목 > 정리본 > 원문 순 가중치). 제목/본문이 바뀌면
+    # meetings_search_vector_update 트리거가 채움 (마이그레이션 8c3d7f1a2b6e)
+    search_vector = deferred(Column(TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue()))
+
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at DESC, id DESC)
+        Index('ix_meetings_created_at_id', created_at.desc(), id.desc()),
+    )
+
+    @validates('summarized_content')
+    def _update_preview(self, key, value):
+        self.preview = make_preview(value)
+        return value
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from config.database import Base
+
+class SummaryCacheEntry(Base):
+    __tablename__ = "summary_cache"
+
+    # sha256(model, prompt, 추출된 본문)
+    key = Column(String(64), primary_key=True)
+    kind = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    summary = Column(Text, nullable=False)
+    size = Column(Integer, nullable=False, default=0)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
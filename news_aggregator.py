@@ -0,0 +1,222 @@
+# news_aggregator.py
+
+import calendar
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from feed_fetcher import entry_guid, feed_fetcher
+from news_briefing import NEWS_SUMMARY_WORKERS, SUMMARY_FAILED, format_article, stream_articles, summarize_articles
+
+# "이름|URL" 을 쉼표로 구분 (이름 생략 시 URL의 호스트를 이름으로 사용)
+NEWS_FEEDS = os.getenv('NEWS_FEEDS', 'ZDNet Korea|https://feeds.feedburner.com/zdkorea')
+# 피드 확인 주기(초)
+NEWS_REFRESH_INTERVAL = int(os.getenv('NEWS_REFRESH_INTERVAL', '600'))
+# 피드마다 확인할 최신 기사 수
+NEWS_FEED_LIMIT = int(os.getenv('NEWS_FEED_LIMIT', '10'))
+# 저장소에 보관할 최대 기사 수
+NEWS_MAX_ARTICLES = int(os.getenv('NEWS_MAX_ARTICLES', '200'))
+# 브리핑(/summarize)에 포함할 기사 수
+NEWS_BRIEFING_SIZE = int(os.getenv('NEWS_BRIEFING_SIZE', '5'))
+
+
+def parse_feed_config(value):
+    """NEWS_FEEDS 문자열을 [{'name', 'url'}, ...]로 변환합니다."""
+    feeds = []
+    for item in value.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, url = item.rpartition('|')
+        url = url.strip()
+        feeds.append({'name': name.strip() or urlsplit(url).netloc, 'url': url})
+    return feeds
+
+
+def _link_key(link):
+    # 스킴, www, 쿼리(utm 등), 끝 슬래시 차이는 같은 기사로 취급
+    parts = urlsplit(link or '')
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"{host}{parts.path.rstrip('/')}" if host else None
+
+
+def _title_key(title):
+    key = re.sub(r'\W+', '', (title or '').lower())
+    return key or None
+
+
+def _published_ts(entry):
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return calendar.timegm(parsed) if parsed else 0
+
+
+class NewsAggregator:
+    """여러 RSS 피드를 주기적으로 확인해 기사 요약을 미리 만들어 두는 집계기.
+
+    피드 간 중복 기사(같은 링크 또는 같은 제목)는 한 번만 요약하며,
+    /summarize와 /news는 저장된 결과를 바로 반환하고 새로고침은
+    백그라운드 스레드가 처리합니다.
+    """
+
+    def __init__(self, feeds, fetcher=feed_fetcher, interval=NEWS_REFRESH_INTERVAL,
+                 per_feed_limit=NEWS_FEED_LIMIT, max_articles=NEWS_MAX_ARTICLES,
+                 max_workers=NEWS_SUMMARY_WORKERS):
+        self.feeds = feeds
+        self.fetcher = fetcher
+        self.interval = interval
+        self.per_feed_limit = per_feed_limit
+        self.max_articles = max_articles
+        self.max_workers = max_workers
+        self._articles = OrderedDict()   # 중복 제거 키 -> 기사 (본문 없는 기사는 None)
+        self._aliases = {}               # 링크/제목 키 -> 중복 제거 키
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.updated_at = None
+        self.errors = {}
+
+    def ensure_started(self):
+        """백그라운드 갱신 스레드를 (처음 호출될 때) 시작합니다."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def trigger_refresh(self):
+        """기다리지 않고 다음 갱신을 즉시 시작하도록 요청합니다."""
+        self.ensure_started()
+        self._wakeup.set()
+
+    @property
+    def refreshing(self):
+        return self._refresh_lock.locked()
+
+    def refresh(self):
+        """모든 피드를 확인하고 새 기사만 요약합니다. 이미 갱신 중이면 False."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            pending = []
+            errors = {}
+            for feed in self.feeds:
+                try:
+                    entries = self.fetcher.fetch(feed['url'])['entries'][:self.per_feed_limit]
+                except Exception as e:
+                    print(f"❗ 피드 확인 실패 ({feed['name']}): {str(e)}")
+                    errors[feed['name']] = str(e)
+                    continue
+                for entry in entries:
+                    key = self._claim(entry, pending)
+                    if key:
+                        pending.append((key, feed, entry))
+
+            if pending:
+                articles = summarize_articles(
+                    [entry for _, _, entry in pending], max_workers=self.max_workers
+                )
+                for (key, feed, entry), article in zip(pending, articles):
+                    if article:
+                        article.update({
+                            'id': key,
+                            'source': feed['name'],
+                            'category': feed['name'],
+                            'image_url': None,
+                            'published_ts': _published_ts(entry)
+                        })
+                self._store(pending, articles)
+
+            with self._lock:
+                self.errors = errors
+                self.updated_at = datetime.now(timezone.utc).isoformat()
+            return True
+        finally:
+            self._refresh_lock.release()
+
+    def articles(self, limit=None):
+        """최신순 기사 목록 (본문이 없어 요약하지 못한 기사는 제외)."""
+        with self._lock:
+            articles = [article for article in self._articles.values() if article]
+        articles.sort(key=lambda article: article['published_ts'], reverse=True)
+        return articles[:limit] if limit else articles
+
+    def latest(self, limit=NEWS_BRIEFING_SIZE):
+        """미리 만들어 둔 브리핑과 갱신 상태를 반환합니다."""
+        articles = self.articles(limit)
+        with self._lock:
+            return {
+                'summary': "\n".join(format_article(article) for article in articles),
+                'articles': articles,
+                'updated_at': self.updated_at,
+                'refreshing': self.refreshing,
+                'errors': dict(self.errors)
+            }
+
+    def stream_latest(self, limit=NEWS_BRIEFING_SIZE, backend=None):
+        """브리핑을 SSE 이벤트 (종류, 데이터)로 yield합니다.
+
+        미리 만든 브리핑이 있으면 바로 보내고, 아직 없으면(첫 갱신 전) 첫 피드의
+        기사를 직접 요약하면서 토큰 단위로 보냅니다. 요약 결과는 요약 캐시에
+        남으므로 이어지는 백그라운드 갱신은 다시 요청하지 않습니다.
+        backend를 지정하면(예: 'extractive' 미리보기) 저장된 브리핑 대신 그
+        백엔드로 바로 요약합니다.
+        """
+        articles = self.articles(limit) if backend is None else []
+        if articles:
+            for index, article in enumerate(articles):
+                yield 'article', {
+                    'index': index,
+                    'title': article['title'],
+                    'link': article['link'],
+                    'published_date': article['published_date']
+                }
+                yield 'token', {'index': index, 'text': article['summary']}
+                yield 'article_done', {'index': index, 'summary': article['summary']}
+        elif self.feeds:
+            entries = self.fetcher.fetch(self.feeds[0]['url'])['entries'][:limit]
+            yield from stream_articles(entries, backend=backend)
+        yield 'done', {'updated_at': self.updated_at}
+
+    def _claim(self, entry, pending):
+        """처음 보는 기사면 중복 제거 키를 반환합니다 (이미 있거나 이번에 대기 중이면 None)."""
+        aliases = [k for k in (_link_key(entry.get('link')), _title_key(entry.get('title'))) if k]
+        key = entry_guid(entry)
+        with self._lock:
+            if key in self._articles or any(alias in self._aliases for alias in aliases):
+                return None
+            if any(key == claimed for claimed, _, _ in pending):
+                return None
+            for alias in aliases:
+                self._aliases[alias] = key
+        return key
+
+    def _store(self, pending, articles):
+        with self._lock:
+            for (key, _, entry), article in zip(pending, articles):
+                if article is False or (article and article['summary'] == SUMMARY_FAILED):
+                    # 다음 갱신 때 다시 시도하도록 중복 제거 키를 되돌림
+                    for alias in [k for k, v in self._aliases.items() if v == key]:
+                        del self._aliases[alias]
+                    continue
+                self._articles[key] = article
+            while len(self._articles) > self.max_articles:
+                key, _ = self._articles.popitem(last=False)
+                for alias in [k for k, v in self._aliases.items() if v == key]:
+                    del self._aliases[alias]
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"❗ 뉴스 갱신 실패: {str(e)}")
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+
+news_aggregator = NewsAggregator(parse_feed_config(NEWS_FEEDS))
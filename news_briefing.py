@@ -1,46 +1,172 @@
-import feedparser
-from bs4 import BeautifulSoup
-from summarizer import summarize_text
-
-def extract_main_text_from_html(html):
-    soup = BeautifulSoup(html, 'html.parser')
-    # ZDNet의 content:encoded는 <p>, <img>, <br> 등 포함
-    paragraphs = soup.find_all("p")
-    text = "\n".join(p.get_text(strip=True) for p in paragraphs)
-    return text.strip()
-
-def fetch_and_summarize_rss(rss_url, limit=5):
-    feed = feedparser.parse(rss_url)
-    print(f"총 {len(feed.entries)}개 기사 발견됨\n")
-    result = []
-
-    for entry in feed.entries[:limit]:
-        title = entry.title
-        link = entry.link
-        print(f"📰 {title} → 요약 중...")
-
-        html_content = ""
-        if 'content' in entry and entry.content:
-            html_content = entry.content[0].value
-        elif 'summary' in entry:
-            html_content = entry.summary
-
-        content = extract_main_text_from_html(html_content)
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from feed_fetcher import entry_guid, feed_fetcher
+from html_text import clean_article_text, extract_paragraphs
+from summarizer import stream_summarize_text, summarize_batch, summarize_text
+
+# 기사 요약을 동시에 처리할 최대 개수
+NEWS_SUMMARY_WORKERS = int(os.getenv('NEWS_SUMMARY_WORKERS', '5'))
+# 'batch': 여러 기사를 한 요청으로 요약, 'single': 기사마다 한 요청
+NEWS_SUMMARY_MODE = os.getenv('NEWS_SUMMARY_MODE', 'batch')
+# GUID별로 기억해 둘 처리 결과 수
+NEWS_ENTRY_MEMO_SIZE = 500
+SUMMARY_FAILED = "(요약을 가져오지 못했습니다.)"
+
+# (백엔드, guid) -> format_article 결과 (이미 처리한 기사는 다시 추출/요약하지 않음)
+_entry_results = OrderedDict()
+_entry_results_lock = threading.Lock()
+
+def extract_entry_text(entry):
+    """기사 본문 문단을 추출하고 상투 문구 제거/길이 제한을 적용합니다."""
+    html_content = ""
+    if 'content' in entry and entry.content:
+        html_content = entry.content[0].value
+    elif 'summary' in entry:
+        html_content = entry.summary
+    return clean_article_text(extract_paragraphs(html_content))
+
+def _article(entry, summary):
+    return {
+        'title': entry.title,
+        'link': entry.link,
+        'summary': summary,
+        'published_date': entry.get('published', '')
+    }
+
+def summarize_article(entry, backend=None):
+    """기사 하나를 본문 추출 → 요약하여 dict로 반환합니다.
+
+    본문이 없으면 None을 반환하고, 요약에 실패하면 summary에 SUMMARY_FAILED를 넣습니다.
+    """
+    print(f"📰 {entry.title} → 요약 중...")
+
+    content = extract_entry_text(entry)
+    if not content:
+        print(f"❗ 본문 없음, 건너뜀\n")
+        return None
+
+    try:
+        summary = summarize_text(content, backend=backend)
+    except Exception as e:
+        print(f"❗ 요약 실패: {e}\n")
+        summary = SUMMARY_FAILED
+
+    return _article(entry, summary)
+
+def summarize_articles(entries, mode=NEWS_SUMMARY_MODE, max_workers=NEWS_SUMMARY_WORKERS, backend=None):
+    """여러 기사를 요약하여 entries와 같은 순서의 목록으로 반환합니다.
+
+    각 항목은 summarize_article과 같고, 처리 중 예외가 난 기사는 False입니다.
+    batch 모드에서는 본문을 모두 추출한 뒤 summarize_batch로 묶어서 요청합니다.
+    응답 형식 오류는 summarize_batch 안에서 기사별 요약으로 대체되므로, 여기까지
+    올라온 오류(한도 초과/연결/제한 시간 등)는 기사 수만큼 다시 요청하지 않고
+    묶음의 기사를 모두 SUMMARY_FAILED로 표시합니다 (다음 갱신 때 다시 시도).
+    """
+    if not entries:
+        return []
+
+    def process(entry):
+        # 한 기사의 실패가 전체 브리핑을 실패시키지 않도록 격리
+        try:
+            return summarize_article(entry, backend=backend)
+        except Exception as e:
+            print(f"❗ 기사 처리 실패: {e}\n")
+            return False
+
+    if mode == 'batch':
+        contents = [extract_entry_text(entry) for entry in entries]
+        indexes = [i for i, content in enumerate(contents) if content]
+        print(f"📰 기사 {len(indexes)}개 묶음 요약 중...")
+        try:
+            summaries = summarize_batch([contents[i] for i in indexes], backend=backend) if indexes else []
+        except Exception as e:
+            print(f"❗ 묶음 요약 실패: {e}\n")
+            summaries = [SUMMARY_FAILED] * len(indexes)
+        results = [None] * len(entries)
+        for i, summary in zip(indexes, summaries):
+            results[i] = _article(entries[i], summary)
+        return results
+
+    # 기사별 요약을 동시에 실행하되, 결과는 원래 기사 순서대로 모음
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries)))) as executor:
+        return list(executor.map(process, entries))
+
+def stream_articles(entries, backend=None):
+    """기사를 하나씩 요약하면서 토큰이 도착하는 대로 이벤트를 yield합니다.
+
+    Yields:
+        ('article', {'index', 'title', 'link', 'published_date'}) - 기사 요약 시작
+        ('token', {'index', 'text'}) - 요약 조각
+        ('article_done', {'index', 'summary'}) - 기사 요약 완료 (실패 시 SUMMARY_FAILED)
+    본문이 없는 기사는 건너뜁니다.
+    """
+    for index, entry in enumerate(entries):
+        content = extract_entry_text(entry)
         if not content:
-            print(f"❗ 본문 없음, 건너뜀\n")
             continue
+        article = _article(entry, '')
+        del article['summary']
+        yield 'article', dict(article, index=index)
 
+        parts = []
         try:
-            summary = summarize_text(content)
+            for token in stream_summarize_text(content, backend=backend):
+                parts.append(token)
+                yield 'token', {'index': index, 'text': token}
+            summary = "".join(parts).strip()
         except Exception as e:
             print(f"❗ 요약 실패: {e}\n")
-            continue
+            summary = SUMMARY_FAILED
+        yield 'article_done', {'index': index, 'summary': summary}
+
+def format_article(article):
+    return f"📰 {article['title']}\n{article['summary']}\n🔗 {article['link']}\n"
 
-        result.append(f"📰 {title}\n{summary}\n🔗 {link}\n")
+def fetch_and_summarize_rss(rss_url, limit=5, max_workers=NEWS_SUMMARY_WORKERS, backend=None):
+    feed = feed_fetcher.fetch(rss_url)
+    print(f"총 {len(feed['entries'])}개 기사 발견됨 (새 기사 {len(feed['new_entries'])}개"
+          f"{', 변경 없음' if feed['not_modified'] else ''})\n")
+    entries = feed['entries'][:limit]
+    if not entries:
+        return ""
 
-    return "\n".join(result)
+    # 이전에 처리한 기사는 저장된 결과를 쓰고, 새 기사만 추출/요약 (백엔드별로 따로 보관)
+    def memo_key(entry):
+        return (backend, entry_guid(entry))
+
+    with _entry_results_lock:
+        results = {key: _entry_results[key] for key in map(memo_key, entries) if key in _entry_results}
+    pending = [entry for entry in entries if memo_key(entry) not in results]
+
+    if pending:
+        processed = [
+            format_article(article) if article else article
+            for article in summarize_articles(pending, max_workers=max_workers, backend=backend)
+        ]
+
+        with _entry_results_lock:
+            for entry, result in zip(pending, processed):
+                key = memo_key(entry)
+                results[key] = result
+                # 처리/요약에 실패한 기사는 다음 요청에서 다시 시도
+                if result is None or (result and SUMMARY_FAILED not in result):
+                    _entry_results[key] = result
+                    _entry_results.move_to_end(key)
+            while len(_entry_results) > NEWS_ENTRY_MEMO_SIZE:
+                _entry_results.popitem(last=False)
+
+    ordered = [results[memo_key(entry)] for entry in entries]
+    return "\n".join(result for result in ordered if result)
 
 if __name__ == "__main__":
-    rss_url = "http://feeds.feedburner.com/zdkorea"
-    print(fetch_and_summarize_rss(rss_url))
+    import argparse
+
+    parser = argparse.ArgumentParser(description="RSS 뉴스 브리핑")
+    parser.add_argument("--backend", help="요약 백엔드 (openai, extractive, auto)")
+    args = parser.parse_args()
 
+    rss_url = "http://feeds.feedburner.com/zdkorea"
+    print(fetch_and_summarize_rss(rss_url, backend=args.backend))
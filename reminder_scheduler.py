@@ -0,0 +1,172 @@
+# reminder_scheduler.py
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from calendar_stream import calendar_broadcaster
+from calendar_utils import get_events_between
+
+# 단일 사용자 앱이므로 기본 사용자 하나로 관리
+DEFAULT_USER = 'default'
+# /calendar/reminders 폴백 조회용으로 보관할 최근 알림 수
+REMINDER_HISTORY_SIZE = 100
+# 알림을 예약할 일정 조회 범위(분): 지금부터 가장 긴 알림 시간까지
+# (기본값은 Google Calendar가 허용하는 최대 알림 시간인 4주)
+REMINDER_LOOKAHEAD_MINUTES = int(os.getenv('REMINDER_LOOKAHEAD_MINUTES', '40320'))
+# 알림 id = 프로세스 시작 시각(초) * 이 값 + 순번
+# (서버를 재시작해도 id가 이전 실행보다 커서 클라이언트의 after 기준이 유지됨)
+REMINDER_ID_SCALE = 1000000
+
+
+class ReminderScheduler:
+    """일정 알림을 서버에서 예약하고 시간이 되면 한 번만 발송합니다.
+
+    (사용자, 캘린더, 일정, 시작 시간, 알림 분) 단위로 우선순위 큐(heap)에 넣고,
+    백그라운드 스레드 하나가 가장 이른 알림 시각까지 기다렸다가 deliver로
+    전달합니다. 일정이 바뀌거나 삭제되면 큐 항목은 지연 삭제됩니다.
+    """
+
+    def __init__(self, deliver, history_size=REMINDER_HISTORY_SIZE):
+        self.deliver = deliver
+        self._heap = []          # (fire_at, seq, key)
+        self._pending = {}       # key -> (fire_at, reminder)
+        self._fired = {}         # key -> 일정 시작 시각 (시작 후 정리)
+        self._recent = deque(maxlen=history_size)
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        # 이번 실행에서 발송한 알림이 없을 때의 마지막 id
+        self._last_id = int(time.time()) * REMINDER_ID_SCALE
+        self._ids = itertools.count(self._last_id + 1)
+        self._thread = None
+
+    def update_events(self, events, user_id=DEFAULT_USER):
+        """get_events_between 형식의 일정 목록으로 해당 사용자의 예약 알림을 다시 맞춥니다.
+
+        목록에 없는 예약은 취소되므로 events는 지금부터 REMINDER_LOOKAHEAD_MINUTES
+        이내의 일정 전체여야 합니다 (load_reminder_events).
+        """
+        now = datetime.now(timezone.utc)
+        pending = {}
+        for event in events:
+            if not event.get('start_time'):
+                continue
+            start = datetime.fromisoformat(event['start_time'])
+            if start <= now:
+                continue
+            minutes = int(event.get('reminder_minutes') or 10)
+            key = (user_id, event['calendar_id'], event['id'], event['start_time'], minutes)
+            pending[key] = (start - timedelta(minutes=minutes), {
+                'user_id': user_id,
+                'event_id': event['id'],
+                'calendar_id': event['calendar_id'],
+                'title': event.get('title', '제목 없음'),
+                'start_time': event['start_time'],
+                'reminder_minutes': minutes,
+                'tag': f"reminder-{event['calendar_id']}-{event['id']}-{event['start_time']}"
+            })
+
+        with self._cond:
+            for key in [k for k in self._pending if k[0] == user_id and k not in pending]:
+                del self._pending[key]
+            for key, (fire_at, reminder) in pending.items():
+                if key in self._fired or key in self._pending:
+                    continue
+                self._pending[key] = (fire_at, reminder)
+                heapq.heappush(self._heap, (fire_at, next(self._seq), key))
+            # 이미 시작한 일정의 발송 기록은 더 이상 필요 없음
+            for key, start in list(self._fired.items()):
+                if start <= now:
+                    del self._fired[key]
+            self._ensure_thread()
+            self._cond.notify()
+
+    def fire_due(self, now=None):
+        """발송 시각이 지난 알림을 모두 발송하고 목록으로 반환합니다."""
+        now = now or datetime.now(timezone.utc)
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, _, key = heapq.heappop(self._heap)
+                entry = self._pending.get(key)
+                if entry is None or entry[0] != fire_at:
+                    continue
+                del self._pending[key]
+                reminder = dict(entry[1], id=next(self._ids), fired_at=now.isoformat())
+                self._last_id = reminder['id']
+                self._fired[key] = datetime.fromisoformat(reminder['start_time'])
+                self._recent.append(reminder)
+                due.append(reminder)
+
+        for reminder in due:
+            try:
+                self.deliver(reminder)
+            except Exception as e:
+                print(f"알림 발송 실패 ({reminder['title']}): {str(e)}")
+        return due
+
+    def recent(self, after_id=0, user_id=DEFAULT_USER):
+        """after_id 이후에 발송된 알림 목록 (스트림을 쓰지 못하는 클라이언트용)."""
+        with self._cond:
+            return [r for r in self._recent if r['id'] > after_id and r['user_id'] == user_id]
+
+    def latest_id(self):
+        """마지막으로 발송된 알림 id (없으면 이번 실행의 첫 id 바로 앞 값).
+
+        클라이언트가 페이지를 열 때 이 값을 after 기준으로 삼으면 이전에 발송된
+        알림을 다시 표시하지 않습니다.
+        """
+        with self._cond:
+            return self._last_id
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._pending)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # 취소/변경된 항목은 꺼내서 버림
+                while self._heap and self._pending.get(self._heap[0][2], (None,))[0] != self._heap[0][0]:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    timeout = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+                    if timeout > 0:
+                        self._cond.wait(timeout)
+                else:
+                    self._cond.wait()
+            self.fire_due()
+
+
+def load_reminder_events():
+    """지금부터 REMINDER_LOOKAHEAD_MINUTES 이내에 시작하는 모든 일정.
+
+    오늘 일정만 보면 자정 직후 일정이나 알림 시간이 긴 내일 이후 일정의 알림을
+    놓치므로, 가장 긴 알림 시간만큼 앞을 봅니다 (로컬 저장소에서 응답).
+    """
+    now = datetime.now(timezone.utc)
+    return get_events_between(now, now + timedelta(minutes=REMINDER_LOOKAHEAD_MINUTES))
+
+
+def refresh_reminders():
+    """알림 범위의 일정을 다시 읽어 알림을 맞추고, 발송 시각이 된 알림을 발송합니다."""
+    reminder_scheduler.update_events(load_reminder_events())
+    return reminder_scheduler.fire_due()
+
+
+reminder_scheduler = ReminderScheduler(
+    deliver=lambda reminder: calendar_broadcaster.publish('reminder', reminder)
+)
+# 스트림이 일정을 확인할 때마다 (오늘 일정 대신) 알림 범위 전체로 알림 큐를 갱신
+calendar_broadcaster.add_listener(
+    lambda events: reminder_scheduler.update_events(load_reminder_events())
+)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
@@ -6,6 +6,8 @@ from typing import Optional
 
 from config.database import get_db
 from models.meeting import Meeting
+from meeting_list import list_meetings, meeting_count
+from meeting_tags import parse_tags, tag_facets, tag_filter
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
@@ -13,34 +15,36 @@ templates = Jinja2Templates(directory="templates")
 @router.get("/meetings", response_class=HTMLResponse)
 async def meetings_page(
     request: Request,
-    page: int = 1,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
     category: Optional[str] = None,
     tag: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    per_page = 9  # 한 페이지당 보여줄 회의록 수
-    query = db.query(Meeting)
-    
+    filters = []
     if category:
-        query = query.filter(Meeting.category == category)
+        filters.append(Meeting.category == category)
     if tag:
-        query = query.filter(Meeting.tags.contains(tag))
-    
-    total = query.count()
-    total_pages = (total + per_page - 1) // per_page
+        # 쉼표로 여러 태그를 주면 모두 붙은 회의록만
+        try:
+            clause = tag_filter(tag)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if clause is not None:
+            filters.append(clause)
     
-    meetings = query.order_by(Meeting.created_at.desc()) \
-        .offset((page - 1) * per_page) \
-        .limit(per_page) \
-        .all()
+    # 커서 기반 페이지네이션 (OFFSET/전체 count 없이 (created_at, id) 인덱스 사용)
+    page = list_meetings(db, after=after, before=before, filters=filters)
     
     return templates.TemplateResponse("meeting_list.html", {
         "request": request,
-        "meetings": meetings,
-        "page": page,
-        "total_pages": total_pages,
+        "meetings": page["meetings"],
+        "next_cursor": page["next_cursor"],
+        "prev_cursor": page["prev_cursor"],
+        "total": None if filters else meeting_count(),
+        "tag_facets": tag_facets(20),
         "category": category or "",
-        "tag": tag or ""
+        "tag": ",".join(parse_tags(tag))
     })
 
 @router.get("/meeting", response_class=HTMLResponse)
@@ -1,11 +1,22 @@
-from flask import Flask, render_template, jsonify, request, send_from_directory, redirect, url_for
+from flask import Flask, render_template, jsonify, request, send_from_directory, redirect, url_for, Response, stream_with_context
 import os
 from calendar_utils import (
     get_today_events, create_calendar_event, get_calendar_list,
-    update_calendar_event, delete_calendar_event, get_event_details
+    update_calendar_event, delete_calendar_event, get_event_details,
+    get_cache_stats, get_events_in_range, bulk_calendar_operations,
+    BULK_MAX_OPERATIONS, check_conflicts
 )
+from calendar_stream import calendar_broadcaster, format_sse
+from reminder_scheduler import reminder_scheduler, refresh_reminders
+from news_aggregator import news_aggregator
 from news_briefing import fetch_and_summarize_rss
-from meeting_handler import process_meeting_notes
+from summary_cache import summary_cache
+import metrics
+from summarizer import BACKENDS as SUMMARIZER_BACKENDS
+from meeting_jobs import JobQueueFull, meeting_jobs
+from meeting_list import invalidate_meeting_count, list_meetings, meeting_count
+from meeting_search import search_meetings
+from meeting_tags import get_or_create_tags, invalidate_tag_facets, parse_tags, release_tags, tag_facets, tag_filter
 from models.meeting import Meeting
 from config.database import SessionLocal
 from datetime import datetime
@@ -50,18 +61,84 @@ def index():
     calendars = get_calendar_list()
     return render_template('index.html', events=events, calendars=calendars)
 
+def _backend_or_error(backend):
+    """요청에 지정된 요약 백엔드 이름을 확인합니다 (잘못되면 400 응답)."""
+    if backend and backend not in SUMMARIZER_BACKENDS:
+        return jsonify({
+            'status': 'error',
+            'message': f"알 수 없는 요약 백엔드입니다: {backend}"
+        }), 400
+    return None
+
+def _wants_stream():
+    return request.args.get('stream') == '1' or 'text/event-stream' in request.headers.get('Accept', '')
+
+def _sse_response(events):
+    """(이벤트 종류, 데이터) 제너레이터를 Server-Sent Events 응답으로 만듭니다."""
+    def generate():
+        try:
+            for event in events:
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                event_type, data = event
+                yield format_sse(event_type, data)
+        except Exception as e:
+            yield format_sse('error', {'status': 'error', 'message': str(e)})
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/news')
 def news():
-    return render_template('news.html')
+    news_aggregator.ensure_started()
+    return render_template('news.html', news=news_aggregator.articles(limit=30))
 
 @app.route('/summarize')
 def summarize():
+    # 백그라운드 집계기가 미리 만들어 둔 브리핑을 바로 반환
     try:
-        result = fetch_and_summarize_rss("https://feeds.feedburner.com/zdkorea", limit=5)
-        return jsonify({"summary": result})
+        news_aggregator.ensure_started()
+        # backend를 지정하면(예: ?backend=extractive) 저장된 브리핑 대신 그 백엔드로 바로 요약
+        backend = request.args.get('backend')
+        error = _backend_or_error(backend)
+        if error:
+            return error
+        if _wants_stream():
+            return _sse_response(news_aggregator.stream_latest(backend=backend))
+        if backend:
+            return jsonify({
+                "summary": fetch_and_summarize_rss(news_aggregator.feeds[0]['url'], backend=backend),
+                "backend": backend
+            })
+        briefing = news_aggregator.latest()
+        return jsonify({
+            "summary": briefing['summary'],
+            "updated_at": briefing['updated_at'],
+            "refreshing": briefing['refreshing']
+        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/refresh_news')
+def refresh_news():
+    try:
+        updated_at = news_aggregator.updated_at
+        news_aggregator.trigger_refresh()
+        return jsonify({"status": "success", "updated_at": updated_at, "refreshing": True})
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+@app.route('/summary_cache/stats')
+def summary_cache_stats():
+    return jsonify(summary_cache.stats())
+
+@app.route('/metrics')
+def metrics_endpoint():
+    # Prometheus 텍스트 형식 (LLM 호출 지연/토큰/비용/오류, 요약 캐시 조회)
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/calendar/list')
 def calendar_list():
     try:
@@ -70,6 +147,27 @@ def calendar_list():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def _conflicts_or_empty(start_time, end_time, exclude_event_id=None):
+    """충돌 검사 실패가 일정 생성/수정을 막지 않도록 오류 시 빈 결과를 반환합니다."""
+    try:
+        return check_conflicts(start_time, end_time, exclude_event_id=exclude_event_id)
+    except Exception as e:
+        print(f"일정 충돌 검사 실패: {str(e)}")
+        return {'conflicts': [], 'suggested_slots': []}
+
+@app.route('/calendar/conflicts')
+def get_conflicts():
+    start = request.args.get('start')
+    end = request.args.get('end')
+    if not start or not end:
+        return jsonify({"error": "start, end 파라미터는 필수입니다."}), 400
+    try:
+        return jsonify(check_conflicts(start, end, exclude_event_id=request.args.get('exclude')))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/calendar/add', methods=['POST'])
 def add_event():
     try:
@@ -97,6 +195,10 @@ def add_event():
             location=location,
             attendees=attendees
         )
+        if result.get('success'):
+            # 요청 시간이 아니라 실제로 저장된(과거면 조정된) 시간으로 충돌 검사
+            result.update(_conflicts_or_empty(result['start'], result['end'], exclude_event_id=result['id']))
+            calendar_broadcaster.notify_changed()
         return jsonify(result)
     except Exception as e:
         return jsonify({
@@ -125,6 +227,9 @@ def update_event(calendar_id, event_id):
         description = data.get('description')
         location = data.get('location')
         attendees = data.get('attendees', [])
+        reminder_minutes = data.get('reminder_minutes')
+        # 상세 조회 때 받은 etag를 보내면 낙관적 동시성 제어(If-Match)를 적용
+        etag = data.get('etag') or request.headers.get('If-Match')
 
         if not all([title, start_time, end_time]):
             return jsonify({
@@ -132,6 +237,8 @@ def update_event(calendar_id, event_id):
                 'error': '제목, 시작 시간, 종료 시간은 필수입니다.'
             }), 400
 
+        conflicts = _conflicts_or_empty(start_time, end_time, exclude_event_id=event_id)
+
         result = update_calendar_event(
             calendar_id=calendar_id,
             event_id=event_id,
@@ -140,8 +247,15 @@ def update_event(calendar_id, event_id):
             end_time=end_time,
             description=description,
             location=location,
-            attendees=attendees
+            attendees=attendees,
+            reminder_minutes=reminder_minutes,
+            etag=etag
         )
+        if result.get('conflict'):
+            return jsonify(result), 409
+        if result.get('success'):
+            result.update(conflicts)
+            calendar_broadcaster.notify_changed()
         return jsonify(result)
     except Exception as e:
         return jsonify({
@@ -153,6 +267,8 @@ def update_event(calendar_id, event_id):
 def delete_event(calendar_id, event_id):
     try:
         result = delete_calendar_event(calendar_id, event_id)
+        if result.get('success'):
+            calendar_broadcaster.notify_changed()
         return jsonify(result)
     except Exception as e:
         return jsonify({
@@ -160,6 +276,35 @@ def delete_event(calendar_id, event_id):
             'error': str(e)
         }), 500
 
+@app.route('/calendar/bulk', methods=['POST'])
+def bulk_events():
+    try:
+        data = request.get_json()
+        operations = (data or {}).get('operations')
+        if not isinstance(operations, list) or not operations:
+            return jsonify({
+                'success': False,
+                'error': 'operations 목록이 필요합니다.'
+            }), 400
+        if len(operations) > BULK_MAX_OPERATIONS:
+            return jsonify({
+                'success': False,
+                'error': f'한 번에 최대 {BULK_MAX_OPERATIONS}개 작업까지 처리할 수 있습니다.'
+            }), 400
+
+        results = bulk_calendar_operations(operations)
+        if any(result['success'] for result in results):
+            calendar_broadcaster.notify_changed()
+        return jsonify({
+            'success': all(result['success'] for result in results),
+            'results': results
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/calendar/today')
 def get_today_events_api():
     try:
@@ -170,6 +315,49 @@ def get_today_events_api():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/calendar/range')
+def get_range_events_api():
+    start = request.args.get('start')
+    end = request.args.get('end')
+    if not start or not end:
+        return jsonify({"error": "start, end 파라미터는 필수입니다."}), 400
+    try:
+        events = get_events_in_range(start, end)
+        return jsonify(events)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/calendar/stream')
+def calendar_stream():
+    """오늘 일정의 추가/변경/삭제를 Server-Sent Events로 전달합니다."""
+    response = Response(
+        stream_with_context(calendar_broadcaster.stream()),
+        mimetype='text/event-stream'
+    )
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/calendar/reminders')
+def get_reminders():
+    """스트림을 사용할 수 없는 클라이언트를 위한 발송된 알림 조회 (after 이후 id)."""
+    try:
+        after = request.args.get('after', 0, type=int)
+        refresh_reminders()
+        return jsonify(reminder_scheduler.recent(after_id=after))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/calendar/reminders/latest')
+def get_latest_reminder_id():
+    """지금까지 발송된 알림의 마지막 id (클라이언트가 이전 알림을 다시 표시하지 않도록)."""
+    return jsonify({'latest_id': reminder_scheduler.latest_id()})
+
+@app.route('/calendar/cache/stats')
+def calendar_cache_stats():
+    return jsonify(get_cache_stats())
+
 @app.route('/meeting')
 def meeting():
     return render_template('meeting.html')
@@ -183,9 +371,36 @@ def handle_meeting_notes():
                 'status': 'error',
                 'message': '회의록 내용이 없습니다.'
             }), 400
-            
-        result = process_meeting_notes(data['text'])
-        return jsonify(result)
+
+        backend = data.get('backend')
+        error = _backend_or_error(backend)
+        if error:
+            return error
+
+        if not data['text'].strip():
+            return jsonify({
+                'status': 'error',
+                'message': '❗ 회의록 내용이 비어있습니다.',
+                'processing_status': '처리 실패'
+            }), 400
+
+        # 작업 대기열에 넣고 바로 반환 (작업자 풀이 정리)
+        try:
+            job = meeting_jobs.submit(data['text'], backend=backend)
+        except JobQueueFull as e:
+            response = jsonify({
+                'status': 'error',
+                'message': str(e),
+                'processing_status': '대기열 초과'
+            })
+            response.headers['Retry-After'] = '10'
+            return response, 429
+
+        # 스트리밍 요청이면 작업의 토큰/상태를 이어서 전송 (마지막 done 이벤트에 전체 결과)
+        if _wants_stream():
+            return _sse_response(meeting_jobs.subscribe(job.id))
+
+        return jsonify(meeting_jobs.get(job.id)), 202
         
     except Exception as e:
         return jsonify({
@@ -193,6 +408,30 @@ def handle_meeting_notes():
             'message': str(e)
         }), 500
 
+@app.route('/meeting_jobs')
+def meeting_job_stats():
+    return jsonify(meeting_jobs.stats())
+
+@app.route('/meeting_jobs/<job_id>', methods=['GET'])
+def get_meeting_job(job_id):
+    job = meeting_jobs.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job)
+
+@app.route('/meeting_jobs/<job_id>/stream')
+def stream_meeting_job(job_id):
+    if meeting_jobs.get(job_id) is None:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+    return _sse_response(meeting_jobs.subscribe(job_id))
+
+@app.route('/meeting_jobs/<job_id>', methods=['DELETE'])
+def cancel_meeting_job(job_id):
+    job = meeting_jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job)
+
 @app.route('/save_meeting_notes', methods=['POST'])
 def save_meeting_notes():
     try:
@@ -215,13 +454,16 @@ def save_meeting_notes():
                 title=f"회의록 {current_time}",
                 original_content=data['original_text'],
                 summarized_content=data['formatted_text'],
-                category='auto'  # 자동 저장된 회의록
+                category='auto',  # 자동 저장된 회의록
+                tags=get_or_create_tags(db, data.get('tags'))
             )
             
             # 데이터베이스에 저장
             db.add(meeting)
             db.commit()
             db.refresh(meeting)
+            invalidate_meeting_count()
+            invalidate_tag_facets()
             
             return jsonify({
                 'status': 'success',
@@ -243,30 +485,80 @@ def meetings():
     # 데이터베이스 세션 생성
     db = SessionLocal()
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = 9  # 한 페이지당 보여줄 회의록 수
-        
-        # 전체 회의록 수 조회
-        total = db.query(Meeting).count()
-        total_pages = (total + per_page - 1) // per_page
-        
-        # 회의록 목록 조회 (최신순, 페이지네이션 적용)
-        meetings = db.query(Meeting).order_by(Meeting.created_at.desc())\
-            .offset((page - 1) * per_page)\
-            .limit(per_page)\
-            .all()
-            
+        category = request.args.get('category', '')
+        # ?tag=a,b 또는 ?tag=a&tag=b: 모든 태그가 붙은 회의록만
+        tags = parse_tags(request.args.getlist('tag'))
+        filters = []
+        if category:
+            filters.append(Meeting.category == category)
+        if tags:
+            try:
+                filters.append(tag_filter(tags))
+            except ValueError as e:
+                return jsonify({
+                    'status': 'error',
+                    'message': str(e)
+                }), 400
+
+        # 커서 기반 페이지네이션 (after: 다음 페이지, before: 이전 페이지)
+        page = list_meetings(
+            db,
+            after=request.args.get('after'),
+            before=request.args.get('before'),
+            filters=filters
+        )
+
         return render_template('meeting_list.html', 
-            meetings=meetings,
-            page=page,
-            total_pages=total_pages,
-            category="",
-            tag="",
+            meetings=page['meetings'],
+            next_cursor=page['next_cursor'],
+            prev_cursor=page['prev_cursor'],
+            total=None if filters else meeting_count(),
+            tag_facets=tag_facets(20),
+            category=category,
+            tag=",".join(tags),
             seoul_tz=pytz.timezone('Asia/Seoul')
         )
     finally:
         db.close()
 
+@app.route('/meetings/tags')
+def meetings_tags():
+    try:
+        limit = request.args.get('limit', 100, type=int)
+        return jsonify({
+            'status': 'success',
+            'tags': tag_facets(max(1, limit))
+        })
+    except Exception as e:
+        print(f"태그 목록 조회 중 오류 발생: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/meetings/search')
+def meetings_search():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            'status': 'error',
+            'message': '검색어를 입력해주세요.'
+        }), 400
+
+    db = SessionLocal()
+    try:
+        limit = request.args.get('limit', 20, type=int)
+        result = search_meetings(db, query, limit=limit, after=request.args.get('cursor'))
+        return jsonify(dict(result, status='success', query=query))
+    except Exception as e:
+        print(f"회의록 검색 중 오류 발생: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+    finally:
+        db.close()
+
 @app.route('/meetings/<int:meeting_id>')
 def meeting_detail(meeting_id):
     db = SessionLocal()
@@ -289,8 +581,11 @@ def delete_meeting(meeting_id):
                 'message': '회의록을 찾을 수 없습니다.'
             }), 404
             
+        release_tags(db, meeting.tags)
         db.delete(meeting)
         db.commit()
+        invalidate_meeting_count()
+        invalidate_tag_facets()
         
         return jsonify({
             'status': 'success',
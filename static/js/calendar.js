@@ -133,6 +133,9 @@ async function deleteEvent(calendarId, eventId) {
     }
 }
 
+// 수정 중인 일정의 etag (다른 곳에서 먼저 수정되었는지 확인용)
+let editingEventEtag = null;
+
 // 일정 수정 모달 열기
 async function editEvent(calendarId, eventId) {
     try {
@@ -147,6 +150,7 @@ async function editEvent(calendarId, eventId) {
         document.getElementById('editEventId').value = eventId;
         document.getElementById('editCalendarId').value = calendarId;
         document.getElementById('editEventTitle').value = data.title;
+        editingEventEtag = data.etag || null;
         
         // 시간 설정
         const startDate = new Date(data.start);
@@ -200,15 +204,22 @@ async function updateEvent() {
                 location,
                 description,
                 reminder_minutes: reminderMinutes,
-                attendees
+                attendees,
+                etag: editingEventEtag
             })
         });
 
         const data = await response.json();
+        if (data.conflict) {
+            alert(data.error);
+            await editEvent(calendarId, eventId);
+            return;
+        }
         if (data.success) {
             const modal = bootstrap.Modal.getInstance(document.getElementById('editEventModal'));
             modal.hide();
             await refreshEvents();
+            notifyConflicts(data);
         } else {
             throw new Error(data.error || '일정 수정 실패');
         }
@@ -218,6 +229,23 @@ async function updateEvent() {
     }
 }
 
+// 겹치는 일정과 추천 빈 시간 안내
+function notifyConflicts(data) {
+    if (!data.conflicts || data.conflicts.length === 0) {
+        return;
+    }
+    const formatTime = (value) => new Date(value).toLocaleString('ko-KR', {
+        month: 'numeric', day: 'numeric', hour: '2-digit', minute: '2-digit', hour12: false
+    });
+    const conflicts = data.conflicts
+        .map(conflict => `- ${conflict.title} (${formatTime(conflict.start)} ~ ${formatTime(conflict.end)})`)
+        .join('\n');
+    const slots = (data.suggested_slots || [])
+        .map(slot => `- ${formatTime(slot.start)} ~ ${formatTime(slot.end)}`)
+        .join('\n');
+    alert(`다음 일정과 시간이 겹칩니다:\n${conflicts}` + (slots ? `\n\n가까운 빈 시간:\n${slots}` : ''));
+}
+
 // 새 일정 추가
 async function addEvent() {
     const calendarId = document.getElementById('calendarSelect').value;
@@ -258,6 +286,7 @@ async function addEvent() {
             const modal = bootstrap.Modal.getInstance(document.getElementById('addEventModal'));
             modal.hide();
             await refreshEvents();
+            notifyConflicts(data);
         } else {
             throw new Error(data.error || '일정 추가 실패');
         }
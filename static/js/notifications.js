@@ -104,107 +104,39 @@ async function initializeNotifications() {
     }
 }
 
-// 일정 알림 예약
-async function scheduleEventNotification(event) {
-    const startTime = new Date(event.start_time);
-    const now = new Date();
-    
-    // 알림 시간 계산 (시작 10분 전)
-    const notificationTime = new Date(startTime.getTime() - (10 * 60 * 1000));
-    
-    console.log('알림 예약 시도:', {
-        title: event.title,
-        startTime: startTime.toLocaleString(),
-        notificationTime: notificationTime.toLocaleString(),
-        now: now.toLocaleString()
-    });
-    
-    // 이미 지난 시간이면 알림을 예약하지 않음
-    if (notificationTime <= now) {
-        console.log('알림 시간이 이미 지났습니다:', event.title);
+// 서버가 발송한 일정 알림 표시
+// 알림 예약은 서버(reminder_scheduler)가 담당하므로 클라이언트는 타이머를 두지 않음
+async function showReminderNotification(reminder) {
+    if (Notification.permission !== "granted") {
         return;
     }
 
-    const timeUntilNotification = notificationTime.getTime() - now.getTime();
-    console.log(`알림 예약: ${event.title}, ${Math.round(timeUntilNotification/1000/60)}분 후`);
-
-    // 직접 알림 예약
-    const directNotificationTimeout = setTimeout(async () => {
-        try {
-            if (Notification.permission === "granted") {
-                console.log('직접 알림 표시 시도:', event.title);
-                const notification = new Notification(event.title, {
-                    body: `10분 후에 일정이 시작됩니다.\n시작 시간: ${formatDateTime(startTime)}`,
-                    icon: '/static/calendar-icon.png',
-                    badge: '/static/calendar-icon.png',
-                    requireInteraction: true,
-                    tag: `calendar-notification-${Date.now()}`
-                });
-
-                notification.onclick = () => {
-                    window.focus();
-                    notification.close();
-                };
-
-                await playNotificationSound();
-                console.log('직접 알림 표시 성공:', event.title);
-            }
-        } catch (error) {
-            console.error('직접 알림 표시 실패:', error);
-        }
-    }, timeUntilNotification);
-
-    // 서비스 워커를 통한 알림 예약
-    if (navigator.serviceWorker?.controller) {
-        console.log('서비스 워커에 알림 예약 요청:', event.title);
-        navigator.serviceWorker.controller.postMessage({
-            type: 'SCHEDULE_NOTIFICATION',
-            title: event.title,
-            body: `10분 후에 일정이 시작됩니다.\n시작 시간: ${formatDateTime(startTime)}`,
-            timestamp: notificationTime.getTime()
-        });
-    } else {
-        console.warn('서비스 워커가 활성화되지 않았습니다.');
-    }
-
-    return directNotificationTimeout;
-}
+    const startTime = new Date(reminder.start_time);
+    const title = reminder.title;
+    const options = {
+        body: `${reminder.reminder_minutes}분 후에 일정이 시작됩니다.\n시작 시간: ${formatDateTime(startTime)}`,
+        icon: '/static/calendar-icon.png',
+        badge: '/static/calendar-icon.png',
+        requireInteraction: true,
+        // 같은 알림을 여러 탭이 받아도 한 번만 표시되도록 고정 태그 사용
+        tag: reminder.tag
+    };
 
-// 일정 알림 체크
-async function checkUpcomingEvents() {
     try {
-        console.log('일정 데이터 요청 시작');
-        const response = await fetch('/calendar/today');
-        if (!response.ok) {
-            throw new Error('일정 조회 실패');
-        }
-
-        const events = await response.json();
-        console.log('받은 일정 데이터:', events);
-        
-        if (!Array.isArray(events)) {
-            console.warn('일정 데이터가 배열이 아닙니다:', events);
-            return;
+        if ('serviceWorker' in navigator) {
+            const registration = await navigator.serviceWorker.ready;
+            await registration.showNotification(title, options);
+        } else {
+            const notification = new Notification(title, options);
+            notification.onclick = () => {
+                window.focus();
+                notification.close();
+            };
         }
-
-        const now = new Date();
-        const notifications = [];
-        
-        events.forEach(event => {
-            const startTime = new Date(event.start_time);
-            
-            // 오늘 일정 중 아직 시작하지 않은 일정에 대해 알림 예약
-            if (startTime > now) {
-                notifications.push(scheduleEventNotification(event));
-            } else {
-                console.log('이미 시작된 일정:', event.title);
-            }
-        });
-
-        return notifications;
+        await playNotificationSound();
+        console.log('일정 알림 표시 성공:', title);
     } catch (error) {
-        console.error('일정 알림 체크 중 오류:', error);
-        return [];
+        console.error('일정 알림 표시 실패:', error);
     }
 }
 
@@ -219,6 +151,74 @@ async function playNotificationSound() {
     }
 }
 
+// 스트림을 사용할 수 없을 때 발송된 알림을 1분마다 조회하는 폴링
+let pollingInterval = null;
+let lastReminderId = 0;
+
+// 페이지를 열기 전에 발송된 알림은 다시 표시하지 않도록 서버의 마지막 알림 id에서 시작
+async function loadLastReminderId() {
+    try {
+        const response = await fetch('/calendar/reminders/latest');
+        if (!response.ok) {
+            throw new Error('마지막 알림 id 조회 실패');
+        }
+        const data = await response.json();
+        lastReminderId = Math.max(lastReminderId, data.latest_id);
+    } catch (error) {
+        console.error('마지막 알림 id 조회 중 오류:', error);
+    }
+}
+
+async function pollReminders() {
+    try {
+        const response = await fetch(`/calendar/reminders?after=${lastReminderId}`);
+        if (!response.ok) {
+            throw new Error('알림 조회 실패');
+        }
+        const reminders = await response.json();
+        for (const reminder of reminders) {
+            lastReminderId = Math.max(lastReminderId, reminder.id);
+            await showReminderNotification(reminder);
+        }
+    } catch (error) {
+        console.error('알림 조회 중 오류:', error);
+    }
+}
+
+async function startPolling() {
+    if (pollingInterval) {
+        return;
+    }
+    console.warn('일정 스트림을 사용할 수 없어 폴링으로 전환합니다.');
+    await pollReminders();
+    pollingInterval = setInterval(pollReminders, 60 * 1000);
+}
+
+// 서버에서 일정 알림을 푸시받는 스트림 연결
+function connectEventStream() {
+    if (!('EventSource' in window)) {
+        startPolling();
+        return;
+    }
+
+    const source = new EventSource('/calendar/stream');
+    source.addEventListener('reminder', (message) => {
+        const reminder = JSON.parse(message.data);
+        lastReminderId = Math.max(lastReminderId, reminder.id);
+        console.log('일정 알림 수신:', reminder.title);
+        showReminderNotification(reminder);
+    });
+
+    source.onerror = () => {
+        // 연결이 완전히 닫힌 경우(서버 미지원 등)에만 폴링으로 대체
+        // 일시적인 끊김은 EventSource가 자동으로 재연결함
+        if (source.readyState === EventSource.CLOSED) {
+            source.close();
+            startPolling();
+        }
+    };
+}
+
 // 페이지 로드 시 실행
 document.addEventListener('DOMContentLoaded', async () => {
     // 알림 시스템 초기화
@@ -226,16 +226,10 @@ document.addEventListener('DOMContentLoaded', async () => {
     console.log('알림 시스템 초기화 결과:', notificationsEnabled);
     
     if (notificationsEnabled) {
-        // 초기 알림 체크
-        const notifications = await checkUpcomingEvents();
-        console.log('예약된 알림 수:', notifications.length);
-        
-        // 1분마다 알림 체크 갱신
-        setInterval(async () => {
-            const newNotifications = await checkUpcomingEvents();
-            console.log('갱신된 알림 수:', newNotifications.length);
-        }, 60 * 1000);
+        await loadLastReminderId();
+        // 일정 변경 사항은 서버가 스트림으로 전달
+        connectEventStream();
     } else {
         console.error('알림 시스템을 초기화할 수 없습니다.');
     }
-}); 
\ No newline at end of file
+});
\ No newline at end of file
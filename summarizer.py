@@ -1,44 +1,68 @@
-from openai import OpenAI
+import json
 import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from typing import Optional
+from typing import Iterator, List, Optional
+
+import extractive
+import metrics
+from llm_gateway import LLMGateway, estimate_tokens
+from summary_cache import summary_cache, make_cache_key
 
 load_dotenv()
 api_key = os.getenv("OPENAI_API_KEY")
 
-if not api_key:
-    raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인해주세요.")
+# 기본 요약 백엔드: 'openai', 'extractive'(로컬 추출 요약), 'auto'(OpenAI 우선, 실패/키 없음 시 추출 요약)
+SUMMARIZER_BACKEND = os.getenv('SUMMARIZER_BACKEND', 'auto')
 
-client = OpenAI(api_key=api_key)
+# 모든 OpenAI 호출은 연결 풀/속도 제한/재시도를 갖춘 게이트웨이를 거침 (키가 없으면 None)
+llm = LLMGateway(api_key=api_key) if api_key else None
 
-def summarize_text(text: str) -> str:
-    prompt = "이 기사를 3~4줄로 핵심만 요약해주세요."
-    resp = client.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt + "\n\n" + text}],
-        temperature=0.5,
-        max_tokens=300
-    )
-    return resp.choices[0].message.content.strip()
+def _llm() -> LLMGateway:
+    if llm is None:
+        raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인해주세요.")
+    return llm
 
-def format_meeting_notes(text: str) -> str:
-    """
-    회의록을 정리된 형식으로 변환합니다.
-    
-    Args:
-        text (str): 원본 회의록 텍스트
-        
-    Returns:
-        str: 정리된 회의록
-        
-    Raises:
-        ValueError: 입력 텍스트가 비어있는 경우
-        Exception: API 호출 실패 등 기타 오류
-    """
-    if not text.strip():
-        raise ValueError("회의록 내용이 비어있습니다.")
+MODEL = "gpt-3.5-turbo"
+ARTICLE_PROMPT = "이 기사를 3~4줄로 핵심만 요약해주세요."
+ARTICLE_MAX_TOKENS = 300
+# 여러 기사를 한 요청으로 요약할 때의 지시문 (결과는 JSON)
+BATCH_ARTICLE_PROMPT = (
+    "아래에 [기사 n] 형식으로 여러 기사가 주어집니다. 각 기사를 3~4줄로 핵심만 요약해주세요.\n"
+    '반드시 {"summaries": [{"id": n, "summary": "요약"}, ...]} 형식의 JSON만 출력하고, '
+    "모든 기사 id를 한 번씩 포함하세요."
+)
+# 모델 컨텍스트 크기와 한 요청에 묶을 최대 기사 수
+SUMMARY_CONTEXT_TOKENS = int(os.getenv('SUMMARY_CONTEXT_TOKENS', '16385'))
+SUMMARY_BATCH_SIZE = int(os.getenv('SUMMARY_BATCH_SIZE', '8'))
+SUMMARY_BATCH_WORKERS = int(os.getenv('SUMMARY_BATCH_WORKERS', '3'))
+MEETING_SYSTEM_PROMPT = "당신은 회의록 정리 전문가입니다. 원본 내용을 충실히 반영하여 깔끔하게 정리하는 것이 목표입니다."
+MEETING_MAX_TOKENS = 1000
+# 이 토큰 수를 넘는 회의록은 구간별로 나눠 정리(map)한 뒤 합침(reduce)
+MEETING_CHUNK_TOKENS = int(os.getenv('MEETING_CHUNK_TOKENS', '3000'))
+MEETING_CHUNK_MAX_TOKENS = 600
+MEETING_MAP_WORKERS = int(os.getenv('MEETING_MAP_WORKERS', '4'))
+MEETING_CHUNK_PROMPT = """다음은 긴 회의록의 일부({index}/{total} 구간)입니다.
+이 구간에서 원본에 명시된 내용만 bullet point로 추출해주세요. 없는 항목은 생략하세요.
+- 참석자
+- 논의 사항
+- 결정 사항
+- 액션 아이템 (담당자/기한이 언급된 경우 함께)
+- 후속 논의 필요 사항
 
-    prompt = """
+회의록 구간:
+"""
+MEETING_REDUCE_NOTE = (
+    "아래 원본 회의록은 긴 회의록을 구간별로 먼저 정리한 결과입니다. "
+    "구간 정리들을 하나의 회의록으로 합치고, 중복된 내용은 한 번만 적어주세요.\n"
+)
+# 화자 표시로 시작하는 줄 (예: "김철수: ...", "[PM] ...")
+SPEAKER_LINE = re.compile(r'^\s*(\[[^\]]{1,20}\]|[^\s:：][^:：\n]{0,19}[:：])')
+
+MEETING_PROMPT = """
 당신은 회의록 정리 전문가입니다. 주어진 회의록을 마크다운 형식으로 깔끔하게 정리해주세요.
 
 중요한 규칙:
@@ -70,15 +94,564 @@ def format_meeting_notes(text: str) -> str:
 
 ---
 원본 회의록:
-""" + text
+"""
+
+def _article_cache_key(text: str) -> str:
+    return make_cache_key(MODEL, ARTICLE_PROMPT, text)
+
+def _openai_summarize_text(text: str) -> str:
+    prompt = ARTICLE_PROMPT
+
+    def compute():
+        resp = _llm().chat(
+            model=MODEL,
+            messages=[{"role": "user", "content": prompt + "\n\n" + text}],
+            temperature=0.5,
+            max_tokens=ARTICLE_MAX_TOKENS,
+            operation='article'
+        )
+        return resp.choices[0].message.content.strip()
+
+    # 같은 본문은 다시 요약하지 않고 캐시에서 반환
+    return summary_cache.get_or_compute(
+        _article_cache_key(text), compute, kind='article', model=MODEL
+    )
+
+def _stream_completion(key: str, kind: str, messages, temperature: float,
+                       max_tokens: int) -> Iterator[str]:
+    """채팅 응답을 토큰(조각) 단위로 yield하고, 끝나면 전체 결과를 캐시에 저장합니다.
+
+    캐시에 이미 있으면 전체 결과를 한 번에 yield합니다. messages는 목록이거나
+    캐시에 없을 때만 호출되는 목록 생성 함수입니다.
+    """
+    cached = summary_cache.get(key, kind=kind)
+    if cached is not None:
+        yield cached
+        return
+
+    stream = _llm().stream_chat(
+        model=MODEL,
+        messages=messages() if callable(messages) else messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        operation=f'{kind}_stream'
+    )
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+    summary_cache.put(key, "".join(parts).strip(), kind=kind, model=MODEL)
+
+def _openai_stream_summarize_text(text: str) -> Iterator[str]:
+    return _stream_completion(
+        _article_cache_key(text), 'article',
+        [{"role": "user", "content": ARTICLE_PROMPT + "\n\n" + text}],
+        temperature=0.5, max_tokens=ARTICLE_MAX_TOKENS
+    )
+
+def plan_batches(texts: List[str], max_size: int = SUMMARY_BATCH_SIZE,
+                 context_tokens: int = SUMMARY_CONTEXT_TOKENS) -> List[List[int]]:
+    """기사 인덱스를 컨텍스트 크기(입력 + 기사별 출력 예약분) 안에 들어가도록 묶습니다.
+
+    혼자서도 한도를 넘는 기사는 길이 1짜리 묶음이 되어 단건 요청으로 처리됩니다.
+    """
+    overhead = estimate_tokens(BATCH_ARTICLE_PROMPT) + 50
+    batches, current, used = [], [], overhead
+    for index, text in enumerate(texts):
+        # 기사 머리표와 출력 JSON 여유분 포함
+        cost = estimate_tokens(text) + 10 + ARTICLE_MAX_TOKENS
+        if current and (len(current) >= max_size or used + cost > context_tokens):
+            batches.append(current)
+            current, used = [], overhead
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+def _parse_batch_response(content: str, count: int) -> Optional[List[str]]:
+    """{"summaries": [{"id", "summary"}]} 응답을 기사 순서의 요약 목록으로 변환합니다.
+
+    형식이 맞지 않거나 빠진 기사가 있으면 None을 반환합니다.
+    """
+    try:
+        data = json.loads(content)
+        items = data['summaries'] if isinstance(data, dict) else data
+        summaries = {int(item['id']): str(item['summary']).strip() for item in items}
+    except (ValueError, KeyError, TypeError):
+        return None
+    result = [summaries.get(i + 1) for i in range(count)]
+    if not all(result):
+        return None
+    return result
+
+def _summarize_batch_uncached(texts: List[str]) -> List[str]:
+    """기사 묶음을 한 번의 요청으로 요약합니다.
+
+    응답이 잘리면 묶음을 반으로 나눠 다시 시도하고, 응답 형식을 해석할 수 없을
+    때만 기사별 단건 요청으로 대체합니다. 한도 초과/연결/서버 오류와 제한 시간
+    초과는 기사 수만큼 요청을 늘리지 않도록 그대로 호출자에게 전달합니다.
+    """
+    if len(texts) == 1:
+        return [_openai_summarize_text(texts[0])]
 
-    resp = client.chat.completions.create(
-        model="gpt-3.5-turbo",
+    body = "\n\n".join(f"[기사 {i + 1}]\n{text}" for i, text in enumerate(texts))
+    resp = _llm().chat(
+        model=MODEL,
         messages=[
-            {"role": "system", "content": "당신은 회의록 정리 전문가입니다. 원본 내용을 충실히 반영하여 깔끔하게 정리하는 것이 목표입니다."},
-            {"role": "user", "content": prompt}
+            {"role": "system", "content": BATCH_ARTICLE_PROMPT},
+            {"role": "user", "content": body}
         ],
-        temperature=0.3,
-        max_tokens=1000
+        temperature=0.5,
+        max_tokens=ARTICLE_MAX_TOKENS * len(texts),
+        response_format={"type": "json_object"},
+        operation='article_batch'
+    )
+    try:
+        choice = resp.choices[0]
+        finish_reason, content = choice.finish_reason, choice.message.content
+    except (IndexError, AttributeError, TypeError):
+        finish_reason, content = None, None
+    if finish_reason == 'length':
+        middle = len(texts) // 2
+        return _summarize_batch_uncached(texts[:middle]) + _summarize_batch_uncached(texts[middle:])
+
+    summaries = _parse_batch_response(content, len(texts))
+    if summaries is None:
+        print("묶음 요약 응답을 해석할 수 없어 기사별 요약으로 대체합니다.")
+        return [_openai_summarize_text(text) for text in texts]
+
+    for text, summary in zip(texts, summaries):
+        summary_cache.put(_article_cache_key(text), summary, kind='article', model=MODEL)
+    return summaries
+
+def _openai_summarize_batch(texts: List[str], max_workers: int = SUMMARY_BATCH_WORKERS) -> List[str]:
+    """여러 기사를 묶어서 요약합니다. 결과는 texts와 같은 순서입니다.
+
+    캐시에 있는 기사는 요청하지 않고, 나머지를 plan_batches로 묶어 묶음별로
+    동시에 요청합니다. 요약 결과와 캐시 키는 단건 요약과 같습니다.
+    """
+    results = [summary_cache.get(_article_cache_key(text), kind='article') for text in texts]
+    missing = [i for i, summary in enumerate(results) if summary is None]
+    if not missing:
+        return results
+
+    batches = [[missing[i] for i in batch] for batch in plan_batches([texts[i] for i in missing])]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+        outputs = list(executor.map(lambda batch: _summarize_batch_uncached([texts[i] for i in batch]), batches))
+
+    for batch, summaries in zip(batches, outputs):
+        for index, summary in zip(batch, summaries):
+            results[index] = summary
+    return results
+
+def _split_long_segment(segment: str, max_tokens: int) -> List[str]:
+    # 한 발언/문단이 한도를 넘으면 문장 단위로, 그래도 넘으면 글자 수로 자름
+    pieces, current = [], ""
+    for sentence in re.split(r'(?<=[.!?。])\s+|\n', segment):
+        while estimate_tokens(sentence) > max_tokens:
+            cut = max(1, len(sentence) * max_tokens // estimate_tokens(sentence))
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:]
+        if current and estimate_tokens(current) + estimate_tokens(sentence) > max_tokens:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {sentence}".strip() if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+def chunk_transcript(text: str, max_tokens: int = MEETING_CHUNK_TOKENS) -> List[str]:
+    """회의록을 화자 발언/문단 경계에서 max_tokens(추정치) 이하의 구간으로 나눕니다."""
+    # 빈 줄 또는 화자 표시가 새 발언/문단의 시작
+    segments, current = [], []
+    for line in text.splitlines():
+        if not line.strip() or SPEAKER_LINE.match(line):
+            if current:
+                segments.append("\n".join(current))
+                current = []
+        if line.strip():
+            current.append(line)
+    if current:
+        segments.append("\n".join(current))
+
+    chunks, current, used = [], [], 0
+    for segment in segments:
+        cost = estimate_tokens(segment) + 1
+        pieces = [segment] if cost <= max_tokens else _split_long_segment(segment, max_tokens)
+        for piece in pieces:
+            cost = estimate_tokens(piece) + 1
+            if current and used + cost > max_tokens:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            current.append(piece)
+            used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+def _summarize_meeting_chunk(index: int, total: int, chunk: str) -> str:
+    prompt = MEETING_CHUNK_PROMPT.format(index=index, total=total)
+
+    def compute():
+        resp = _llm().chat(
+            model=MODEL,
+            messages=[
+                {"role": "system", "content": MEETING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt + chunk}
+            ],
+            temperature=0.3,
+            max_tokens=MEETING_CHUNK_MAX_TOKENS,
+            operation='meeting_chunk'
+        )
+        return resp.choices[0].message.content.strip()
+
+    return summary_cache.get_or_compute(
+        make_cache_key(MODEL, MEETING_SYSTEM_PROMPT + prompt, chunk), compute,
+        kind='meeting_chunk', model=MODEL
     )
-    return resp.choices[0].message.content.strip()
+
+class MeetingCancelled(Exception):
+    """회의록 정리 중 호출자가 취소한 경우 (meeting_cancellation 참고)."""
+
+
+# 현재 스레드에서 진행 중인 회의록 정리의 취소 확인 함수
+_cancel_check = threading.local()
+
+@contextmanager
+def meeting_cancellation(cancelled):
+    """이 블록에서 긴 회의록을 정리하는 동안 구간 정리(map)가 하나 끝날 때마다
+    cancelled()를 확인하고, 참이면 남은 구간을 요청하지 않고 MeetingCancelled를 냅니다."""
+    previous = getattr(_cancel_check, 'func', None)
+    _cancel_check.func = cancelled
+    try:
+        yield
+    finally:
+        _cancel_check.func = previous
+
+def _raise_if_cancelled() -> None:
+    cancelled = getattr(_cancel_check, 'func', None)
+    if cancelled is not None and cancelled():
+        raise MeetingCancelled("회의록 정리가 취소되었습니다.")
+
+def _map_chunks(chunks: List[str], max_workers: int) -> List[str]:
+    """구간을 최대 max_workers개씩 동시에 정리합니다.
+
+    다음 구간은 앞 구간이 끝나고 취소 여부를 확인한 뒤에야 요청합니다.
+    """
+    total = len(chunks)
+    workers = max(1, min(max_workers, total))
+    partials = [None] * total
+    remaining = iter(enumerate(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
+
+        def submit_next():
+            item = next(remaining, None)
+            if item is not None:
+                index, chunk = item
+                running[executor.submit(_summarize_meeting_chunk, index + 1, total, chunk)] = index
+
+        for _ in range(workers):
+            submit_next()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                partials[running.pop(future)] = future.result()
+            _raise_if_cancelled()
+            for _ in done:
+                submit_next()
+    return partials
+
+def _reduce_input(text: str, max_workers: int = MEETING_MAP_WORKERS) -> str:
+    """긴 회의록을 구간별로 동시에 정리(map)하여 최종 정리에 넣을 입력을 만듭니다.
+
+    구간 정리를 합쳐도 한도를 넘으면 같은 방식으로 한 번 더 줄입니다.
+    """
+    _raise_if_cancelled()
+    for _ in range(3):
+        chunks = chunk_transcript(text)
+        if len(chunks) <= 1:
+            return text
+        total = len(chunks)
+        partials = _map_chunks(chunks, max_workers)
+        text = "\n\n".join(f"[구간 {i + 1}/{total}]\n{partial}" for i, partial in enumerate(partials))
+        if estimate_tokens(text) <= MEETING_CHUNK_TOKENS * 2:
+            break
+    return text
+
+def _meeting_messages(text: str) -> list:
+    """최종 정리 요청 메시지. 긴 회의록은 map 단계를 먼저 실행합니다."""
+    if estimate_tokens(text) <= MEETING_CHUNK_TOKENS:
+        content = MEETING_PROMPT + text
+    else:
+        content = MEETING_REDUCE_NOTE + MEETING_PROMPT + _reduce_input(text)
+    return [
+        {"role": "system", "content": MEETING_SYSTEM_PROMPT},
+        {"role": "user", "content": content}
+    ]
+
+def _openai_format_meeting_notes(text: str) -> str:
+    def compute():
+        resp = _llm().chat(
+            model=MODEL,
+            messages=_meeting_messages(text),
+            temperature=0.3,
+            max_tokens=MEETING_MAX_TOKENS,
+            operation='meeting'
+        )
+        return resp.choices[0].message.content.strip()
+
+    return summary_cache.get_or_compute(
+        _meeting_cache_key(text), compute, kind='meeting', model=MODEL
+    )
+
+def _meeting_cache_key(text: str) -> str:
+    return make_cache_key(MODEL, MEETING_SYSTEM_PROMPT + MEETING_PROMPT, text)
+
+def _openai_stream_format_meeting_notes(text: str) -> Iterator[str]:
+    return _stream_completion(
+        _meeting_cache_key(text), 'meeting', lambda: _meeting_messages(text),
+        temperature=0.3, max_tokens=MEETING_MAX_TOKENS
+    )
+
+# 추출 요약 회의록에서 결정사항/액션 아이템으로 분류할 표현
+DECISION_PATTERN = re.compile(r'결정|확정|합의|하기로')
+ACTION_PATTERN = re.compile(r'까지|담당|진행 예정|할 예정|TODO', re.IGNORECASE)
+FOLLOWUP_PATTERN = re.compile(r'추가 논의|다음 회의|재논의|검토 필요|확인 필요')
+
+def _extractive_meeting_notes(text: str) -> str:
+    """추출 요약으로 기존 마크다운 형식의 회의록을 만듭니다 (원문 문장만 사용)."""
+    def bullets(sentences, checkbox=False):
+        prefix = "- [ ] " if checkbox else "- "
+        return "\n".join(prefix + sentence for sentence in sentences) or "- (해당 없음)"
+
+    sentences = extractive.split_sentences(text)
+    decisions = [s for s in sentences if DECISION_PATTERN.search(s)]
+    actions = [s for s in sentences if ACTION_PATTERN.search(s) and s not in decisions]
+    followups = [s for s in sentences if FOLLOWUP_PATTERN.search(s)]
+    key_points = extractive.summarize(text, max_sentences=min(7, max(3, len(sentences) // 5))).split("\n")
+
+    return "\n".join([
+        "# 회의 메모",
+        "",
+        "## 1. 주요 논의 사항",
+        bullets(key_points),
+        "",
+        "## 2. 결정사항",
+        bullets(decisions),
+        "",
+        "## 3. 액션 아이템",
+        bullets(actions, checkbox=True),
+        "",
+        "## 4. 후속 논의 필요 사항",
+        bullets(followups),
+    ])
+
+
+class SummarizerBackend:
+    """요약 백엔드 인터페이스. summarize/format_meeting만 구현하면 나머지는 기본 동작을 씁니다."""
+
+    name = None
+
+    def available(self) -> bool:
+        return True
+
+    def summarize(self, text: str) -> str:
+        raise NotImplementedError
+
+    def summarize_many(self, texts: List[str]) -> List[str]:
+        return [self.summarize(text) for text in texts]
+
+    def stream_summarize(self, text: str) -> Iterator[str]:
+        yield self.summarize(text)
+
+    def format_meeting(self, text: str) -> str:
+        raise NotImplementedError
+
+    def stream_format_meeting(self, text: str) -> Iterator[str]:
+        yield self.format_meeting(text)
+
+
+class OpenAIBackend(SummarizerBackend):
+    name = 'openai'
+
+    def available(self) -> bool:
+        return llm is not None
+
+    def summarize(self, text):
+        return _openai_summarize_text(text)
+
+    def summarize_many(self, texts):
+        return _openai_summarize_batch(texts)
+
+    def stream_summarize(self, text):
+        return _openai_stream_summarize_text(text)
+
+    def format_meeting(self, text):
+        return _openai_format_meeting_notes(text)
+
+    def stream_format_meeting(self, text):
+        return _openai_stream_format_meeting_notes(text)
+
+
+class ExtractiveBackend(SummarizerBackend):
+    """API 호출 없는 로컬 추출 요약 (TF-IDF + TextRank)."""
+
+    name = 'extractive'
+
+    def summarize(self, text):
+        # 기사는 핵심이 앞에 오므로 앞 문장에 가산점
+        return extractive.summarize(text, max_sentences=3, lead_weight=0.5)
+
+    def format_meeting(self, text):
+        return _extractive_meeting_notes(text)
+
+
+# 현재 스레드에서 마지막으로 요약을 만든 백엔드 이름 (served_backend 참고)
+_served = threading.local()
+
+def served_backend() -> Optional[str]:
+    """현재 스레드에서 마지막으로 요약을 만든 백엔드 이름.
+
+    auto 백엔드를 쓴 경우 실제로 응답한 백엔드('openai' 또는 'extractive')입니다.
+    """
+    return getattr(_served, 'name', None)
+
+def _serve(backend: SummarizerBackend) -> SummarizerBackend:
+    _served.name = backend.name
+    return backend
+
+
+class AutoBackend(SummarizerBackend):
+    """primary를 우선 사용하고, 사용할 수 없거나 실패하면 fallback으로 대체합니다.
+
+    대체할 때마다 summarizer_fallbacks_total 메트릭에 기록합니다.
+    """
+
+    name = 'auto'
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    def _fall_back(self, method, error=None):
+        reason = type(error).__name__ if error else 'unavailable'
+        metrics.summarizer_fallbacks.inc(method=method, primary=self.primary.name,
+                                         fallback=self.fallback.name, reason=reason)
+        if error:
+            print(f"{self.primary.name} 요약 실패, {self.fallback.name}(으)로 대체: {str(error)}")
+        return _serve(self.fallback)
+
+    def _call(self, method, *args):
+        if not self.primary.available():
+            return getattr(self._fall_back(method), method)(*args)
+        try:
+            return getattr(_serve(self.primary), method)(*args)
+        except MeetingCancelled:
+            raise
+        except Exception as e:
+            return getattr(self._fall_back(method, e), method)(*args)
+
+    def _stream(self, method, *args):
+        if not self.primary.available():
+            yield from getattr(self._fall_back(method), method)(*args)
+            return
+        started = False
+        try:
+            for token in getattr(_serve(self.primary), method)(*args):
+                started = True
+                yield token
+            return
+        except MeetingCancelled:
+            raise
+        except Exception as e:
+            # 이미 일부를 보낸 뒤에는 섞이지 않도록 그대로 실패
+            if started:
+                raise
+            fallback = self._fall_back(method, e)
+        yield from getattr(fallback, method)(*args)
+
+    def summarize(self, text):
+        return self._call('summarize', text)
+
+    def summarize_many(self, texts):
+        return self._call('summarize_many', texts)
+
+    def stream_summarize(self, text):
+        return self._stream('stream_summarize', text)
+
+    def format_meeting(self, text):
+        return self._call('format_meeting', text)
+
+    def stream_format_meeting(self, text):
+        return self._stream('stream_format_meeting', text)
+
+
+BACKENDS = {}
+
+def register_backend(backend: SummarizerBackend) -> None:
+    BACKENDS[backend.name] = backend
+
+register_backend(OpenAIBackend())
+register_backend(ExtractiveBackend())
+register_backend(AutoBackend(BACKENDS['openai'], BACKENDS['extractive']))
+
+def get_backend(name: Optional[str] = None) -> SummarizerBackend:
+    """이름으로 백엔드를 찾습니다 (None이면 SUMMARIZER_BACKEND)."""
+    name = name or SUMMARIZER_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 요약 백엔드입니다: {name} (사용 가능: {', '.join(BACKENDS)})")
+    return _serve(BACKENDS[name])
+
+def summarize_text(text: str, backend: Optional[str] = None) -> str:
+    return get_backend(backend).summarize(text)
+
+def summarize_batch(texts: List[str], backend: Optional[str] = None) -> List[str]:
+    """여러 기사를 요약합니다. 결과는 texts와 같은 순서입니다.
+
+    OpenAI 백엔드는 여러 기사를 묶어서 요청합니다 (plan_batches 참고).
+    """
+    return get_backend(backend).summarize_many(texts)
+
+def stream_summarize_text(text: str, backend: Optional[str] = None) -> Iterator[str]:
+    """summarize_text의 스트리밍 버전. 이어 붙이면 같은 요약이 됩니다."""
+    return get_backend(backend).stream_summarize(text)
+
+def format_meeting_notes(text: str, backend: Optional[str] = None) -> str:
+    """
+    회의록을 정리된 형식으로 변환합니다.
+
+    MEETING_CHUNK_TOKENS보다 긴 회의록은 화자/문단 단위 구간으로 나눠 동시에
+    정리한 뒤, 구간 정리들을 기존 마크다운 형식 하나로 합칩니다.
+    
+    Args:
+        text (str): 원본 회의록 텍스트
+        backend (str, optional): 요약 백엔드 이름 (기본값: SUMMARIZER_BACKEND)
+        
+    Returns:
+        str: 정리된 회의록
+        
+    Raises:
+        ValueError: 입력 텍스트가 비어있거나 백엔드 이름이 잘못된 경우
+        Exception: API 호출 실패 등 기타 오류
+    """
+    if not text.strip():
+        raise ValueError("회의록 내용이 비어있습니다.")
+    return get_backend(backend).format_meeting(text)
+
+def stream_format_meeting_notes(text: str, backend: Optional[str] = None) -> Iterator[str]:
+    """format_meeting_notes의 스트리밍 버전. 정리된 회의록을 조각 단위로 yield합니다.
+
+    긴 회의록은 구간 정리(map)가 끝난 뒤 최종 정리부터 스트리밍됩니다.
+
+    Raises:
+        ValueError: 입력 텍스트가 비어있는 경우
+    """
+    if not text.strip():
+        raise ValueError("회의록 내용이 비어있습니다.")
+    return get_backend(backend).stream_format_meeting(text)
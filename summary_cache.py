@@ -0,0 +1,255 @@
+# summary_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import metrics
+from config.database import SessionLocal
+from models.summary_cache import SummaryCacheEntry
+
+# 프로세스 내 LRU에 보관할 최대 요약 수
+SUMMARY_CACHE_LRU_SIZE = int(os.getenv('SUMMARY_CACHE_LRU_SIZE', '512'))
+# DB에 보관할 최대 기간(일)과 최대 행 수
+SUMMARY_CACHE_MAX_AGE_DAYS = int(os.getenv('SUMMARY_CACHE_MAX_AGE_DAYS', '30'))
+SUMMARY_CACHE_MAX_ROWS = int(os.getenv('SUMMARY_CACHE_MAX_ROWS', '10000'))
+# 이 횟수만큼 저장할 때마다 오래된 항목 정리
+SUMMARY_CACHE_EVICT_EVERY = 100
+# DB 오류 후 DB 캐시를 건너뛰는 시간(초)
+SUMMARY_CACHE_DB_BACKOFF = 60
+# 조회 기록(hit_count, last_accessed_at)은 모아 두었다가 이 개수나 간격(초)마다 한 번에 반영
+SUMMARY_CACHE_TOUCH_BATCH = 50
+SUMMARY_CACHE_TOUCH_INTERVAL = 60
+
+
+def make_cache_key(model, prompt, text):
+    """(모델, 프롬프트, 본문)의 내용 기반 캐시 키(sha256)를 만듭니다."""
+    digest = hashlib.sha256()
+    for part in (model, prompt, text):
+        encoded = part.encode('utf-8')
+        # 길이를 함께 넣어 구분자 충돌을 방지
+        digest.update(str(len(encoded)).encode('ascii') + b':' + encoded)
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """요약 결과 캐시: 프로세스 내 LRU + Postgres(summary_cache 테이블).
+
+    LRU와 DB 모두 마지막 사용 후 max_age가 지난 항목을 만료로 봅니다
+    (DB는 last_accessed_at 기준으로 조회/정리). 조회할 때마다 DB에 쓰지 않도록
+    사용 기록은 모아 두었다가 flush_touches()에서 한 번에 반영합니다.
+
+    DB를 사용할 수 없으면 잠시 DB 단계를 건너뛰고 LRU와 직접 계산만 사용하므로,
+    캐시 장애가 요약 기능 자체를 막지 않습니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal, lru_size=SUMMARY_CACHE_LRU_SIZE,
+                 max_age_days=SUMMARY_CACHE_MAX_AGE_DAYS, max_rows=SUMMARY_CACHE_MAX_ROWS):
+        self.session_factory = session_factory
+        self.lru_size = lru_size
+        self.max_age = timedelta(days=max_age_days)
+        self.max_rows = max_rows
+        self._lru = OrderedDict()   # key -> (요약, 마지막 사용 시각)
+        self._touched = Counter()   # key -> 아직 DB에 반영하지 않은 조회 수
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._db_disabled_until = 0
+        self._writes = 0
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.db_errors = 0
+        self.evicted = 0
+
+    def get_or_compute(self, key, compute, kind, model):
+        """캐시에 있으면 그 값을, 없으면 compute()를 실행해 저장한 뒤 반환합니다."""
+        summary = self.get(key, kind=kind)
+        if summary is not None:
+            return summary
+        summary = compute()
+        self.put(key, summary, kind, model)
+        return summary
+
+    def get(self, key, kind=''):
+        """캐시에 있는 요약을 반환합니다 (없으면 None, miss로 집계).
+
+        kind는 metrics의 조회 결과를 요약 종류별로 나누는 데만 씁니다.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None and entry[1] < now - self.max_age:
+                del self._lru[key]
+                entry = None
+            if entry is not None:
+                self._lru[key] = (entry[0], now)
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                self._touched[key] += 1
+        if entry is not None:
+            metrics.cache_lookups.inc(kind=kind, result='memory_hit')
+            self._maybe_flush_touches()
+            return entry[0]
+
+        summary = self._db_get(key)
+        with self._lock:
+            if summary is None:
+                self.misses += 1
+            else:
+                self.db_hits += 1
+                self._touched[key] += 1
+        metrics.cache_lookups.inc(kind=kind, result='miss' if summary is None else 'db_hit')
+        if summary is not None:
+            self._remember(key, summary)
+            self._maybe_flush_touches()
+        return summary
+
+    def put(self, key, summary, kind, model):
+        self._remember(key, summary)
+        self._db_put(key, summary, kind, model)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                'memory_size': len(self._lru),
+                'memory_hits': self.memory_hits,
+                'db_hits': self.db_hits,
+                'misses': self.misses,
+                'db_errors': self.db_errors,
+                'evicted': self.evicted,
+                'hit_rate': round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else 0.0
+            }
+
+    def flush_touches(self):
+        """모아 둔 조회 기록을 한 트랜잭션으로 DB에 반영하고 반영한 항목 수를 반환합니다."""
+        with self._lock:
+            touched, self._touched = self._touched, Counter()
+            self._last_flush = time.monotonic()
+        if not touched or not self._db_available():
+            return 0
+        db = self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            for key, hits in touched.items():
+                db.query(SummaryCacheEntry)\
+                    .filter(SummaryCacheEntry.key == key)\
+                    .update({
+                        SummaryCacheEntry.hit_count: SummaryCacheEntry.hit_count + hits,
+                        SummaryCacheEntry.last_accessed_at: now
+                    }, synchronize_session=False)
+            db.commit()
+            return len(touched)
+        except Exception as e:
+            db.rollback()
+            self._db_failed(e)
+            return 0
+        finally:
+            db.close()
+
+    def evict(self):
+        """DB에서 max_age보다 오래 쓰이지 않은 항목과 max_rows를 넘는 항목을 지웁니다."""
+        # 최근에 쓴 항목이 오래된 것으로 지워지지 않도록 조회 기록을 먼저 반영
+        self.flush_touches()
+        db = self.session_factory()
+        try:
+            cutoff = datetime.now(timezone.utc) - self.max_age
+            removed = db.query(SummaryCacheEntry)\
+                .filter(SummaryCacheEntry.last_accessed_at < cutoff)\
+                .delete(synchronize_session=False)
+
+            # 최근 사용 순으로 max_rows번째 이후 항목 삭제
+            boundary = db.query(SummaryCacheEntry.last_accessed_at)\
+                .order_by(SummaryCacheEntry.last_accessed_at.desc())\
+                .offset(self.max_rows).limit(1).scalar()
+            if boundary is not None:
+                removed += db.query(SummaryCacheEntry)\
+                    .filter(SummaryCacheEntry.last_accessed_at <= boundary)\
+                    .delete(synchronize_session=False)
+            db.commit()
+            with self._lock:
+                self.evicted += removed
+            return removed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _remember(self, key, summary):
+        with self._lock:
+            self._lru[key] = (summary, datetime.now(timezone.utc))
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _maybe_flush_touches(self):
+        with self._lock:
+            due = (len(self._touched) >= SUMMARY_CACHE_TOUCH_BATCH
+                   or time.monotonic() - self._last_flush >= SUMMARY_CACHE_TOUCH_INTERVAL)
+        if due:
+            self.flush_touches()
+
+    def _db_available(self):
+        return time.monotonic() >= self._db_disabled_until
+
+    def _db_failed(self, error):
+        print(f"요약 캐시 DB 오류: {str(error)}")
+        with self._lock:
+            self.db_errors += 1
+            self._db_disabled_until = time.monotonic() + SUMMARY_CACHE_DB_BACKOFF
+
+    def _db_get(self, key):
+        if not self._db_available():
+            return None
+        db = self.session_factory()
+        try:
+            # evict()와 같은 기준: 마지막 사용 후 max_age가 지난 항목은 만료
+            cutoff = datetime.now(timezone.utc) - self.max_age
+            return db.query(SummaryCacheEntry.summary)\
+                .filter(SummaryCacheEntry.key == key, SummaryCacheEntry.last_accessed_at >= cutoff)\
+                .scalar()
+        except Exception as e:
+            db.rollback()
+            self._db_failed(e)
+            return None
+        finally:
+            db.close()
+
+    def _db_put(self, key, summary, kind, model):
+        if not self._db_available():
+            return
+        db = self.session_factory()
+        try:
+            db.merge(SummaryCacheEntry(
+                key=key,
+                kind=kind,
+                model=model,
+                summary=summary,
+                size=len(summary.encode('utf-8')),
+                hit_count=0,
+                created_at=datetime.now(timezone.utc),
+                last_accessed_at=datetime.now(timezone.utc)
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self._db_failed(e)
+            return
+        finally:
+            db.close()
+
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % SUMMARY_CACHE_EVICT_EVERY == 0
+        if should_evict:
+            try:
+                self.evict()
+            except Exception as e:
+                self._db_failed(e)
+
+
+summary_cache = SummaryCache()
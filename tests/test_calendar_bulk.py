@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import calendar_utils
+from calendar_fake import FakeCalendarBackend
+
+CALENDAR_ID = 'me@example.com'
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = FakeCalendarBackend()
+    backend.add_calendar(CALENDAR_ID, '기본 캘린더', primary=True)
+    monkeypatch.setattr(calendar_utils, 'get_calendar_service', lambda: backend)
+    return backend
+
+
+def test_non_dict_operations_fail_per_entry(backend):
+    start = datetime.now(calendar_utils.KST) + timedelta(hours=1)
+    results = calendar_utils.bulk_calendar_operations([
+        'x',
+        None,
+        {'op': 'create', 'calendar_id': CALENDAR_ID, 'title': '회의',
+         'start_time': start.isoformat(), 'end_time': (start + timedelta(hours=1)).isoformat()},
+    ])
+
+    assert [result['success'] for result in results] == [False, False, True]
+    assert results[0] == {'success': False, 'op': None, 'error': '작업은 객체여야 합니다.'}
+
+
+def test_missing_event_reports_not_found(backend):
+    results = calendar_utils.bulk_calendar_operations([
+        {'op': 'delete', 'calendar_id': CALENDAR_ID, 'event_id': 'missing'},
+        {'op': 'update', 'calendar_id': CALENDAR_ID, 'event_id': 'missing', 'title': '새 제목'},
+    ])
+
+    for result in results:
+        assert result['success'] is False
+        assert result['error'] == '일정을 찾을 수 없습니다. 이미 삭제되었을 수 있습니다.'
+
+
+def _create_event(backend, title):
+    start = datetime.now(calendar_utils.KST) + timedelta(hours=1)
+    result = calendar_utils.create_calendar_event(
+        CALENDAR_ID, title, start.isoformat(), (start + timedelta(hours=1)).isoformat()
+    )
+    return result['id']
+
+
+def test_stale_cache_without_etag_still_sends_fields(backend):
+    event_id = _create_event(backend, '원래 제목')
+    # 로컬 사본이 모르는 사이 다른 곳에서 제목이 바뀜
+    backend.events().patch(calendarId=CALENDAR_ID, eventId=event_id, body={'summary': '다른 곳 수정'}).execute()
+
+    result = calendar_utils.update_calendar_event(CALENDAR_ID, event_id, title='원래 제목')
+    assert result['success'] is True
+    assert backend.events().get(calendarId=CALENDAR_ID, eventId=event_id).execute()['summary'] == '원래 제목'
+
+    calendar_utils.bulk_calendar_operations([
+        {'op': 'update', 'calendar_id': CALENDAR_ID, 'event_id': event_id, 'title': '다른 곳 수정'},
+    ])
+    backend.events().patch(calendarId=CALENDAR_ID, eventId=event_id, body={'summary': '또 수정'}).execute()
+    results = calendar_utils.bulk_calendar_operations([
+        {'op': 'update', 'calendar_id': CALENDAR_ID, 'event_id': event_id, 'title': '다른 곳 수정'},
+    ])
+    assert results[0]['success'] is True
+    assert backend.events().get(calendarId=CALENDAR_ID, eventId=event_id).execute()['summary'] == '다른 곳 수정'
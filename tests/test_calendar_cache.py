@@ -0,0 +1,35 @@
+import threading
+import time
+
+from calendar_cache import KEY_LOCK_STRIPES, TTLCache
+
+
+def test_key_locks_do_not_grow_with_rotating_keys():
+    cache = TTLCache(ttl=60, stale_ttl=0, max_entries=8)
+    for index in range(1000):
+        cache.get_or_load(('events', index), lambda: index)
+        if index % 10 == 0:
+            cache.invalidate()
+
+    assert len(cache._key_locks) == KEY_LOCK_STRIPES
+    assert cache.stats()['size'] <= 8
+
+
+def test_concurrent_misses_load_once():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load('key', loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['value'] * 5
+    assert len(calls) == 1
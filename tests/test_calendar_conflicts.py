@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import calendar_utils
+from calendar_fake import FakeCalendarBackend
+from calendar_sync import CalendarSyncer
+
+OWNED = 'me@example.com'
+SHARED = 'team@example.com'
+READ_ONLY = 'holidays@example.com'
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = FakeCalendarBackend()
+    backend.add_calendar(OWNED, '기본 캘린더', primary=True)
+    backend.add_calendar(SHARED, '팀', access_role='writer')
+    backend.add_calendar(READ_ONLY, '공휴일', access_role='reader')
+    syncer = CalendarSyncer(lambda: backend, sync_interval=0)
+    syncer.get_calendars()
+    monkeypatch.setattr(calendar_utils, '_syncer', syncer)
+    monkeypatch.setattr(calendar_utils, 'event_store', syncer.store)
+    monkeypatch.setattr(calendar_utils, '_conflict_index_key', None)
+    monkeypatch.setattr(calendar_utils, '_conflict_intervals', {})
+
+    def no_network():
+        raise AssertionError('캘린더 목록은 캐시에서 읽어야 합니다.')
+    monkeypatch.setattr(calendar_utils, 'get_calendar_list', no_network)
+    return backend
+
+
+def _insert(backend, calendar_id, title, start):
+    body = {
+        'summary': title,
+        'start': {'dateTime': start.isoformat()},
+        'end': {'dateTime': (start + timedelta(hours=1)).isoformat()},
+    }
+    return backend.events().insert(calendarId=calendar_id, body=body).execute()
+
+
+def test_conflict_index_rebuilds_only_changed_calendars(backend, monkeypatch):
+    start = datetime.now(calendar_utils.KST).replace(microsecond=0) + timedelta(days=1)
+    _insert(backend, OWNED, '내 회의', start)
+    _insert(backend, READ_ONLY, '공휴일', start)
+    calendar_utils._syncer.sync([OWNED, SHARED, READ_ONLY])
+
+    built = []
+    original = calendar_utils.event_intervals
+    monkeypatch.setattr(calendar_utils, 'event_intervals',
+                        lambda calendar_id, events: built.append(calendar_id) or original(calendar_id, events))
+
+    index = calendar_utils.get_conflict_index()
+    assert sorted(built) == sorted([OWNED, SHARED])
+    assert [event['title'] for event in index.overlapping(start, start + timedelta(minutes=30))] == ['내 회의']
+    assert calendar_utils.get_conflict_index() is index
+
+    built.clear()
+    _insert(backend, SHARED, '팀 회의', start + timedelta(hours=2))
+    calendar_utils._syncer.sync([SHARED])
+    index = calendar_utils.get_conflict_index()
+    assert built == [SHARED]
+    assert len(index) == 2
+
+
+def test_conflicts_use_saved_times_when_past_start_is_shifted(backend, monkeypatch):
+    monkeypatch.setattr(calendar_utils, 'get_calendar_service', lambda: backend)
+    now = datetime.now(calendar_utils.KST).replace(microsecond=0)
+    _insert(backend, OWNED, '곧 시작하는 회의', now + timedelta(minutes=5))
+    calendar_utils._syncer.sync([OWNED, SHARED])
+
+    past = now - timedelta(days=2)
+    result = calendar_utils.create_calendar_event(
+        calendar_id=OWNED, title='지난 시간으로 만든 일정',
+        start_time=past.isoformat(), end_time=(past + timedelta(minutes=30)).isoformat()
+    )
+    assert result['success']
+    saved_start = datetime.fromisoformat(result['start'])
+    assert saved_start > now
+
+    # 요청 시간(이틀 전)에는 충돌이 없지만 실제로 저장된 시간은 곧 시작하는 회의와 겹침
+    assert calendar_utils.check_conflicts(past.isoformat(), (past + timedelta(minutes=30)).isoformat())['conflicts'] == []
+    conflicts = calendar_utils.check_conflicts(result['start'], result['end'], exclude_event_id=result['id'])
+    assert [conflict['title'] for conflict in conflicts['conflicts']] == ['곧 시작하는 회의']
@@ -0,0 +1,32 @@
+import threading
+from types import SimpleNamespace
+
+import calendar_fetch
+
+
+def test_execute_parallel_reuses_one_executor():
+    def builder(key):
+        def build(service):
+            return SimpleNamespace(execute=lambda: (key, threading.current_thread().name))
+        return build
+
+    first, errors = calendar_fetch.execute_parallel(lambda: None, {'a': builder('a'), 'b': builder('b')}, max_workers=2)
+    executor = calendar_fetch._executor
+    second, _ = calendar_fetch.execute_parallel(lambda: None, {'c': builder('c')}, max_workers=2)
+
+    assert errors == {}
+    assert calendar_fetch._executor is executor
+    assert {key for key, _ in first.values()} == {'a', 'b'}
+    names = [name for _, name in list(first.values()) + list(second.values())]
+    assert all(name.startswith('calendar-fetch') for name in names)
+
+
+def test_execute_parallel_reports_errors_per_key():
+    def failing(service):
+        raise ValueError('실패')
+
+    results, errors = calendar_fetch.execute_parallel(
+        lambda: None, {'ok': lambda service: SimpleNamespace(execute=lambda: 1), 'bad': failing}
+    )
+    assert results == {'ok': 1}
+    assert isinstance(errors['bad'], ValueError)
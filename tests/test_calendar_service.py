@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+
+import httplib2
+from google.oauth2.credentials import Credentials
+
+import calendar_utils
+
+refresh_started = threading.Event()
+refresh_release = threading.Event()
+
+
+class BlockingCredentials(Credentials):
+    """refresh()가 refresh_release까지 기다리는 인증 정보 (느린 토큰 갱신 흉내)."""
+
+    def refresh(self, request):
+        refresh_started.set()
+        refresh_release.wait(5)
+        self.token = 'new-token'
+
+
+class FakeHttp:
+    created = []
+
+    def __init__(self):
+        self.headers = []
+        FakeHttp.created.append(self)
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        self.headers.append(dict(headers or {}))
+        return httplib2.Response({'status': '200'}), json.dumps({'items': []}).encode('utf-8')
+
+    def close(self):
+        pass
+
+
+def make_manager(tmp_path, creds):
+    manager = calendar_utils.CalendarServiceManager(token_path=str(tmp_path / 'token.pickle'))
+    manager._load_token = lambda: creds
+    return manager
+
+
+def test_service_is_built_once_and_shared_across_threads(tmp_path, monkeypatch):
+    builds = []
+    real_build = calendar_utils.build
+
+    def counting_build(*args, **kwargs):
+        builds.append(threading.get_ident())
+        return real_build(*args, **kwargs)
+    monkeypatch.setattr(calendar_utils, 'build', counting_build)
+    monkeypatch.setattr(calendar_utils, 'build_http', FakeHttp)
+    FakeHttp.created = []
+    manager = make_manager(tmp_path, Credentials('old-token'))
+
+    services = []
+
+    def worker():
+        service = manager.get_service()
+        service.calendarList().list().execute()
+        services.append(service)
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert len({id(service) for service in services}) == 1
+    # 연결은 풀에서 빌려 쓰므로 요청 수보다 많이 만들지 않음
+    assert 1 <= len(FakeHttp.created) <= 6
+    sent = [headers for http in FakeHttp.created for headers in http.headers]
+    assert len(sent) == 6
+    assert all(headers['authorization'] == 'Bearer old-token' for headers in sent)
+
+
+def test_background_refresh_does_not_block_requests(tmp_path):
+    refresh_started.clear()
+    refresh_release.clear()
+    creds = BlockingCredentials('old-token', refresh_token='refresh')
+    manager = make_manager(tmp_path, creds)
+    assert manager.get_credentials() is creds
+
+    refresher = threading.Thread(target=manager._background_refresh)
+    refresher.start()
+    try:
+        assert refresh_started.wait(5)
+        started = time.monotonic()
+        # 갱신이 끝나지 않았어도 기존 토큰을 바로 받음
+        assert manager.get_credentials() is creds
+        assert time.monotonic() - started < 1
+    finally:
+        refresh_release.set()
+        refresher.join(5)
+
+    refreshed = manager.get_credentials()
+    assert refreshed is not creds
+    assert refreshed.token == 'new-token'
+    assert creds.token == 'old-token'
+    assert (tmp_path / 'token.pickle').exists()
+    manager.reset()
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from calendar_fake import FakeCalendarBackend
+from calendar_range import RangeQueryEngine
+from calendar_sync import KST, CalendarSyncer
+
+CALENDAR_ID = 'me@example.com'
+
+
+def _event_body(title, start, minutes=30):
+    return {
+        'summary': title,
+        'start': {'dateTime': start.isoformat()},
+        'end': {'dateTime': (start + timedelta(minutes=minutes)).isoformat()},
+    }
+
+
+@pytest.fixture
+def backend():
+    backend = FakeCalendarBackend()
+    backend.add_calendar(CALENDAR_ID, '기본 캘린더', primary=True)
+    return backend
+
+
+@pytest.fixture
+def syncer(backend):
+    return CalendarSyncer(lambda: backend, sync_interval=0, window_days=30)
+
+
+@pytest.fixture
+def list_calls(backend, monkeypatch):
+    """backend에 보낸 events().list 요청 인자 기록."""
+    calls = []
+    original = backend._list
+
+    def recording_list(headers, **kwargs):
+        calls.append(kwargs)
+        return original(headers, **kwargs)
+
+    monkeypatch.setattr(backend, '_list', recording_list)
+    return calls
+
+
+def _insert(backend, title, start, minutes=30):
+    return backend.events().insert(calendarId=CALENDAR_ID, body=_event_body(title, start, minutes)).execute()
+
+
+def _titles(store):
+    return sorted(event['summary'] for event in store.events(CALENDAR_ID))
+
+
+def test_full_sync_then_incremental_sync_with_token(backend, syncer, list_calls):
+    now = datetime.now(KST)
+    first = _insert(backend, '첫 일정', now + timedelta(hours=1))
+    _insert(backend, '둘째 일정', now + timedelta(hours=2))
+
+    syncer.refresh(force=True)
+    assert _titles(syncer.store) == ['둘째 일정', '첫 일정']
+    assert 'syncToken' not in list_calls[-1]
+    assert 'timeMin' in list_calls[-1]
+    token = syncer.store.sync_token(CALENDAR_ID)
+    assert token
+
+    backend.events().patch(calendarId=CALENDAR_ID, eventId=first['id'], body={'summary': '바뀐 일정'}).execute()
+    _insert(backend, '새 일정', now + timedelta(hours=3))
+    syncer.refresh(force=True)
+
+    assert list_calls[-1]['syncToken'] == token
+    assert 'timeMin' not in list_calls[-1]
+    assert _titles(syncer.store) == ['둘째 일정', '바뀐 일정', '새 일정']
+    assert syncer.store.sync_token(CALENDAR_ID) != token
+
+
+def test_sync_without_changes_keeps_store_version(backend, syncer):
+    _insert(backend, '일정', datetime.now(KST) + timedelta(hours=1))
+    syncer.refresh(force=True)
+    version = syncer.store.version
+
+    syncer.refresh(force=True)
+    syncer.refresh(force=True)
+
+    assert syncer.store.version == version
+
+
+def test_gone_sync_token_forces_full_resync(backend, syncer, list_calls):
+    now = datetime.now(KST)
+    _insert(backend, '기존 일정', now + timedelta(hours=1))
+    syncer.refresh(force=True)
+    old_token = syncer.store.sync_token(CALENDAR_ID)
+
+    backend.invalidate_sync_tokens()
+    _insert(backend, '토큰 만료 후 일정', now + timedelta(hours=2))
+    syncer.refresh(force=True)
+
+    # 410을 받은 증분 요청 뒤 토큰 없이 전체 목록을 다시 요청
+    assert list_calls[-2].get('syncToken') == old_token
+    assert 'syncToken' not in list_calls[-1]
+    assert _titles(syncer.store) == ['기존 일정', '토큰 만료 후 일정']
+    assert syncer.store.sync_token(CALENDAR_ID) != old_token
+
+
+def test_deleted_events_are_removed_from_store(backend, syncer):
+    now = datetime.now(KST)
+    doomed = _insert(backend, '삭제할 일정', now + timedelta(hours=1))
+    _insert(backend, '남길 일정', now + timedelta(hours=2))
+    syncer.refresh(force=True)
+    assert syncer.store.get(CALENDAR_ID, doomed['id']) is not None
+
+    backend.events().delete(calendarId=CALENDAR_ID, eventId=doomed['id']).execute()
+    syncer.refresh(force=True)
+
+    assert syncer.store.get(CALENDAR_ID, doomed['id']) is None
+    assert _titles(syncer.store) == ['남길 일정']
+
+
+def test_cancelled_events_are_skipped_on_full_resync(backend, syncer):
+    now = datetime.now(KST)
+    doomed = _insert(backend, '삭제할 일정', now + timedelta(hours=1))
+    backend.events().delete(calendarId=CALENDAR_ID, eventId=doomed['id']).execute()
+    backend.invalidate_sync_tokens()
+
+    syncer.refresh(force=True)
+
+    assert syncer.store.events(CALENDAR_ID) == []
+
+
+def test_ranges_before_sync_window_are_fetched_live(backend, syncer):
+    now = datetime.now(KST)
+    _insert(backend, '오래된 일정', now - timedelta(days=60))
+    _insert(backend, '최근 일정', now + timedelta(hours=1))
+    engine = RangeQueryEngine(syncer, window_ttl=60)
+
+    _, recent = engine.query(now - timedelta(days=1), now + timedelta(days=1))
+    assert [event['summary'] for event in recent[CALENDAR_ID]] == ['최근 일정']
+    assert engine.upstream_requests == 0
+    assert _titles(syncer.store) == ['최근 일정']
+
+    _, old = engine.query(now - timedelta(days=90), now - timedelta(days=30))
+    assert [event['summary'] for event in old[CALENDAR_ID]] == ['오래된 일정']
+    assert engine.upstream_requests == 1
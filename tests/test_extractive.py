@@ -0,0 +1,34 @@
+import extractive
+
+TOPICS = ['예산', '일정', '마케팅', '채용', '출시', '보안', '고객', '품질']
+
+
+def _transcript(count):
+    return "\n".join(
+        f"{i}번 발언: {TOPICS[i % len(TOPICS)]} 안건에서 담당자{i}가 항목{i}을 검토하기로 했습니다."
+        for i in range(count)
+    )
+
+
+def test_long_text_is_ranked_in_bounded_blocks(monkeypatch):
+    shapes = []
+    original = extractive.dense_matrix
+
+    def recording(vectors):
+        matrix = original(vectors)
+        shapes.append(matrix.shape)
+        return matrix
+    monkeypatch.setattr(extractive, 'dense_matrix', recording)
+
+    summary = extractive.summarize(_transcript(700), max_sentences=5)
+
+    assert len(shapes) == 3
+    assert max(rows for rows, _ in shapes) == extractive.RANK_BLOCK_SENTENCES
+    assert len(summary.split("\n")) == 5
+
+
+def test_vectors_are_sparse_and_normalized():
+    vectors = extractive.tfidf_vectors(extractive.split_sentences(_transcript(20)))
+    assert all(abs(extractive.cosine(vector, vector) - 1) < 1e-9 for vector in vectors)
+    # 각 문장 벡터에는 그 문장에 나온 특징만 있음
+    assert max(len(vector) for vector in vectors) < len(set().union(*vectors))
@@ -0,0 +1,127 @@
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import news_briefing
+from feed_fetcher import FeedFetcher, entry_guid
+
+
+class FeedServer:
+    """ETag/Last-Modified를 지원하는 RSS 스텁 서버."""
+
+    def __init__(self):
+        self.items = []
+        self.version = 0
+        self.statuses = []
+        self.validators = []     # 요청마다 (If-None-Match, If-Modified-Since)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                etag = f'"v{server.version}"'
+                modified = formatdate(1704067200 + server.version * 3600, usegmt=True)
+                server.validators.append((self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since')))
+                if self.headers.get('If-None-Match') == etag:
+                    server.statuses.append(304)
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                server.statuses.append(200)
+                body = server.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', modified)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._httpd.server_address[1]}/rss'
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def add_item(self, guid, title):
+        self.items.append((guid, title))
+        self.version += 1
+
+    def render(self):
+        items = "".join(
+            f"<item><guid>https://example.com/news/{guid}</guid><title>{title}</title><link>https://example.com/news/{guid}</link>"
+            f"<description>&lt;p&gt;{title} 본문입니다.&lt;/p&gt;</description></item>"
+            for guid, title in self.items
+        )
+        return f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def _guids(entries):
+    return [entry_guid(entry).rsplit('/', 1)[-1] for entry in entries]
+
+
+@pytest.fixture
+def server():
+    server = FeedServer()
+    server.add_item('a', '첫 기사')
+    server.add_item('b', '둘째 기사')
+    yield server
+    server.close()
+
+
+def test_unchanged_feed_is_revalidated_with_304(server):
+    fetcher = FeedFetcher()
+    first = fetcher.fetch(server.url)
+    assert _guids(first['new_entries']) == ['a', 'b']
+
+    second = fetcher.fetch(server.url)
+    assert server.statuses == [200, 304]
+    assert server.validators[1] == ('"v2"', formatdate(1704067200 + 2 * 3600, usegmt=True))
+    assert second['not_modified'] is True
+    assert _guids(second['entries']) == ['a', 'b']
+    assert second['new_entries'] == []
+
+
+def test_changed_validators_take_the_200_path(server):
+    fetcher = FeedFetcher()
+    fetcher.fetch(server.url)
+    server.add_item('c', '셋째 기사')
+
+    result = fetcher.fetch(server.url)
+    assert server.statuses == [200, 200]
+    assert result['not_modified'] is False
+    assert _guids(result['entries']) == ['a', 'b', 'c']
+    assert _guids(result['new_entries']) == ['c']
+
+    fetcher.fetch(server.url)
+    assert server.statuses[-1] == 304
+
+
+def test_only_unseen_entries_are_summarized(server, monkeypatch):
+    summarized = []
+
+    def fake_summarize_batch(texts, backend=None):
+        summarized.append(list(texts))
+        return [f"요약: {text}" for text in texts]
+
+    monkeypatch.setattr(news_briefing, 'feed_fetcher', FeedFetcher())
+    monkeypatch.setattr(news_briefing, '_entry_results', type(news_briefing._entry_results)())
+    monkeypatch.setattr(news_briefing, 'summarize_batch', fake_summarize_batch)
+
+    briefing = news_briefing.fetch_and_summarize_rss(server.url, limit=5)
+    assert summarized == [['첫 기사 본문입니다.', '둘째 기사 본문입니다.']]
+    assert '요약: 첫 기사 본문입니다.' in briefing
+
+    news_briefing.fetch_and_summarize_rss(server.url, limit=5)
+    assert len(summarized) == 1
+
+    server.add_item('c', '셋째 기사')
+    briefing = news_briefing.fetch_and_summarize_rss(server.url, limit=5)
+    assert summarized[1:] == [['셋째 기사 본문입니다.']]
+    assert briefing.count('요약:') == 3
@@ -0,0 +1,30 @@
+import pytest
+
+from html_text import extract_paragraphs, extract_paragraphs_reference
+
+# 실제 피드에서 볼 수 있는 형태들
+PARITY_CORPUS = [
+    "",
+    "<p>단일 문단</p>",
+    "<p>첫 문단</p><p>둘째 문단</p>",
+    "<div><p>  공백이   있는 <b>굵은</b> 글씨 </p></div>",
+    "<p>줄<br>바꿈<br/>포함</p><img src='a.jpg'><p>이미지 뒤</p>",
+    "<p>엔티티 &amp; &lt;태그&gt; &nbsp;&#48;&#x31;</p>",
+    "<p>닫히지 않은 문단<p>다음 문단</p>",
+    "<p>바깥<p>안쪽</p>남은 글</p>",
+    "<div><p>div가 먼저 닫힘</div>밖의 글<p>새 문단</p>",
+    "<p>스크립트 <script>var x = '<p>';</script>제외</p>",
+    "<p>스타일<style>p { color: red; }</style> 제외</p>",
+    "<p><!-- 주석 -->주석 제외</p>",
+    "</p>짝 없는 닫는 태그<p>정상</p>",
+    "<p></p><p>   </p><p>빈 문단 뒤</p>",
+    "<P>대문자 태그</P>",
+    "<p>속성 <a href=\"https://example.com?a=1&b=2\">링크</a> 포함</p>",
+    "<figure><img src='x'><figcaption>캡션</figcaption></figure><p>본문</p>",
+    "<p>ZDNet Korea 기사<span>중첩<em>강조</em></span>끝</p>" * 20,
+]
+
+
+@pytest.mark.parametrize('html', PARITY_CORPUS)
+def test_extract_paragraphs_matches_reference(html):
+    assert extract_paragraphs(html) == extract_paragraphs_reference(html)
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+import llm_gateway
+from llm_gateway import LLMDeadlineExceeded, LLMGateway
+
+MESSAGES = [{'role': 'user', 'content': '요약해 주세요'}]
+
+
+class StubOpenAI:
+    """chat/completions 응답 순서를 정할 수 있는 OpenAI 스텁 서버.
+
+    responses의 각 항목은 (상태 코드, 헤더 dict)이며, 다 쓰면 200으로 응답합니다.
+    """
+
+    def __init__(self, responses=(), delay=0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with server._lock:
+                    server.requests += 1
+                    status, headers = server.responses.pop(0) if server.responses else (200, {})
+                time.sleep(server.delay)
+                if status == 200:
+                    body = {
+                        'id': 'chatcmpl-1', 'object': 'chat.completion', 'created': 0, 'model': 'gpt-test',
+                        'choices': [{'index': 0, 'finish_reason': 'stop',
+                                     'message': {'role': 'assistant', 'content': '요약'}}],
+                        'usage': {'prompt_tokens': 5, 'completion_tokens': 2, 'total_tokens': 7}
+                    }
+                else:
+                    body = {'error': {'message': f'status {status}', 'type': 'error'}}
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f'http://127.0.0.1:{self._httpd.server_address[1]}/v1'
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def gateway(self, **kwargs):
+        return LLMGateway(api_key='test', base_url=self.base_url, **kwargs)
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(*args, **kwargs):
+        servers.append(StubOpenAI(*args, **kwargs))
+        return servers[-1]
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(llm_gateway, 'LLM_BACKOFF_BASE', 0.01)
+
+
+def test_retry_after_then_success(stub):
+    server = stub([(429, {'Retry-After': '0.2'})])
+    gateway = server.gateway(requests_per_minute=60)
+
+    started = time.monotonic()
+    resp = gateway.chat(MESSAGES, 'gpt-test', 10)
+    assert resp.choices[0].message.content == '요약'
+    assert server.requests == 2
+    assert time.monotonic() - started >= 0.2
+    # 재시도해도 요청 한도는 호출당 한 번만 차감
+    assert gateway.request_bucket._tokens == pytest.approx(59, abs=0.5)
+
+
+def test_server_errors_give_up_after_max_retries(stub):
+    server = stub([(500, {})] * 10)
+    gateway = server.gateway(max_retries=2)
+
+    with pytest.raises(openai.InternalServerError):
+        gateway.chat(MESSAGES, 'gpt-test', 10)
+    assert server.requests == 3
+
+
+def test_deadline_while_waiting_for_rate_limit(stub):
+    server = stub()
+    gateway = server.gateway(requests_per_minute=1)
+    gateway.chat(MESSAGES, 'gpt-test', 10)
+
+    started = time.monotonic()
+    with pytest.raises(LLMDeadlineExceeded):
+        gateway.chat([{'role': 'user', 'content': '다른 요청'}], 'gpt-test', 10, timeout=0.3)
+    assert time.monotonic() - started < 0.3
+    assert server.requests == 1
+
+
+def test_concurrent_identical_calls_are_sent_once(stub):
+    server = stub(delay=0.3)
+    gateway = server.gateway()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: gateway.chat(MESSAGES, 'gpt-test', 10), range(5)))
+    assert server.requests == 1
+    assert all(resp is results[0] for resp in results)
+
+
+def test_follower_waits_only_until_its_own_deadline(stub):
+    server = stub(delay=1.0)
+    gateway = server.gateway()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(gateway.chat, MESSAGES, 'gpt-test', 10)
+        while not gateway._inflight:
+            time.sleep(0.01)
+        started = time.monotonic()
+        with pytest.raises(LLMDeadlineExceeded):
+            gateway.chat(MESSAGES, 'gpt-test', 10, timeout=0.2)
+        assert time.monotonic() - started < 0.8
+        assert leader.result().choices[0].message.content == '요약'
+    assert server.requests == 1
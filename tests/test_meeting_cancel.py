@@ -0,0 +1,53 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import summarizer
+from meeting_jobs import CANCELLED, MeetingJobQueue
+
+SPEAKERS = "\n\n".join(f"화자{i}: " + "회의 내용을 길게 말합니다. " * 400 for i in range(6))
+
+
+@pytest.fixture
+def chunk_calls(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_chunk(index, total, chunk):
+        calls.append(index)
+        release.wait(5)
+        return f"구간 {index} 정리"
+    monkeypatch.setattr(summarizer, '_summarize_meeting_chunk', fake_chunk)
+    monkeypatch.setattr(summarizer, 'llm', SimpleNamespace(stream_chat=lambda **kwargs: iter(())))
+    return calls, release
+
+
+def test_map_phase_stops_between_chunks(chunk_calls):
+    calls, release = chunk_calls
+    release.set()
+    assert len(summarizer.chunk_transcript(SPEAKERS)) > 2
+
+    with summarizer.meeting_cancellation(lambda: len(calls) >= 1):
+        with pytest.raises(summarizer.MeetingCancelled):
+            summarizer._reduce_input(SPEAKERS, max_workers=1)
+    assert calls == [1]
+
+
+def test_cancelled_job_stops_in_map_phase(chunk_calls, monkeypatch):
+    calls, release = chunk_calls
+    monkeypatch.setattr(summarizer._reduce_input, '__defaults__', (1,))
+    jobs = MeetingJobQueue(workers=1)
+    job = jobs.submit(SPEAKERS, backend='openai')
+
+    deadline = time.monotonic() + 5
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    jobs.cancel(job.id)
+    release.set()
+
+    events = [event for event in jobs.subscribe(job.id) if event]
+    assert events[-1][0] == 'cancelled'
+    assert jobs.get(job.id)['state'] == CANCELLED
+    assert calls == [1]
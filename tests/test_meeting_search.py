@@ -0,0 +1,33 @@
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+import meeting_search
+
+
+def test_cursor_round_trip():
+    cursor = meeting_search.encode_cursor(0.0607927, 42)
+    assert meeting_search.decode_cursor(cursor) == (0.0607927, 42)
+    assert meeting_search.decode_cursor('잘못된') is None
+
+
+def test_next_page_uses_keyset_on_rank_and_id(monkeypatch):
+    statements = []
+
+    def compile_only(query):
+        statements.append(str(query.statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}
+        )))
+        return []
+    monkeypatch.setattr(Query, 'all', compile_only)
+
+    cursor = meeting_search.encode_cursor(0.5, 42)
+    result = meeting_search.search_meetings(Session(), '예산', after=cursor)
+    assert result == {'results': [], 'has_more': False, 'next_cursor': None}
+
+    sql = statements[0]
+    assert 'OFFSET' not in sql
+    assert '(CAST(0.5 AS REAL), 42)' in sql
+    # 저장된 컬럼(ix_meetings_search_vector)으로 검색하고 순위를 매기며 to_tsvector를 다시 계산하지 않음
+    assert 'meetings.search_vector @@' in sql
+    assert 'ts_rank_cd(meetings.search_vector,' in sql
+    assert 'to_tsvector' not in sql
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+import meeting_tags
+from models.meeting import Tag
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+
+
+def test_parse_tags_skips_non_string_items():
+    assert meeting_tags.parse_tags(['#Plan, 예산', 1, None, 'plan']) == ['plan', '예산']
+    assert meeting_tags.parse_tags([1, None]) == []
+    assert meeting_tags.parse_tags(5) == []
+
+
+def test_get_or_create_tags_counts_usage_in_one_upsert(monkeypatch):
+    statements = []
+
+    class FakeSession:
+        def execute(self, statement):
+            statements.append(_sql(statement))
+
+        def query(self, *entities):
+            return Query(entities, self)
+
+    monkeypatch.setattr(Query, '__iter__', lambda query: iter([Tag(id=2, name='예산'), Tag(id=1, name='plan')]))
+
+    tags = meeting_tags.get_or_create_tags(FakeSession(), ['plan', 2, '예산'])
+    assert [tag.name for tag in tags] == ['plan', '예산']
+    assert len(statements) == 1
+    assert "VALUES ('plan', 1), ('예산', 1)" in statements[0]
+    assert 'ON CONFLICT (name) DO UPDATE SET usage_count = (tags.usage_count + ' in statements[0]
+
+
+def test_release_tags_decrements_usage(monkeypatch):
+    updates = []
+
+    def capture_update(query, values, synchronize_session='evaluate'):
+        updates.append((_sql(query.statement), values))
+    monkeypatch.setattr(Query, 'update', capture_update)
+
+    db = SimpleNamespace(query=lambda *entities: Query(entities, db))
+    meeting_tags.release_tags(db, [])
+    assert updates == []
+    meeting_tags.release_tags(db, [Tag(id=1, name='plan'), Tag(id=2, name='예산')])
+    sql, values = updates[0]
+    assert 'tags.id IN (1, 2)' in sql
+    assert _sql(values[Tag.usage_count]) == 'tags.usage_count - 1'
+
+
+def test_tag_facets_read_usage_count_without_grouping(monkeypatch):
+    statements = []
+
+    def compile_only(query):
+        statements.append(_sql(query.statement))
+        return [('plan', 3), ('예산', 1)]
+    monkeypatch.setattr(Query, 'all', compile_only)
+    meeting_tags.invalidate_tag_facets()
+    try:
+        assert meeting_tags.tag_facets() == [{'name': 'plan', 'count': 3}, {'name': '예산', 'count': 1}]
+    finally:
+        meeting_tags.invalidate_tag_facets()
+
+    assert 'GROUP BY' not in statements[0]
+    assert 'meeting_tags' not in statements[0]
+    assert 'ORDER BY tags.usage_count DESC, tags.name' in statements[0]
+
+
+def test_tag_filter_rejects_more_tags_than_the_limit():
+    names = [f'tag{i}' for i in range(meeting_tags.MEETING_TAG_FILTER_LIMIT)]
+    sql = _sql(meeting_tags.tag_filter(names))
+    assert f'count(*) = {meeting_tags.MEETING_TAG_FILTER_LIMIT}' in sql
+    assert meeting_tags.tag_filter('') is None
+
+    with pytest.raises(ValueError):
+        meeting_tags.tag_filter(names + ['one-more'])
@@ -0,0 +1,32 @@
+import feedparser
+import httpx2
+import openai
+
+import news_briefing
+
+REQUEST = httpx2.Request('POST', 'https://api.openai.com/v1/chat/completions')
+
+
+def _entry(index):
+    return feedparser.FeedParserDict(
+        title=f'기사 {index}',
+        link=f'https://news.example.com/{index}',
+        summary=f'<p>{index}번 기사 본문입니다. 회의 일정과 예산 논의 결과를 정리했습니다.</p>'
+    )
+
+
+def test_batch_rate_limit_does_not_fan_out_per_article(monkeypatch):
+    def rate_limited(texts, backend=None):
+        raise openai.RateLimitError('한도 초과', response=httpx2.Response(429, request=REQUEST), body=None)
+
+    single_calls = []
+    monkeypatch.setattr(news_briefing, 'summarize_batch', rate_limited)
+    monkeypatch.setattr(news_briefing, 'summarize_text', lambda text, backend=None: single_calls.append(text))
+
+    entries = [_entry(1), feedparser.FeedParserDict(title='빈 기사', link='https://news.example.com/empty'), _entry(2)]
+    articles = news_briefing.summarize_articles(entries, mode='batch')
+
+    assert single_calls == []
+    assert articles[1] is None
+    assert [article['summary'] for article in (articles[0], articles[2])] == [news_briefing.SUMMARY_FAILED] * 2
+    assert articles[0]['link'] == 'https://news.example.com/1'
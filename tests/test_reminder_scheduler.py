@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta, timezone
+
+import reminder_scheduler
+from reminder_scheduler import ReminderScheduler
+
+
+def _event(event_id, start, minutes=10):
+    return {
+        'id': event_id,
+        'calendar_id': 'me@example.com',
+        'title': event_id,
+        'start_time': start.isoformat(),
+        'reminder_minutes': minutes,
+    }
+
+
+def test_reminder_ids_follow_latest_id_across_restarts(monkeypatch):
+    now = datetime.now(timezone.utc)
+    first = ReminderScheduler(deliver=lambda reminder: None)
+    first.update_events([_event('a', now + timedelta(minutes=20))])
+    seen = first.latest_id()
+    fired = first.fire_due(now + timedelta(minutes=15))
+    assert fired[0]['id'] > seen
+    assert first.latest_id() == fired[0]['id']
+
+    # 재시작한 프로세스의 id는 이전 실행의 id보다 큼
+    monkeypatch.setattr(reminder_scheduler.time, 'time', lambda: now.timestamp() + 1)
+    restarted = ReminderScheduler(deliver=lambda reminder: None)
+    restarted.update_events([_event('b', now + timedelta(minutes=20))])
+    assert restarted.latest_id() >= fired[0]['id']
+    assert restarted.fire_due(now + timedelta(minutes=15))[0]['id'] > fired[0]['id']
+
+
+def test_reminder_window_reaches_past_today(monkeypatch):
+    calls = []
+    monkeypatch.setattr(reminder_scheduler, 'get_events_between', lambda start, end: calls.append((start, end)) or [])
+    reminder_scheduler.load_reminder_events()
+
+    start, end = calls[0]
+    assert end - start == timedelta(minutes=reminder_scheduler.REMINDER_LOOKAHEAD_MINUTES)
+    assert abs(start - datetime.now(timezone.utc)) < timedelta(seconds=5)
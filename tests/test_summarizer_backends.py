@@ -0,0 +1,70 @@
+import metrics
+import summarizer
+from meeting_handler import stream_meeting_notes
+from meeting_jobs import MeetingJobQueue
+from summarizer import AutoBackend, SummarizerBackend, served_backend
+
+
+class FailingBackend(SummarizerBackend):
+    name = 'primary'
+
+    def __init__(self, available=True):
+        self._available = available
+
+    def available(self):
+        return self._available
+
+    def summarize(self, text):
+        raise ConnectionError('연결 실패')
+
+    def format_meeting(self, text):
+        raise ConnectionError('연결 실패')
+
+
+class LocalBackend(SummarizerBackend):
+    name = 'local'
+
+    def summarize(self, text):
+        return f'요약: {text}'
+
+    def format_meeting(self, text):
+        return f'회의록: {text}'
+
+
+def _fallbacks(method, reason):
+    return metrics.summarizer_fallbacks.value(method=method, primary='primary', fallback='local', reason=reason)
+
+
+def test_fallback_is_counted_and_reported():
+    backend = AutoBackend(FailingBackend(), LocalBackend())
+    before = _fallbacks('summarize', 'ConnectionError')
+
+    assert backend.summarize('본문') == '요약: 본문'
+    assert served_backend() == 'local'
+    assert _fallbacks('summarize', 'ConnectionError') == before + 1
+
+
+def test_unavailable_primary_is_counted():
+    backend = AutoBackend(FailingBackend(available=False), LocalBackend())
+    before = _fallbacks('stream_format_meeting', 'unavailable')
+
+    assert "".join(backend.stream_format_meeting('메모')) == '회의록: 메모'
+    assert _fallbacks('stream_format_meeting', 'unavailable') == before + 1
+
+
+def test_meeting_result_names_the_backend_used(monkeypatch):
+    monkeypatch.setitem(summarizer.BACKENDS, 'test-auto', AutoBackend(FailingBackend(), LocalBackend()))
+
+    events = list(stream_meeting_notes('메모', backend='test-auto'))
+    assert events[-1][0] == 'done'
+    assert events[-1][1]['backend'] == 'local'
+
+
+def test_job_payload_names_the_backend_used(monkeypatch):
+    monkeypatch.setitem(summarizer.BACKENDS, 'test-auto', AutoBackend(FailingBackend(), LocalBackend()))
+    jobs = MeetingJobQueue(workers=1)
+    job = jobs.submit('메모', backend='test-auto')
+
+    events = [event for event in jobs.subscribe(job.id) if event]
+    assert events[-1][0] == 'done'
+    assert jobs.get(job.id)['backend'] == 'local'
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import httpx2
+import openai
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import summarizer
+from llm_gateway import LLMDeadlineExceeded
+from models.summary_cache import SummaryCacheEntry
+from summary_cache import SummaryCache
+
+TEXTS = ['첫 기사 본문', '둘째 기사 본문']
+REQUEST = httpx2.Request('POST', 'https://api.openai.com/v1/chat/completions')
+
+
+class FakeLLM:
+    def __init__(self, batch_result):
+        self.batch_result = batch_result
+        self.operations = []
+
+    def chat(self, operation, **kwargs):
+        self.operations.append(operation)
+        if operation == 'article_batch':
+            if isinstance(self.batch_result, Exception):
+                raise self.batch_result
+            return self.batch_result
+        return _response('단건 요약')
+
+
+def _response(content, finish_reason='stop'):
+    return SimpleNamespace(choices=[SimpleNamespace(
+        finish_reason=finish_reason, message=SimpleNamespace(content=content)
+    )])
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    SummaryCacheEntry.__table__.create(engine)
+    monkeypatch.setattr(summarizer, 'summary_cache', SummaryCache(sessionmaker(bind=engine)))
+
+
+def _use(monkeypatch, batch_result):
+    llm = FakeLLM(batch_result)
+    monkeypatch.setattr(summarizer, 'llm', llm)
+    return llm
+
+
+@pytest.mark.parametrize('content', ['JSON 아님', '{"summaries": [{"id": 1, "summary": "하나"}]}', None])
+def test_unparseable_batch_falls_back_per_item(monkeypatch, content):
+    llm = _use(monkeypatch, _response(content))
+    assert summarizer._summarize_batch_uncached(TEXTS) == ['단건 요약', '단건 요약']
+    assert llm.operations == ['article_batch', 'article', 'article']
+
+
+@pytest.mark.parametrize('error', [
+    openai.RateLimitError('한도 초과', response=httpx2.Response(429, request=REQUEST), body=None),
+    openai.APIConnectionError(request=REQUEST),
+    openai.InternalServerError('서버 오류', response=httpx2.Response(500, request=REQUEST), body=None),
+    LLMDeadlineExceeded('제한 시간 초과'),
+])
+def test_transport_errors_are_not_multiplied(monkeypatch, error):
+    llm = _use(monkeypatch, error)
+    with pytest.raises(type(error)):
+        summarizer._summarize_batch_uncached(TEXTS)
+    assert llm.operations == ['article_batch']
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models.summary_cache import SummaryCacheEntry
+from summary_cache import SummaryCache
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    SummaryCacheEntry.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def _count_updates(session_factory):
+    updates = []
+    event.listen(session_factory.kw['bind'], 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: updates.append(statement)
+                 if statement.startswith('UPDATE') else None)
+    return updates
+
+
+def test_hits_are_recorded_in_one_batch(session_factory):
+    SummaryCache(session_factory).put('k', '요약', kind='article', model='m')
+    updates = _count_updates(session_factory)
+
+    cache = SummaryCache(session_factory)
+    assert cache.get('k') == '요약'   # DB 조회
+    assert cache.get('k') == '요약'   # LRU 조회
+    assert updates == []
+
+    assert cache.flush_touches() == 1
+    assert len(updates) == 1
+    db = session_factory()
+    assert db.get(SummaryCacheEntry, 'k').hit_count == 2
+
+
+def test_same_age_policy_for_memory_and_db(session_factory):
+    cache = SummaryCache(session_factory, max_age_days=1)
+    cache.put('k', '요약', kind='article', model='m')
+
+    # 오래전에 만들어졌어도 최근에 쓰였다면 유효
+    db = session_factory()
+    entry = db.get(SummaryCacheEntry, 'k')
+    entry.created_at = datetime.now(timezone.utc) - timedelta(days=10)
+    db.commit()
+    assert SummaryCache(session_factory, max_age_days=1).get('k') == '요약'
+
+    # 마지막 사용 후 max_age가 지나면 LRU와 DB 모두 만료
+    entry.last_accessed_at = datetime.now(timezone.utc) - timedelta(days=2)
+    db.commit()
+    cache._lru['k'] = ('요약', datetime.now(timezone.utc) - timedelta(days=2))
+    assert cache.get('k') is None
+    assert cache.evict() == 1